@@ -0,0 +1,51 @@
+"""
+Benchmark: recall and latency of the IVF index (vector_index.py) against exact brute-force search.
+Uses synthetic clustered embeddings, since real postings form topic clusters rather than uniform noise.
+Run from main_project/src: python benchmarks/bench_ann.py [num_postings] [dim]
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "data_processing"))
+
+from vector_index import IVFIndex
+
+def make_embeddings(count, dim, clusters=300, noise=0.6, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((clusters, dim)).astype(np.float32)
+    labels = rng.integers(0, clusters, count)
+    return (centers[labels] + noise * rng.standard_normal((count, dim))).astype(np.float32), rng
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    dim = int(sys.argv[2]) if len(sys.argv) > 2 else 1536
+    vectors, rng = make_embeddings(count, dim)
+
+    index = IVFIndex(dim)
+    start = time.perf_counter()
+    for offset in range(0, count, 5000):  # incremental inserts, as successive runs would do
+        index.add(range(offset, min(offset + 5000, count)), vectors[offset:offset + 5000])
+    build_time = time.perf_counter() - start
+
+    queries = vectors[rng.choice(count, 100, replace=False)] + 0.3 * rng.standard_normal((100, dim)).astype(np.float32)
+    k = 10
+
+    start = time.perf_counter()
+    exact = [{job_id for job_id, _, _ in index.search(q, k, exact=True)} for q in queries]
+    exact_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+    print(f"Postings: {count}, dim: {dim}, lists: {len(index.centroids)}, build: {build_time:.1f}s")
+    print(f"{'search':<14}{'recall@10':>10}{'ms/query':>10}")
+    print(f"{'exact':<14}{1.0:>10.3f}{exact_ms:>10.2f}")
+    for nprobe in (1, 2, 4, 8, 16, 32):
+        start = time.perf_counter()
+        approx = [{job_id for job_id, _, _ in index.search(q, k, nprobe=nprobe)} for q in queries]
+        elapsed_ms = (time.perf_counter() - start) * 1000 / len(queries)
+        recall = np.mean([len(a & e) / k for a, e in zip(approx, exact)])
+        print(f"{'nprobe=' + str(nprobe):<14}{recall:>10.3f}{elapsed_ms:>10.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark: per-posting extract_salary/extract_experience_level vs batch_extraction over a pandas Series.
+The per-posting functions return the matched text; the batch path also parses it into typed columns.
+Run from main_project/src: python benchmarks/bench_batch_extraction.py [num_postings]
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "data_processing"))
+
+from data_extraction import SAMPLE_JOB_DESCRIPTIONS, extract_experience_level, extract_salary, extract_sections
+from batch_extraction import extract_batch
+
+SALARY_LINES = [
+    "The base salary range for this role is $163K - $204K per year.",
+    "Pay: $120,000 - 150,000 USD annually",
+    "Compensation: 95k - 130k plus equity",
+    "$45 - $60/hr depending on experience",
+    "CAD $90,000 - $110,000",
+    "CA$90,000 - CA$110,000",
+    "C$95,000 to C$120,000 per year",
+    "",
+]
+
+# Canadian ranges, with the currency before the "$" or repeated on the upper end: (min, max, currency)
+CAD_LINES = {
+    "CAD $90,000 - $110,000": (90000, 110000, "CAD"),
+    "CA$90,000 - CA$110,000": (90000, 110000, "CAD"),
+    "C$95,000 to C$120,000 per year": (95000, 120000, "CAD"),
+}
+
+# Currency amounts that are not salaries; extract_batch must leave these rows empty
+NOT_SALARY_LINES = [
+    "We offer $5 coffee every morning.",
+    "The team manages $10 million revenue.",
+    "You will own a $1.5M budget.",
+]
+
+def make_descriptions(count, seed=0):
+    rng = random.Random(seed)
+    return [rng.choice(SAMPLE_JOB_DESCRIPTIONS) + "\n" + rng.choice(SALARY_LINES) for _ in range(count)]
+
+def main():
+    num_postings = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    descriptions = make_descriptions(num_postings)
+
+    start = time.perf_counter()
+    per_posting = [(extract_salary(text), extract_experience_level(extract_sections(text))) for text in descriptions]
+    per_posting_time = time.perf_counter() - start
+
+    # extract_sections is part of the per-posting cost, so time the scalar extractors on their own as well
+    sections = [extract_sections(text) for text in descriptions]
+    start = time.perf_counter()
+    for text, text_sections in zip(descriptions, sections):
+        extract_salary(text)
+        extract_experience_level(text_sections)
+    scalar_time = time.perf_counter() - start
+
+    series = pd.Series(descriptions)
+    start = time.perf_counter()
+    columns = extract_batch(series)
+    batch_time = time.perf_counter() - start
+
+    found = sum(salary != "Not specified" for salary, _ in per_posting)
+    print(f"{num_postings} postings")
+    print(f"  per posting (with extract_sections): {per_posting_time:.3f}s")
+    print(f"  per posting (extractors only):       {scalar_time:.3f}s")
+    print(f"  extract_batch (typed columns):       {batch_time:.3f}s ({per_posting_time / batch_time:.1f}x)")
+    print(f"  salaries found: {found} per posting, {int(columns['salary_min'].notna().sum())} batch")
+    print(f"  experience found: {sum(level != 'Not specified' for _, level in per_posting)} per posting, "
+          f"{int(columns['experience_min_years'].notna().sum())} batch")
+    print(columns.head().to_string())
+
+    sanity = extract_batch(pd.Series(SALARY_LINES + NOT_SALARY_LINES))
+    print("\nSanity check:")
+    print(sanity[["salary_min", "salary_max", "salary_currency", "salary_period"]]
+          .assign(text=SALARY_LINES + NOT_SALARY_LINES).to_string())
+    wrong = sanity["salary_min"].iloc[len(SALARY_LINES):].notna().sum()
+    if wrong:
+        print(f"  {wrong} non-salary amount(s) extracted as salaries")
+    cad = extract_batch(pd.Series(list(CAD_LINES)))
+    misparsed = [text for (text, expected), row in zip(CAD_LINES.items(), cad.itertuples())
+                 if (row.salary_min, row.salary_max, row.salary_currency) != expected]
+    if misparsed:
+        print(f"  misparsed Canadian salaries: {misparsed}")
+    if wrong or misparsed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
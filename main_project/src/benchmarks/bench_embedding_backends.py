@@ -0,0 +1,52 @@
+"""
+Benchmark: CPU throughput of the local embedding backend for several batch sizes.
+Needs torch and transformers (and the model files, downloaded on first use unless --offline).
+Run from main_project/src: python benchmarks/bench_embedding_backends.py [--model NAME] [--texts N] [--offline]
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "data_processing"))
+
+from data_extraction import SAMPLE_JOB_DESCRIPTIONS
+from embedding_backends import DEFAULT_LOCAL_MODEL, LocalTransformerBackend
+
+def make_texts(count, seed=0):
+    """Postings of varied length cut from the sample descriptions"""
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(count):
+        sample = rng.choice(SAMPLE_JOB_DESCRIPTIONS)
+        texts.append(sample[:rng.randint(200, len(sample))])
+    return texts
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--model", default=DEFAULT_LOCAL_MODEL)
+    parser.add_argument("--texts", type=int, default=256)
+    parser.add_argument("--batch-sizes", default="1,4,8,16,32,64")
+    parser.add_argument("--offline", action="store_true")
+    args = parser.parse_args()
+
+    texts = make_texts(args.texts)
+    backend = LocalTransformerBackend(args.model, local_files_only=args.offline)
+    start = time.perf_counter()
+    backend.load()
+    print(f"Model: {args.model} (loaded in {time.perf_counter() - start:.1f}s), {len(texts)} texts")
+
+    backend.batch_size = 8
+    backend.embed(texts[:8])  # warm-up
+
+    print(f"{'batch size':>10}{'seconds':>10}{'texts/s':>10}")
+    for batch_size in (int(size) for size in args.batch_sizes.split(",")):
+        backend.batch_size = batch_size
+        start = time.perf_counter()
+        backend.embed(texts)
+        elapsed = time.perf_counter() - start
+        print(f"{batch_size:>10}{elapsed:>10.2f}{len(texts) / elapsed:>10.1f}")
+
+if __name__ == "__main__":
+    main()
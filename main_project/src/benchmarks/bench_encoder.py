@@ -0,0 +1,111 @@
+"""
+Benchmark: latency and memory of the BigBird encoder path before and after the encoder service changes.
+  fixed-fp32:   the old main.py path (padding="max_length", fp32)
+  dynamic-fp32: EncoderService (length-sorted batches, dynamic padding)
+  dynamic-int8: EncoderService with int8 dynamic quantization
+Each configuration runs in a fresh interpreter so peak RSS is comparable.
+Run from main_project/src: python benchmarks/bench_encoder.py [--model NAME] [--texts N] [--offline]
+"""
+import argparse
+import json
+import random
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "data_processing"))
+
+CONFIGS = ["fixed-fp32", "dynamic-fp32", "dynamic-int8"]
+
+def make_texts(count, seed=0):
+    from data_extraction import SAMPLE_JOB_DESCRIPTIONS
+    rng = random.Random(seed)
+    return [rng.choice(SAMPLE_JOB_DESCRIPTIONS)[:rng.randint(300, 2500)] for _ in range(count)]
+
+def run_config(config, model, count, batch_size, max_length, offline):
+    """Encode the texts with one configuration and return its numbers (runs in the child process)"""
+    import torch
+    texts = make_texts(count)
+    start = time.perf_counter()
+    if config == "fixed-fp32":
+        from transformers import AutoModel, AutoTokenizer
+        tokenizer = AutoTokenizer.from_pretrained(model, local_files_only=offline)
+        encoder = AutoModel.from_pretrained(model, local_files_only=offline).eval()
+        max_length = min(max_length, encoder.config.max_position_embeddings)
+        load_time = time.perf_counter() - start
+
+        def embed(batch):
+            with torch.no_grad():
+                inputs = tokenizer(batch, return_tensors="pt", max_length=max_length, truncation=True, padding="max_length")
+                hidden = encoder(**inputs).last_hidden_state
+                mask = inputs["attention_mask"].unsqueeze(-1).to(hidden.dtype)
+                return list(((hidden * mask).sum(1) / mask.sum(1)).numpy())
+    else:
+        from encoder_service import EncoderService
+        service = EncoderService(model, batch_size=batch_size, max_length=max_length, local_files_only=offline,
+                                 quantize=config.endswith("int8")).start()
+        load_time = time.perf_counter() - start
+        embed = service.embed
+
+    embed(texts[:batch_size])  # warm-up
+    start = time.perf_counter()
+    embeddings = []
+    for offset in range(0, len(texts), batch_size):
+        embeddings.extend(embed(texts[offset:offset + batch_size]))
+    elapsed = time.perf_counter() - start
+    return {
+        "config": config,
+        "load_s": load_time,
+        "ms_per_text": elapsed * 1000 / len(texts),
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "embeddings": [[float(x) for x in e] for e in embeddings],
+    }
+
+def cosine(a, b):
+    import numpy as np
+    a, b = np.asarray(a), np.asarray(b)
+    return float(a @ b / (np.linalg.norm(a) * np.linalg.norm(b)))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--model", default="google/bigbird-roberta-base")
+    parser.add_argument("--texts", type=int, default=32)
+    parser.add_argument("--batch-size", type=int, default=4)
+    parser.add_argument("--max-length", type=int, default=4096)
+    parser.add_argument("--offline", action="store_true")
+    parser.add_argument("--config", choices=CONFIGS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.config:
+        print(json.dumps(run_config(args.config, args.model, args.texts, args.batch_size, args.max_length, args.offline)))
+        return
+
+    results = {}
+    for config in CONFIGS:
+        command = [sys.executable, __file__, "--config", config, "--model", args.model, "--texts", str(args.texts),
+                   "--batch-size", str(args.batch_size), "--max-length", str(args.max_length)]
+        if args.offline:
+            command.append("--offline")
+        completed = subprocess.run(command, capture_output=True, text=True)
+        if completed.returncode < 0:
+            # Usually the OOM killer: fixed-fp32 pads every text to max_length, so try a smaller --batch-size
+            print(f"{config}: killed by signal {-completed.returncode} (out of memory?)")
+            continue
+        if completed.returncode != 0:
+            print(f"{config}: failed\n{completed.stderr.strip()[-2000:]}")
+            continue
+        results[config] = json.loads(completed.stdout.strip().splitlines()[-1])
+
+    print(f"Model: {args.model}, {args.texts} texts, batch size {args.batch_size}, max length {args.max_length}")
+    print(f"{'config':<14}{'load (s)':>10}{'ms/text':>10}{'peak RSS (MB)':>15}{'cos vs fp32':>13}")
+    reference = results.get("dynamic-fp32")
+    for config, stats in results.items():
+        agreement = "-"
+        if reference and config != "dynamic-fp32":
+            agreement = f"{min(cosine(a, b) for a, b in zip(stats['embeddings'], reference['embeddings'])):.4f}"
+        print(f"{config:<14}{stats['load_s']:>10.2f}{stats['ms_per_text']:>10.1f}{stats['peak_rss_mb']:>15.1f}{agreement:>13}")
+
+if __name__ == "__main__":
+    main()
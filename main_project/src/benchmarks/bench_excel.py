@@ -0,0 +1,101 @@
+"""
+Benchmark: Excel export time and peak memory, old pandas path vs excel_export.write_excel.
+  pandas:    the old export_results block (df.to_excel, per-column astype(str) widths, write_url loop)
+  streaming: write_excel in constant_memory mode from a generator of records
+Each path runs in a fresh interpreter so peak RSS is comparable.
+Run from main_project/src: python benchmarks/bench_excel.py [--rows N]
+"""
+import argparse
+import json
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "data_processing"))
+
+PATHS = ["pandas", "streaming"]
+SKILLS = ["Python", "Java", "SQL", "AWS", "Docker", "Kubernetes", "React", "Go", "C++", "Machine Learning"]
+
+def make_records(count, seed=0):
+    """Records shaped like build_job_record output (without Job ID), generated lazily"""
+    rng = random.Random(seed)
+    for i in range(count):
+        yield {
+            "Listed Date": f"2026-{rng.randint(1, 12):02d}-{rng.randint(10, 28)} 09:30",
+            "Job Title": rng.choice(["Software Engineer", "Backend Developer", "Data Engineer II"]),
+            "Company": f"Company {rng.randint(1, 5000)}",
+            "Location": rng.choice(["United States", "New York, NY", "Austin, TX"]),
+            "Workplace Type": rng.choice(["Remote", "Hybrid", "N/A"]),
+            "Skills": rng.sample(SKILLS, rng.randint(1, 6)),
+            "Experience Level": rng.choice(["3+ years", "2-4 years experience", "Not specified"]),
+            "Apply URL": f"https://jobs.example.com/apply/{i}?src=linkedin" if rng.random() < 0.9 else "N/A",
+            "Salary": rng.choice(["Not specified", "$120,000 - $150,000"]),
+        }
+
+def export_pandas(records, path):
+    """The old export_results Excel block"""
+    import pandas as pd
+    df = pd.DataFrame(list(records))
+    writer = pd.ExcelWriter(path, engine="xlsxwriter")
+    df.to_excel(writer, index=False)
+    workbook = writer.book
+    worksheet = writer.sheets["Sheet1"]
+    for idx, col in enumerate(df.columns):
+        max_length = max(df[col].astype(str).apply(len).max(), len(str(col)))
+        worksheet.set_column(idx, idx, max_length + 2)
+    link_format = workbook.add_format({"font_color": "blue", "underline": True})
+    url_col = df.columns.get_loc("Apply URL")
+    for row_num, url in enumerate(df["Apply URL"], start=1):
+        if url != "N/A":
+            worksheet.write_url(row_num, url_col, url, link_format, url)
+    writer.close()
+
+def run_path(name, rows):
+    """Export the records with one path and return its numbers (runs in the child process)"""
+    from excel_export import write_excel
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "job_data.xlsx"
+        start_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        start = time.perf_counter()
+        if name == "pandas":
+            export_pandas(make_records(rows), path)
+        else:
+            write_excel(make_records(rows), path)
+        elapsed = time.perf_counter() - start
+        size = path.stat().st_size
+    return {
+        "path": name,
+        "seconds": elapsed,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "start_rss_mb": start_rss,
+        "file_mb": size / 1e6,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--path", choices=PATHS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.path:
+        print(json.dumps(run_path(args.path, args.rows)))
+        return
+
+    print(f"{args.rows} rows")
+    print(f"{'path':<12}{'time (s)':>10}{'peak RSS (MB)':>15}{'growth (MB)':>13}{'file (MB)':>11}")
+    for name in PATHS:
+        completed = subprocess.run([sys.executable, __file__, "--path", name, "--rows", str(args.rows)],
+                                   capture_output=True, text=True)
+        if completed.returncode != 0:
+            print(f"{name}: failed\n{completed.stderr.strip()[-2000:]}")
+            continue
+        stats = json.loads(completed.stdout.strip().splitlines()[-1])
+        print(f"{name:<12}{stats['seconds']:>10.2f}{stats['peak_rss_mb']:>15.1f}"
+              f"{stats['peak_rss_mb'] - stats['start_rss_mb']:>13.1f}{stats['file_mb']:>11.2f}")
+
+if __name__ == "__main__":
+    main()
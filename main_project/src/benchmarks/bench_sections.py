@@ -0,0 +1,98 @@
+"""
+Regression check and benchmark for section segmentation (SectionSegmenter / extract_sections).
+Checks the segmentation, skills and experience level of the sample descriptions in data_extraction
+against benchmarks/fixtures/sections.json, then times the old line-by-line splitter against the
+compiled segmenter.
+Run from main_project/src: python benchmarks/bench_sections.py [num_postings] [--update-fixtures]
+"""
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "data_processing"))
+
+from data_extraction import (PREFERRED_HEADERS, QUALIFICATIONS_HEADERS, RESPONSIBILITIES_HEADERS,
+                             SAMPLE_JOB_DESCRIPTIONS, SECTION_SEGMENTER, extract_experience_level,
+                             extract_sections, extract_skills)
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures" / "sections.json"
+
+def extract_sections_lines(text):
+    """Previous implementation: a substring test of every header against every line"""
+    sections = {}
+    headers = [header.lower() for header in RESPONSIBILITIES_HEADERS + QUALIFICATIONS_HEADERS + PREFERRED_HEADERS]
+    current_section = None
+
+    for line in text.split("\n"):
+        line = line.strip()
+        if not line:
+            continue
+        if any(header in line.lower() for header in headers):
+            current_section = line.lower()
+            sections[current_section] = []
+            sections[current_section].append(line)
+        elif current_section:
+            sections[current_section].append(line)
+
+    return sections
+
+def describe(text):
+    """Fixture entry for one description"""
+    sections = extract_sections(text)
+    return {
+        "sections": [list(section) for section in SECTION_SEGMENTER.segment(text)],
+        "skills": sorted(extract_skills(sections)),
+        "experience_level": extract_experience_level(sections),
+    }
+
+def check_fixtures(update):
+    actual = [describe(text) for text in SAMPLE_JOB_DESCRIPTIONS]
+    if update:
+        FIXTURES.write_text(json.dumps(actual, indent=4) + "\n", encoding="utf-8")
+        print(f"Fixtures written to {FIXTURES}")
+        return True
+    expected = json.loads(FIXTURES.read_text(encoding="utf-8"))
+    ok = True
+    for i, (want, got) in enumerate(zip(expected, actual), start=1):
+        if want != got:
+            print(f"Sample {i} differs from fixture:\n  expected {want}\n  got      {got}")
+            ok = False
+    if len(expected) != len(actual):
+        print(f"Fixture has {len(expected)} samples, data_extraction has {len(actual)}")
+        ok = False
+    print("Fixtures: OK" if ok else "Fixtures: FAILED")
+    return ok
+
+def timed(func, texts):
+    start = time.perf_counter()
+    for text in texts:
+        func(text)
+    return time.perf_counter() - start
+
+def main():
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    ok = check_fixtures("--update-fixtures" in sys.argv)
+
+    count = int(args[0]) if args else 3000
+    # Short sample postings (mostly run-together) and a longer posting with one item per line
+    long_posting = "\n".join(SAMPLE_JOB_DESCRIPTIONS[0].replace(". ", ".\n") for _ in range(6))
+    workloads = {
+        "sample descriptions": [SAMPLE_JOB_DESCRIPTIONS[i % len(SAMPLE_JOB_DESCRIPTIONS)] for i in range(count)],
+        "long multi-line postings": [long_posting] * count,
+    }
+
+    for name, texts in workloads.items():
+        old_time = timed(extract_sections_lines, texts)
+        segment_time = timed(SECTION_SEGMENTER.segment, texts)
+        new_time = timed(extract_sections, texts)
+
+        print(f"{name} ({count} postings)")
+        print(f"  Line-by-line extract_sections:  {old_time:.3f}s")
+        print(f"  SectionSegmenter.segment:       {segment_time:.3f}s ({old_time / segment_time:.1f}x)")
+        print(f"  extract_sections (with lines):  {new_time:.3f}s ({old_time / new_time:.1f}x)")
+    if not ok:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
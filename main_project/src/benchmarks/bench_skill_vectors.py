@@ -0,0 +1,70 @@
+"""
+Benchmark: skill analytics over a SkillMatrix vs the same questions answered from lists of skill names.
+Questions: resume overlap (>= 3 matching skills), filter by required skills, top co-occurring pairs, weekly demand.
+Run from main_project/src: python benchmarks/bench_skill_vectors.py [num_postings]
+"""
+import random
+import sys
+import time
+from collections import Counter
+from datetime import date, timedelta
+from itertools import combinations
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "data_processing"))
+
+from skill_vectors import SKILL_VOCABULARY, SkillMatrix
+
+RESUME_SKILLS = ["Python", "SQL", "AWS", "Docker", "React", "Django", "PostgreSQL"]
+
+def make_records(count, seed=0):
+    """Records with a Zipf-like skill mix over a year of listing dates"""
+    rng = random.Random(seed)
+    weights = [1 / (rank + 1) for rank in range(len(SKILL_VOCABULARY))]
+    start = date(2026, 1, 1)
+    return [{
+        "Job ID": str(i),
+        "Listed Date": (start + timedelta(days=rng.randrange(365))).strftime("%Y-%m-%d") + " 09:00",
+        "Skills": list(set(rng.choices(SKILL_VOCABULARY, weights, k=rng.randint(2, 10)))),
+    } for i in range(count)]
+
+def timed(label, run, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = run()
+        best = min(best, time.perf_counter() - start)
+    print(f"  {label:<34}{best * 1000:>10.1f} ms")
+    return result, best
+
+def main():
+    num_postings = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    records = make_records(num_postings)
+    resume = {skill.lower() for skill in RESUME_SKILLS}
+
+    start = time.perf_counter()
+    skills = SkillMatrix.from_records(records)
+    print(f"{num_postings} postings, {len(SKILL_VOCABULARY)} skills: encoded in {time.perf_counter() - start:.2f}s, "
+          f"{skills.pack().nbytes / 1e6:.1f} MB packed")
+
+    print("lists of skill names")
+    list_overlap, _ = timed("overlap >= 3", lambda: [i for i, r in enumerate(records)
+                                                     if sum(s.lower() in resume for s in r["Skills"]) >= 3], repeat=1)
+    timed("has Python and AWS", lambda: [r for r in records if {"Python", "AWS"} <= set(r["Skills"])], repeat=1)
+    list_pairs, _ = timed("co-occurring pairs", lambda: Counter(
+        pair for r in records for pair in combinations(sorted(r["Skills"]), 2)).most_common(10), repeat=1)
+    timed("weekly demand", lambda: Counter(
+        (date.fromisoformat(r["Listed Date"][:10]).isocalendar()[:2], s) for r in records for s in r["Skills"]), repeat=1)
+
+    print("SkillMatrix")
+    matrix_overlap, _ = timed("overlap >= 3", lambda: skills.filter(resume_skills=RESUME_SKILLS, min_overlap=3))
+    timed("has Python and AWS", lambda: skills.filter(all_of=["Python", "AWS"]))
+    matrix_pairs, _ = timed("co-occurring pairs", lambda: skills.top_pairs(10))
+    timed("weekly demand", skills.weekly_counts)
+
+    assert list_overlap == list(matrix_overlap.nonzero()[0])
+    assert sorted(count for _, count in list_pairs) == sorted(count for _, _, count in matrix_pairs)
+    print("Results match")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark: single-pass SkillMatcher vs the per-skill re.search loop in extract_skills.
+Run from main_project/src: python benchmarks/bench_skills.py [num_postings]
+"""
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "data_processing"))
+
+from data_extraction import TECHNICAL_SKILLS_KEYWORDS, extract_skills
+
+FILLER = ["Build", "scalable", "services", "with", "the", "team", "and", "ship", "features", "using",
+          "modern", "tools", "experience", "in", "years", "of", "strong", "communication", "skills"]
+
+def make_postings(count, seed=0):
+    """Synthetic postings: a few sections of filler text sprinkled with skills"""
+    rng = random.Random(seed)
+    postings = []
+    for _ in range(count):
+        sections = {}
+        for name in ("responsibilities:", "qualifications:", "preferred qualifications:"):
+            lines = []
+            for _ in range(rng.randint(3, 8)):
+                words = rng.choices(FILLER, k=rng.randint(8, 20)) + rng.sample(TECHNICAL_SKILLS_KEYWORDS, rng.randint(0, 4))
+                rng.shuffle(words)
+                lines.append(" ".join(words) + ".")
+            sections[name] = lines
+        postings.append(sections)
+    return postings
+
+def extract_skills_loop(sections):
+    """Previous implementation: one re.search per (line, skill)"""
+    extracted_skills = set()
+    for section_name, text_lines in sections.items():
+        for sentence in text_lines:
+            for skill in TECHNICAL_SKILLS_KEYWORDS:
+                if re.search(rf"\b{re.escape(skill)}\b", sentence, re.IGNORECASE):
+                    extracted_skills.add(skill)
+    return list(extracted_skills)
+
+def timed(func, postings):
+    start = time.perf_counter()
+    results = [set(func(sections)) for sections in postings]
+    return time.perf_counter() - start, results
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    postings = make_postings(count)
+
+    loop_time, loop_results = timed(extract_skills_loop, postings)
+    matcher_time, matcher_results = timed(extract_skills, postings)
+
+    if loop_results != matcher_results:
+        print("Mismatch between SkillMatcher and the per-skill loop")
+        sys.exit(1)
+
+    print(f"Postings:        {count}")
+    print(f"Per-skill loop:  {loop_time:.3f}s ({count / loop_time:.0f} postings/s)")
+    print(f"SkillMatcher:    {matcher_time:.3f}s ({count / matcher_time:.0f} postings/s)")
+    print(f"Speedup:         {loop_time / matcher_time:.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Startup benchmark: import time and peak memory of each entry point, in a fresh interpreter.
+Fails (exit code 1) if an entry point cannot be imported, a heavy dependency is imported at startup
+or an import exceeds --max-seconds.
+Run from main_project/src: python benchmarks/bench_startup.py [--max-seconds 3]
+"""
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+DATA_PROCESSING = Path(__file__).resolve().parents[1] / "data_processing"
+
+ENTRY_POINTS = ["data_extraction", "job_search", "job_search_embedding"]
+
+# Modules that must only be imported on first use
+HEAVY_MODULES = ["spacy", "transformers", "torch", "sklearn"]
+
+CHILD_CODE = """
+import json, resource, sys, time
+sys.path.insert(0, {path!r})
+start = time.perf_counter()
+{import_line}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": elapsed,
+    "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "heavy_loaded": [m for m in {heavy!r} if m in sys.modules],
+}}))
+"""
+
+def measure(module):
+    """Import module in a fresh interpreter and return its timing and memory numbers"""
+    import_line = f"import {module}" if module else "pass"
+    code = CHILD_CODE.format(path=str(DATA_PROCESSING), import_line=import_line, heavy=HEAVY_MODULES)
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    if result.returncode != 0:
+        return {"error": result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "import failed"}
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--max-seconds", type=float, default=3.0, help="fail if any import takes longer")
+    args = parser.parse_args()
+
+    baseline = measure(None)
+    print(f"{'entry point':<24}{'import (s)':>12}{'peak RSS (MB)':>16}  heavy modules loaded")
+    print(f"{'(bare interpreter)':<24}{baseline['seconds']:>12.3f}{baseline['peak_rss_mb']:>16.1f}")
+
+    failed = False
+    for module in ENTRY_POINTS:
+        stats = measure(module)
+        if "error" in stats:
+            # An entry point that cannot be imported cannot be checked, so the guard does not pass
+            print(f"{module:<24}  could not import: {stats['error']}")
+            failed = True
+            continue
+        heavy = ", ".join(stats["heavy_loaded"]) or "-"
+        print(f"{module:<24}{stats['seconds']:>12.3f}{stats['peak_rss_mb']:>16.1f}  {heavy}")
+        if stats["heavy_loaded"] or stats["seconds"] > args.max_seconds:
+            failed = True
+
+    if failed:
+        print("Startup regression: an entry point failed to import, imported heavy modules eagerly or imported too slowly")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
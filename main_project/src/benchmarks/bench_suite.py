@@ -0,0 +1,210 @@
+"""
+Offline benchmark suite: the end-to-end job_search pipeline against FakeLinkedin, the end-to-end
+job_search_embedding run against FakeLinkedin and FakeOpenAI, LLM match scoring against FakeAsyncOpenAI,
+plus the hot functions (extract_sections, extract_skills, extract_salary, similarity ranking, Excel export),
+at several sizes. No LinkedIn/OpenAI package or network access is needed.
+Results are compared with a stored baseline; a benchmark slower than baseline * (1 + tolerance) is a regression
+and makes the run exit with code 1. Baselines are machine specific: save one before changing code.
+Run from main_project/src:
+  python benchmarks/bench_suite.py [--sizes 100,10000,100000] [--save-baseline] [--tolerance 0.3]
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "data_processing"))
+
+from fakes import FakeAsyncOpenAI, FakeLinkedin, FakeOpenAI, load_payloads
+
+BASELINE_PATH = Path(__file__).resolve().parent / "fixtures" / "bench_baseline.json"
+# Differences below this many seconds are noise, whatever the ratio
+NOISE_FLOOR = 0.02
+
+def make_descriptions(count, seed=0):
+    """Recorded descriptions, each with a distinct requisition line"""
+    payloads = load_payloads()
+    rng = random.Random(seed)
+    return [payloads[rng.randrange(len(payloads))]["description"]["text"] + f"\n\nRequisition: {i}" for i in range(count)]
+
+def make_records(count, seed=0):
+    """Output records shaped like build_job_record's, for the export benchmark"""
+    records = json.loads((Path(__file__).resolve().parents[2] / "output" / "job_data.json").read_text(encoding="utf-8"))
+    rng = random.Random(seed)
+    return [dict(rng.choice(records), **{"Job Title": f"Engineer #{i}"}) for i in range(count)]
+
+def bench_extract_sections(size):
+    from data_extraction import extract_sections
+    descriptions = make_descriptions(size)
+    return lambda: [extract_sections(text) for text in descriptions]
+
+def bench_extract_skills(size):
+    from data_extraction import extract_sections, extract_skills
+    sections = [extract_sections(text) for text in make_descriptions(size)]
+    return lambda: [extract_skills(s) for s in sections]
+
+def bench_extract_salary(size):
+    from data_extraction import extract_salary
+    descriptions = make_descriptions(size)
+    return lambda: [extract_salary(text) for text in descriptions]
+
+def bench_similarity(size, dim=384):
+    from ranking import build_job_matrix, score_jobs, top_k
+    rng = np.random.default_rng(0)
+    jobs = list(rng.standard_normal((size, dim)).astype(np.float32))
+    resume = rng.standard_normal(dim).astype(np.float32)
+    return lambda: top_k(score_jobs(build_job_matrix(jobs, dim=dim), resume), 50)
+
+def bench_export(size):
+    from excel_export import write_excel
+    records = make_records(size)
+    directory = tempfile.mkdtemp()
+    return lambda: write_excel(records, Path(directory) / "job_data.xlsx")
+
+def bench_end_to_end(size, latency=0.0, error_rate=0.0, throttle_rate=0.0):
+    """search -> dedupe -> fetch -> process -> JSONL -> results store -> JSON/Excel export, against FakeLinkedin"""
+    from api_scheduler import ScheduledLinkedin
+    from dedupe import JobDeduplicator
+    from job_search import JobSearch, build_job_record, export_results
+    from pipeline import dedupe_stage, fetch_stage, jsonl_sink, near_duplicate_stage, process_stage, read_jsonl, search_stage
+    from results_store import ResultsStore
+
+    def run():
+        fake = FakeLinkedin(size, latency=latency, error_rate=error_rate, throttle_rate=throttle_rate)
+        api = ScheduledLinkedin(fake, rate=1e6, burst=1000, workers=8, backoff=0.01, max_backoff=0.1)
+        job_search = JobSearch(api=api)
+        with tempfile.TemporaryDirectory() as directory, open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            output_dir = Path(directory)
+            deduplicator = JobDeduplicator()
+            jobs = search_stage(job_search, [{"keywords": "Software Engineer", "limit": size}])
+            details = near_duplicate_stage(fetch_stage(job_search, dedupe_stage(jobs, deduplicator)), deduplicator)
+            jsonl_sink(process_stage(details, build_job_record), output_dir / "job_data.jsonl")
+            store = ResultsStore(output_dir / "job_results.db")
+            store.add_many(read_jsonl(output_dir / "job_data.jsonl"), run_id="bench")
+            export_results([{k: v for k, v in r.items() if k != "Job ID"} for r in store.query()], output_dir)
+            store.close()
+        api.close()
+    return run
+
+def bench_end_to_end_embedding(size, latency=0.0, error_rate=0.0, throttle_rate=0.0, dim=64):
+    """search -> fetch -> embed (batched, cached) -> job index -> ranking -> Excel, against FakeLinkedin and FakeOpenAI"""
+    from api_scheduler import ScheduledLinkedin
+    from job_search_embedding import JobSearch, run_embedding_search
+    from openai_embeddings import OpenAIEmbeddingBackend
+    resume = {"name": "bench", "text": make_descriptions(1, seed=1)[0]}
+
+    def run():
+        fake = FakeLinkedin(size, latency=latency, error_rate=error_rate, throttle_rate=throttle_rate)
+        api = ScheduledLinkedin(fake, rate=1e6, burst=1000, workers=8, backoff=0.01, max_backoff=0.1)
+        # A small dimension keeps 100k fake vectors in memory; the API cost being replayed does not depend on it
+        backend = OpenAIEmbeddingBackend(embedding_client=FakeOpenAI(dim=dim, latency=latency, error_rate=error_rate,
+                                                                     throttle_rate=throttle_rate))
+        with tempfile.TemporaryDirectory() as directory, open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            run_embedding_search(JobSearch(api=api), backend, [resume], {"keywords": "Software Engineer", "limit": size},
+                                 directory, cache_root=Path(directory) / "cache")
+        api.close()
+    return run
+
+def bench_llm_match(size, latency=0.0, error_rate=0.0, throttle_rate=0.0):
+    """MatchScorer over size distinct descriptions (cold cache), against FakeAsyncOpenAI"""
+    from llm_scoring import MatchCache, MatchScorer
+    descriptions = make_descriptions(size)
+    resume_text = make_descriptions(1, seed=1)[0]
+
+    def run():
+        client = FakeAsyncOpenAI(latency=latency, error_rate=error_rate, throttle_rate=throttle_rate)
+        with tempfile.TemporaryDirectory() as directory, open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            cache = MatchCache(Path(directory) / "llm_matches.db")
+            MatchScorer(client=client, cache=cache, concurrency=32, retries=2, backoff=0.01).score_many(resume_text, descriptions)
+            cache.close()
+    return run
+
+# Benchmarks replaying the fake API clients, which take the --latency/--error-rate/--throttle-rate options
+FAKE_API_BENCHMARKS = {"end_to_end", "end_to_end_embedding", "llm_match"}
+
+BENCHMARKS = {
+    "end_to_end": bench_end_to_end,
+    "end_to_end_embedding": bench_end_to_end_embedding,
+    "llm_match": bench_llm_match,
+    "extract_sections": bench_extract_sections,
+    "extract_skills": bench_extract_skills,
+    "extract_salary": bench_extract_salary,
+    "similarity": bench_similarity,
+    "export_excel": bench_export,
+}
+
+def time_best(run, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="100,10000,100000", help="comma-separated posting counts")
+    parser.add_argument("--only", default=None, help=f"comma-separated subset of: {', '.join(BENCHMARKS)}")
+    parser.add_argument("--repeat", type=int, default=3, help="best of this many runs (sizes over 10k run once)")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to each fake API call")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of fake API calls failing with 503")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="share of fake API calls failing with 429")
+    parser.add_argument("--baseline", default=str(BASELINE_PATH))
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.3, help="allowed slowdown before reporting a regression")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    names = args.only.split(",") if args.only else list(BENCHMARKS)
+    baseline_path = Path(args.baseline)
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))["results"] if baseline_path.exists() else {}
+
+    results = {}
+    regressions = []
+    print(f"{'benchmark':<30}{'seconds':>10}{'baseline':>10}{'ratio':>8}")
+    for size in sizes:
+        for name in names:
+            key = f"{name}@{size}"
+            options = {"latency": args.latency, "error_rate": args.error_rate,
+                       "throttle_rate": args.throttle_rate} if name in FAKE_API_BENCHMARKS else {}
+            try:
+                run = BENCHMARKS[name](size, **options)
+            except ImportError as e:
+                print(f"{key:<30}{'skipped: ' + str(e):>10}")
+                continue
+            seconds = time_best(run, args.repeat if size <= 10000 else 1)
+            results[key] = round(seconds, 4)
+            previous = baseline.get(key)
+            if previous is None:
+                print(f"{key:<30}{seconds:>10.3f}{'-':>10}{'-':>8}")
+                continue
+            ratio = seconds / previous if previous else float("inf")
+            regressed = ratio > 1 + args.tolerance and seconds - previous > NOISE_FLOOR
+            if regressed:
+                regressions.append(key)
+            print(f"{key:<30}{seconds:>10.3f}{previous:>10.3f}{ratio:>7.2f}x{'  REGRESSION' if regressed else ''}")
+
+    if args.save_baseline:
+        # Keep baseline entries for benchmarks not run this time
+        merged = dict(baseline, **results)
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps({
+            "machine": f"{platform.machine()} {platform.processor() or ''} Python {platform.python_version()}".strip(),
+            "saved_at": time.strftime("%Y-%m-%d %H:%M"),
+            "results": merged,
+        }, indent=4), encoding="utf-8")
+        print(f"Baseline saved to {baseline_path}")
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
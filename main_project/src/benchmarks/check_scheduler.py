@@ -0,0 +1,116 @@
+"""
+Offline checks of api_scheduler.ScheduledLinkedin against scripted fake LinkedIn failures:
+429 backoff and rate halving, 503 retries, the circuit breaker opening, and recovery through its trial call
+(including a trial call that fails with a non-retryable error). Exits with code 1 if any check fails.
+Run from main_project/src: python benchmarks/check_scheduler.py
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "data_processing"))
+
+from api_scheduler import CircuitOpenError, ScheduledLinkedin
+from fakes import FakeHTTPError, FakeLinkedin
+
+class ScriptedLinkedin(FakeLinkedin):
+    """FakeLinkedin whose get_job calls first raise the scripted errors, in order, then succeed"""
+    def __init__(self, errors, **kwargs):
+        super().__init__(10, **kwargs)
+        self.errors = list(errors)
+
+    def get_job(self, job_id):
+        if self.errors:
+            self.get_job_calls += 1
+            raise self.errors.pop(0)
+        return super().get_job(job_id)
+
+def scheduler(client, **kwargs):
+    options = dict(rate=1000, burst=100, workers=1, backoff=0.01, max_backoff=0.05, reset_timeout=0.05)
+    options.update(kwargs)
+    return ScheduledLinkedin(client, **options)
+
+def check_throttle_retry():
+    client = ScriptedLinkedin([FakeHTTPError(429), FakeHTTPError(429)])
+    api = scheduler(client)
+    payload = api.get_job(client.job_id(0))
+    report = api.report()
+    api.close()
+    assert payload["title"].endswith("#0"), payload["title"]
+    assert report["throttled"] == 2 and report["retries"] == 2 and report["failed"] == 0, report
+    assert report["current_rate_limit"] < 1000, report
+
+def check_server_error_retry():
+    client = ScriptedLinkedin([FakeHTTPError(503)])
+    api = scheduler(client)
+    api.get_job(client.job_id(1))
+    report = api.report()
+    api.close()
+    assert report["server_errors"] == 1 and report["succeeded"] == 1, report
+
+def check_retries_exhausted():
+    client = ScriptedLinkedin([FakeHTTPError(503)] * 3)
+    api = scheduler(client, max_retries=2, failure_threshold=10)
+    try:
+        api.get_job(client.job_id(2))
+    except FakeHTTPError as e:
+        assert e.status_code == 503
+    else:
+        raise AssertionError("expected the last 503 to be raised")
+    api.close()
+
+def check_breaker_recovers(trial_error):
+    """Two 503s open the breaker; after reset_timeout the trial call (failing with trial_error if given) closes it"""
+    errors = [FakeHTTPError(503), FakeHTTPError(503)] + ([trial_error] if trial_error else [])
+    client = ScriptedLinkedin(errors)
+    api = scheduler(client, max_retries=0, failure_threshold=2)
+    for index in (0, 1):
+        try:
+            api.get_job(client.job_id(index))
+        except FakeHTTPError:
+            pass
+    try:
+        api.get_job(client.job_id(2))
+    except CircuitOpenError:
+        pass
+    else:
+        raise AssertionError("expected the breaker to be open")
+
+    time.sleep(0.06)
+    if trial_error:
+        try:
+            api.get_job(client.job_id(3))
+        except type(trial_error):
+            pass
+    # Whatever the trial's outcome, later calls must go through again
+    for index in (4, 5):
+        api.get_job(client.job_id(index))
+    report = api.report()
+    api.close()
+    assert report["circuit_rejections"] == 1, report
+
+CHECKS = {
+    "429 backoff and retry": check_throttle_retry,
+    "503 retry": check_server_error_retry,
+    "retries exhausted": check_retries_exhausted,
+    "breaker recovers after a successful trial": lambda: check_breaker_recovers(None),
+    "breaker recovers after a 404 trial": lambda: check_breaker_recovers(FakeHTTPError(404)),
+    "breaker recovers after a KeyError trial": lambda: check_breaker_recovers(KeyError("data")),
+}
+
+def main():
+    failed = []
+    for name, check in CHECKS.items():
+        try:
+            check()
+        except Exception as e:
+            failed.append(name)
+            print(f"FAIL  {name}: {type(e).__name__}: {e}")
+        else:
+            print(f"ok    {name}")
+    if failed:
+        print(f"{len(failed)} scheduler check(s) failed")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
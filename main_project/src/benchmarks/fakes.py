@@ -0,0 +1,155 @@
+"""
+Offline stand-ins for the LinkedIn and OpenAI clients, for benchmarks and local testing.
+FakeLinkedin replays the recorded get_job payloads in fixtures/linkedin_payloads.json (the shape behind
+output/job_data.json) as a catalogue of any size; FakeOpenAI (and FakeAsyncOpenAI, its openai.AsyncOpenAI counterpart for
+llm_scoring.MatchScorer) returns deterministic embeddings and scores.
+Both can add latency and inject errors: HTTP 429/5xx-style exceptions that api_scheduler classifies.
+"""
+import asyncio
+import copy
+import hashlib
+import json
+import random
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+PAYLOADS_PATH = Path(__file__).resolve().parent / "fixtures" / "linkedin_payloads.json"
+
+class FakeHTTPError(Exception):
+    """Carries a status_code like the HTTP errors of the real clients"""
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+class _Faults:
+    """Latency and error injection shared by the fakes"""
+    def __init__(self, latency, error_rate, throttle_rate, seed):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.calls = 0
+
+    def _roll(self):
+        with self.lock:
+            self.calls += 1
+            return self.random.random()
+
+    def _raise_for(self, roll):
+        if roll < self.throttle_rate:
+            raise FakeHTTPError(429)
+        if roll < self.throttle_rate + self.error_rate:
+            raise FakeHTTPError(503)
+
+    def apply(self):
+        roll = self._roll()
+        if self.latency:
+            time.sleep(self.latency)
+        self._raise_for(roll)
+
+    async def apply_async(self):
+        roll = self._roll()
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        self._raise_for(roll)
+
+def load_payloads(path=PAYLOADS_PATH):
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+class FakeLinkedin:
+    """
+    Replays recorded payloads as num_postings distinct postings, newest first.
+    Posting i reuses recorded payload i % len(payloads) with its own title, listedAt and a
+    "Requisition" line in the description, so near-duplicate detection does not collapse them.
+    search_jobs honours limit/offset; get_job returns the payload for an ID from the catalogue.
+    """
+    def __init__(self, num_postings=100, payloads=None, latency=0.0, error_rate=0.0, throttle_rate=0.0, seed=0,
+                 start_ms=None):
+        self.payloads = payloads or load_payloads()
+        self.num_postings = num_postings
+        self.faults = _Faults(latency, error_rate, throttle_rate, seed)
+        self.start_ms = start_ms if start_ms is not None else int(time.time() * 1000)
+        self.search_calls = 0
+        self.get_job_calls = 0
+
+    def job_id(self, index):
+        return str(4000000000 + index)
+
+    def listed_at(self, index):
+        # One posting a minute, newest (index 0) first
+        return self.start_ms - index * 60000
+
+    def search_jobs(self, limit=-1, offset=0, **params):
+        self.search_calls += 1
+        self.faults.apply()
+        stop = self.num_postings if limit is None or limit < 0 else min(self.num_postings, offset + limit)
+        return [{"entityUrn": f"urn:li:fs_normalized_jobPosting:{self.job_id(i)}", "listedAt": self.listed_at(i)}
+                for i in range(offset, stop)]
+
+    def get_job(self, job_id):
+        self.get_job_calls += 1
+        self.faults.apply()
+        index = int(job_id) - 4000000000
+        if not 0 <= index < self.num_postings:
+            raise FakeHTTPError(404)
+        payload = copy.deepcopy(self.payloads[index % len(self.payloads)])
+        payload["title"] = f"{payload['title']} #{index}"
+        payload["listedAt"] = self.listed_at(index)
+        payload["description"]["text"] += f"\n\nRequisition: {job_id}"
+        return payload
+
+class FakeOpenAI:
+    """
+    Stand-in for the synchronous OpenAI client: embeddings.create returns unit vectors derived from a
+    hash of each input (identical texts get identical vectors); chat.completions.create returns a score.
+    """
+    def __init__(self, dim=1536, latency=0.0, error_rate=0.0, throttle_rate=0.0, seed=0):
+        self.dim = dim
+        self.faults = _Faults(latency, error_rate, throttle_rate, seed)
+        self.embeddings = SimpleNamespace(create=self._embed)
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._chat))
+
+    def vector(self, text):
+        seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "little")
+        vector = np.random.default_rng(seed).standard_normal(self.dim).astype(np.float32)
+        return (vector / np.linalg.norm(vector)).tolist()
+
+    def _embedding_response(self, input):
+        texts = [input] if isinstance(input, str) else input
+        return SimpleNamespace(
+            data=[SimpleNamespace(index=i, embedding=self.vector(text)) for i, text in enumerate(texts)],
+            usage=SimpleNamespace(prompt_tokens=sum(len(text) // 4 for text in texts)),
+        )
+
+    def _chat_response(self, messages):
+        score = int(hashlib.sha256(messages[-1]["content"].encode("utf-8")).hexdigest(), 16) % 101
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=str(score)))],
+            usage=SimpleNamespace(prompt_tokens=sum(len(m["content"]) // 4 for m in messages), completion_tokens=1),
+        )
+
+    def _embed(self, input, model):
+        self.faults.apply()
+        return self._embedding_response(input)
+
+    def _chat(self, model, messages, **kwargs):
+        self.faults.apply()
+        return self._chat_response(messages)
+
+class FakeAsyncOpenAI(FakeOpenAI):
+    """FakeOpenAI with awaitable embeddings.create/chat.completions.create, like openai.AsyncOpenAI"""
+    async def _embed(self, input, model):
+        await self.faults.apply_async()
+        return self._embedding_response(input)
+
+    async def _chat(self, model, messages, **kwargs):
+        await self.faults.apply_async()
+        return self._chat_response(messages)
+
+    async def close(self):
+        pass
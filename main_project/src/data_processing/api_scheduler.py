@@ -0,0 +1,292 @@
+import itertools
+import json
+import re
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from queue import PriorityQueue
+from profiling import timed
+
+# Lower runs first: searches feed the pipeline, then details of new postings, then refreshes of cached ones
+PRIORITY_SEARCH = 0
+PRIORITY_NEW = 1
+PRIORITY_REFRESH = 2
+
+class ThrottledError(Exception):
+    """LinkedIn answered with 429 (in an exception or in the response payload)"""
+
+class ServerError(Exception):
+    """LinkedIn answered with a 5xx status"""
+
+class CircuitOpenError(Exception):
+    """Too many consecutive throttling/server failures; calls fail fast until the reset timeout passes"""
+
+def error_status(error):
+    """HTTP status carried by an exception from the client, if any"""
+    for candidate in (error, getattr(error, "response", None)):
+        status = getattr(candidate, "status_code", None) or getattr(candidate, "status", None)
+        if isinstance(status, int):
+            return status
+    match = re.search(r"\b(429|5\d\d)\b", str(error))
+    return int(match.group(1)) if match else None
+
+def payload_status(result):
+    """linkedin_api returns some error responses as {"status": 429, ...} instead of raising"""
+    if isinstance(result, dict) and isinstance(result.get("status"), int) and result["status"] >= 400:
+        return result["status"]
+    return None
+
+class TokenBucket:
+    """Allows bursts of up to 'burst' calls, refilled at 'rate' calls per second"""
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available; returns the seconds spent waiting"""
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+class CircuitBreaker:
+    """Opens after failure_threshold consecutive failures; after reset_timeout one trial call is let through"""
+    def __init__(self, failure_threshold=5, reset_timeout=60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self.trial_running = False
+        self.lock = threading.Lock()
+
+    def allow(self):
+        with self.lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at >= self.reset_timeout and not self.trial_running:
+                self.trial_running = True
+                return True
+            return False
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+            self.trial_running = False
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            self.trial_running = False
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+class ScheduledLinkedin:
+    """
+    Wraps a Linkedin client (or any object with search_jobs/get_job) so every call goes through one scheduler:
+    a token bucket caps the request rate, 429s halve the rate and pause all workers with exponential backoff
+    (the rate then recovers additively), 5xx errors are retried with backoff, a circuit breaker fails calls fast
+    after repeated failures, and queued calls run by priority (searches, then new postings, then refreshes).
+    is_refresh(job_id) marks get_job calls that re-fetch an expired cache entry.
+    Calls block and return the client's result, or raise after the last retry, like the client itself.
+    """
+    def __init__(self, client, rate=1.0, burst=3, workers=4, max_retries=4, backoff=2.0, max_backoff=120.0,
+                 failure_threshold=5, reset_timeout=60.0, is_refresh=None):
+        self.client = client
+        self.max_rate = rate
+        self.bucket = TokenBucket(rate, burst)
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self.workers = workers
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.is_refresh = is_refresh
+        self.queue = PriorityQueue()
+        self.sequence = itertools.count()
+        self.threads = []
+        self.lock = threading.Lock()
+        self.pause_until = 0.0
+        self.consecutive_throttles = 0
+        self.started_at = time.monotonic()
+        self.metrics = {
+            "requests": 0, "succeeded": 0, "failed": 0, "throttled": 0, "server_errors": 0,
+            "other_errors": 0, "retries": 0, "circuit_rejections": 0,
+            "wait_seconds": 0.0, "latency_seconds": 0.0, "by_priority": {},
+        }
+
+    # ---- client interface ----
+
+    def search_jobs(self, **params):
+        return self.call("search_jobs", kwargs=params, priority=PRIORITY_SEARCH)
+
+    def get_job(self, job_id):
+        refresh = self.is_refresh is not None and self.is_refresh(job_id)
+        return self.call("get_job", args=(job_id,), priority=PRIORITY_REFRESH if refresh else PRIORITY_NEW)
+
+    def call(self, method, args=(), kwargs=None, priority=PRIORITY_NEW):
+        """Queue a client call and wait for its result"""
+        return self.submit(method, args, kwargs, priority).result()
+
+    def submit(self, method, args=(), kwargs=None, priority=PRIORITY_NEW):
+        """Queue a client call; returns a Future"""
+        self._start()
+        future = Future()
+        with self.lock:
+            counts = self.metrics["by_priority"]
+            counts[priority] = counts.get(priority, 0) + 1
+        self.queue.put((priority, next(self.sequence), method, args, kwargs or {}, future, 0))
+        return future
+
+    # ---- workers ----
+
+    def _start(self):
+        with self.lock:
+            if self.threads:
+                return
+            for _ in range(self.workers):
+                thread = threading.Thread(target=self._work, daemon=True)
+                thread.start()
+                self.threads.append(thread)
+
+    def _requeue(self, item, delay):
+        priority, sequence, method, args, kwargs, future, attempt = item
+        # Keeps its original sequence number, so a retried call stays ahead of later calls of the same priority
+        retry = (priority, sequence, method, args, kwargs, future, attempt + 1)
+        timer = threading.Timer(delay, self.queue.put, args=(retry,))
+        timer.daemon = True
+        timer.start()
+
+    def _count(self, key, amount=1):
+        with self.lock:
+            self.metrics[key] += amount
+
+    def _work(self):
+        while True:
+            item = self.queue.get()
+            priority, sequence, method, args, kwargs, future, attempt = item
+            if method is None:
+                break
+
+            pause = self.pause_until - time.monotonic()
+            if pause > 0:
+                time.sleep(pause)
+                self._count("wait_seconds", pause)
+            if not self.breaker.allow():
+                self._count("circuit_rejections")
+                self._count("failed")
+                future.set_exception(CircuitOpenError(f"LinkedIn circuit open, {method} not sent"))
+                continue
+            self._count("wait_seconds", self.bucket.acquire())
+
+            self._count("requests")
+            start = time.monotonic()
+            try:
+                with timed(f"linkedin.{method}"):
+                    result = getattr(self.client, method)(*args, **kwargs)
+                status = payload_status(result)
+                if status == 429:
+                    raise ThrottledError(f"{method} throttled (status 429)")
+                if status is not None and status >= 500:
+                    raise ServerError(f"{method} failed with status {status}")
+            except Exception as e:
+                self._count("latency_seconds", time.monotonic() - start)
+                self._handle_error(item, e)
+                continue
+            self._count("latency_seconds", time.monotonic() - start)
+            self._on_success()
+            self._count("succeeded")
+            future.set_result(result)
+
+    def _handle_error(self, item, error):
+        future, attempt = item[5], item[6]
+        status = 429 if isinstance(error, ThrottledError) else 500 if isinstance(error, ServerError) else error_status(error)
+        if status == 429:
+            self._count("throttled")
+            delay = self._on_throttled()
+        elif status is not None and status >= 500:
+            self._count("server_errors")
+            delay = min(self.max_backoff, self.backoff * 2 ** attempt)
+        else:
+            # Not a rate or server problem (bad ID, parse error...): retrying would not help.
+            # LinkedIn did answer, so this also settles a half-open breaker's trial call
+            self.breaker.record_success()
+            self._count("other_errors")
+            self._count("failed")
+            future.set_exception(error)
+            return
+
+        self.breaker.record_failure()
+        if attempt >= self.max_retries:
+            self._count("failed")
+            future.set_exception(error)
+            return
+        self._count("retries")
+        self._requeue(item, delay)
+
+    def _on_throttled(self):
+        """Halve the request rate and pause every worker; returns the backoff delay"""
+        with self.lock:
+            self.consecutive_throttles += 1
+            delay = min(self.max_backoff, self.backoff * 2 ** (self.consecutive_throttles - 1))
+            self.pause_until = max(self.pause_until, time.monotonic() + delay)
+            self.bucket.rate = max(self.max_rate / 16, self.bucket.rate / 2)
+        return delay
+
+    def _on_success(self):
+        self.breaker.record_success()
+        with self.lock:
+            self.consecutive_throttles = 0
+            # Additive recovery towards the configured rate
+            self.bucket.rate = min(self.max_rate, self.bucket.rate + self.max_rate / 10)
+
+    def close(self):
+        """Stop the workers once the queued calls are done"""
+        for _ in self.threads:
+            self.queue.put((float("inf"), next(self.sequence), None, (), {}, None, 0))
+        for thread in self.threads:
+            thread.join()
+        self.threads = []
+
+    # ---- metrics ----
+
+    def report(self):
+        """Request rate, wait time and error counts for this run"""
+        with self.lock:
+            metrics = dict(self.metrics, by_priority=dict(self.metrics["by_priority"]))
+            current_rate = self.bucket.rate
+        elapsed = time.monotonic() - self.started_at
+        requests = metrics["requests"]
+        metrics.update({
+            "elapsed_seconds": round(elapsed, 3),
+            "request_rate_per_second": round(requests / elapsed, 3) if elapsed else 0.0,
+            "mean_latency_seconds": round(metrics["latency_seconds"] / requests, 3) if requests else 0.0,
+            "wait_seconds": round(metrics["wait_seconds"], 3),
+            "latency_seconds": round(metrics["latency_seconds"], 3),
+            "current_rate_limit": round(current_rate, 3),
+            "by_priority": {{PRIORITY_SEARCH: "search", PRIORITY_NEW: "new", PRIORITY_REFRESH: "refresh"}.get(p, str(p)): n
+                            for p, n in metrics["by_priority"].items()},
+        })
+        return metrics
+
+    def export_report(self, path="output/api_metrics.json"):
+        """Write report() as JSON and print a one-line summary"""
+        report = self.report()
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(report, indent=4), encoding="utf-8")
+        print(f"LinkedIn API: {report['requests']} requests ({report['request_rate_per_second']}/s), "
+              f"{report['throttled']} throttled, {report['server_errors']} server errors, {report['retries']} retries, "
+              f"{report['failed']} failed, {report['wait_seconds']}s waiting -> {path}")
+        return report
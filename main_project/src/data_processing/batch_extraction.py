@@ -0,0 +1,107 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+'''
+    Batch extraction of salary and experience from many job descriptions at once.
+    Each function takes a pandas Series of description texts and returns typed columns
+    (one row per description, same index), using precompiled patterns run through Series.str.extract.
+    Unlike extract_salary/extract_experience_level, which return the matched text, amounts and years
+    come back as numbers: "$163K - $204K", "163k - 204k" and "$163,000 - 204,000" all give 163000/204000.
+'''
+
+_AMOUNT = r"\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d+(?:\.\d+)?"
+# 1,000 and up, written with thousands separators or at least four digits
+_LARGE_AMOUNT = r"\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d{4,}(?:\.\d+)?"
+# Not followed by more digits or by a millions/billions suffix ("$10 million revenue", "$1.5M budget")
+_AMOUNT_END = r"(?!\d)(?!\s*(?:mm?|mn|million|bn?|billion)\b)"
+_DASH = r"\s*(?:[–—-]|to)\s*"
+_PERIOD = (r"(?:\s*(?:/|per|an?|each)\s*|\s+)"
+           r"(?P<period>year|yr|annum|hour|hr|month|mo|week|wk)\b|\s*(?P<period_adj>annually|yearly|hourly|monthly|weekly)\b")
+
+# Amounts following a currency symbol, optionally a range, optionally followed by a currency code and a period.
+# Starting on the symbol itself keeps the scan fast; "CA$", "C$" and "CAD $" are recognised by looking back from the "$",
+# and the upper end of a range may repeat the prefix ("CA$90,000 - CA$110,000").
+# Only plausible salaries match: a k suffix, an amount of 1,000 or more, a range or a period is required,
+# so "$5 coffee" is skipped and the search moves on to the next amount.
+SALARY_PATTERN = re.compile(
+    rf"(?P<currency>[$£€])(?P<cad>(?<=CA\$)|(?<=C\$)|(?<=CAD\$)|(?<=CAD\s\$))?\s*(?P<min>(?P<large>{_LARGE_AMOUNT})|{_AMOUNT}){_AMOUNT_END}"
+    rf"\s*(?P<min_k>k\b)?"
+    rf"(?:{_DASH}(?:(?:CAD\s?|CA|C)?[$£€])?\s*(?P<max>{_AMOUNT}){_AMOUNT_END}\s*(?P<max_k>k\b)?)?"
+    rf"(?:\s*(?P<code>USD|CAD|EUR|GBP)\b)?(?:{_PERIOD})?"
+    rf"(?(min_k)|(?(large)|(?(max)|(?(period)|(?(period_adj)|(?!))))))",
+    re.IGNORECASE,
+)
+# Ranges written without a currency, only recognisable by the thousands suffix: "163k - 204k"
+K_RANGE_PATTERN = re.compile(
+    rf"(?<![\w.$])(?P<min>\d{{2,3}}(?:\.\d+)?)\s*(?P<min_k>k)?{_DASH}(?P<max>\d{{2,3}}(?:\.\d+)?)\s*(?P<max_k>k)\b"
+    rf"(?:\s*(?P<code>USD|CAD|EUR|GBP)\b)?(?:{_PERIOD})?",
+    re.IGNORECASE,
+)
+# "5+ years", "3-5 yrs", "2 to 4 years"; the same forms the experience patterns in data_extraction.py look for
+EXPERIENCE_YEARS_PATTERN = re.compile(
+    r"(?P<min>\d{1,2})\s*(?:(?P<plus>\+)|(?:[–—-]|to)\s*(?P<max>\d{1,2})\s*\+?)?\s*(?:years|yrs)\b",
+    re.IGNORECASE,
+)
+
+CURRENCY_CODES = {"$": "USD", "usd": "USD", "cad": "CAD", "eur": "EUR", "€": "EUR", "gbp": "GBP", "£": "GBP"}
+PERIODS = {"year": "year", "yr": "year", "annum": "year", "annually": "year", "yearly": "year",
+           "hour": "hour", "hr": "hour", "hourly": "hour", "month": "month", "mo": "month", "monthly": "month",
+           "week": "week", "wk": "week", "weekly": "week"}
+
+def _amounts(numbers, k_suffix, other_k_suffix=None):
+    """Amount strings to floats, times 1000 for a k suffix (or, for "163 - 204k", the other end's suffix)"""
+    values = pd.to_numeric(numbers.str.replace(",", "", regex=False), errors="coerce").astype("Float64")
+    thousands = k_suffix.notna()
+    if other_k_suffix is not None:
+        thousands |= other_k_suffix.notna() & (values < 1000).fillna(False)
+    return values.where(~thousands, values * 1000)
+
+def extract_salary_columns(descriptions):
+    """
+    salary_min, salary_max (Float64), salary_currency and salary_period (string) for each description.
+    A single amount gives salary_max == salary_min. Without an explicit period, amounts under 1000
+    are taken as hourly and larger ones as yearly. Rows without a salary are all <NA>.
+    """
+    descriptions = pd.Series(descriptions, dtype="string").fillna("")
+    match = descriptions.str.extract(SALARY_PATTERN)
+    # Rows with no currency-marked amount fall back to a bare "163k - 204k" range
+    missing = match["min"].isna()
+    if missing.any():
+        match = match.combine_first(descriptions[missing].str.extract(K_RANGE_PATTERN))
+
+    salary_min = _amounts(match["min"], match["min_k"], match["max_k"])
+    salary_max = _amounts(match["max"], match["max_k"]).fillna(salary_min)
+    # A bare "163k - 204k" range has no currency, so it stays <NA>
+    symbol = match["currency"].where(match["cad"].isna(), "cad")
+    currency = match["code"].fillna(symbol).str.lower().map(CURRENCY_CODES, na_action="ignore")
+    currency = currency.where(salary_min.notna())
+    period = match["period"].fillna(match["period_adj"]).str.lower().map(PERIODS, na_action="ignore")
+    inferred = pd.Series(np.where(salary_max.fillna(0).to_numpy(dtype=float) < 1000, "hour", "year"), index=match.index)
+    period = period.fillna(inferred).where(salary_min.notna())
+
+    return pd.DataFrame({
+        "salary_min": salary_min,
+        "salary_max": salary_max,
+        "salary_currency": currency.astype("string"),
+        "salary_period": period.astype("string"),
+    }, index=descriptions.index)
+
+def extract_experience_columns(descriptions):
+    """
+    experience_min_years and experience_max_years (Int64) for each description, from the first
+    "N years" mention. "5+ years" leaves the maximum <NA>; "3 years" gives 3 for both.
+    """
+    descriptions = pd.Series(descriptions, dtype="string").fillna("")
+    match = descriptions.str.extract(EXPERIENCE_YEARS_PATTERN)
+    years_min = pd.to_numeric(match["min"], errors="coerce").astype("Int64")
+    years_max = pd.to_numeric(match["max"], errors="coerce").astype("Int64")
+    # An exact figure bounds both ends; an open-ended "N+" has no maximum
+    years_max = years_max.where(match["plus"].notna() | years_max.notna(), years_min)
+    return pd.DataFrame({"experience_min_years": years_min, "experience_max_years": years_max}, index=descriptions.index)
+
+def extract_batch(descriptions):
+    """Salary and experience columns for a Series of descriptions, side by side"""
+    descriptions = pd.Series(descriptions, dtype="string").fillna("")
+    return pd.concat([extract_salary_columns(descriptions), extract_experience_columns(descriptions)], axis=1)
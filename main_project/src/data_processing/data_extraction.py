@@ -1,8 +1,19 @@
+import os
 import re
-import spacy
+from collections import namedtuple
+from itertools import islice
+from profiling import profiled
 
-# Load NLP model
-nlp = spacy.load("en_core_web_sm")
+# spaCy is slow to import and load and only needed for NLP features, so the model is loaded on first use
+_nlp = None
+
+def get_nlp():
+    """Return the spaCy model, loading it on first call"""
+    global _nlp
+    if _nlp is None:
+        import spacy
+        _nlp = spacy.load("en_core_web_sm")
+    return _nlp
 
 SECTIONS = {
     "company": None,
@@ -64,69 +75,188 @@ TECHNICAL_SKILLS_KEYWORDS = [
     "AR/VR", "WebXR", "Unity", "Unreal Engine"
 ]
 
+class Section(namedtuple("Section", ["name", "group", "start", "body_start", "end"])):
+    """
+    One section of a job description, as offsets into the original text.
+    name is the matched header (lowercase), group is "responsibilities", "qualifications" or "preferred",
+    text[start:body_start] is the header and text[body_start:end] its content.
+    """
+    __slots__ = ()
+
+class SectionSegmenter:
+    """
+    Splits a job description into sections in one pass over its header positions, with the header
+    tables prepared once. Headers are found anywhere in the text, including LinkedIn's run-together
+    lines such as "...tuning.RequirementsMust have...". A header only counts when it is not glued to
+    a preceding word (unless that word ends in lowercase and the header starts with a capital) and is
+    followed by a colon, the end of the line, or directly by a capital letter or digit. This keeps
+    sentences like "Experience with SQL" or "communication skills" from starting new sections.
+    """
+    def __init__(self, header_groups):
+        self.groups = {}
+        for group, headers in header_groups.items():
+            for header in headers:
+                self.groups.setdefault(header.lower(), group)
+        # Longest first, so at a shared position "preferred qualifications" is tried before "qualifications"
+        self.headers = sorted(self.groups, key=len, reverse=True)
+
+    @staticmethod
+    def _is_header(text, start, end):
+        before = text[start - 1] if start else ""
+        if before.isalpha() and not (before.islower() and text[start].isupper()):
+            return False
+        after = text[end:end + 1]
+        if after.isdigit() or (after.isalpha() and after.isupper()):
+            return True
+        line_end = text.find("\n", end)
+        rest = text[end:line_end if line_end != -1 else len(text)].lstrip(" \t")
+        return not rest or rest.startswith(":")
+
+    def segment(self, text):
+        """Return the list of Sections of text in order; text before the first header is not part of any section"""
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # A few non-ASCII characters grow when lowercased; keep offsets aligned with text
+            lowered = "".join(char if len(char.lower()) != 1 else char.lower() for char in text)
+
+        # str.find runs in C and is several times faster here than a compiled alternation
+        # (with or without re.IGNORECASE), so every header occurrence is collected that way
+        candidates = []
+        for rank, header in enumerate(self.headers):
+            start = lowered.find(header)
+            while start != -1:
+                candidates.append((start, rank))
+                start = lowered.find(header, start + 1)
+        candidates.sort()
+
+        headers = []
+        pos = 0
+        for start, rank in candidates:
+            end = start + len(self.headers[rank])
+            if start >= pos and self._is_header(text, start, end):
+                headers.append((self.headers[rank], start, end))
+                pos = end
+
+        sections = []
+        for i, (name, start, body_start) in enumerate(headers):
+            end = headers[i + 1][1] if i + 1 < len(headers) else len(text)
+            sections.append(Section(name, self.groups[name], start, body_start, end))
+        return sections
+
+SECTION_SEGMENTER = SectionSegmenter({
+    "responsibilities": RESPONSIBILITIES_HEADERS,
+    "qualifications": QUALIFICATIONS_HEADERS,
+    "preferred": PREFERRED_HEADERS,
+})
+
 # Function to extract job sections properly
-def extract_sections(text):
+@profiled()
+def extract_sections(text, segmenter=SECTION_SEGMENTER):
+    """Map each section header (lowercase) to its non-empty, stripped lines, header line first"""
     sections = {}
-    headers = [header.lower() for header in RESPONSIBILITIES_HEADERS + QUALIFICATIONS_HEADERS + PREFERRED_HEADERS]
-    current_section = None
-
-    for line in text.split("\n"):
-        line = line.strip()
-        if not line:
-            continue
-
-        # Detect section headers dynamically (case-insensitive)
-        if any(header in line.lower() for header in headers):
-            current_section = line.lower()
-            sections[current_section] = []
-            sections[current_section].append(line)
-        elif current_section:
-            sections[current_section].append(line)
-
+    for section in segmenter.segment(text):
+        lines = [line.strip() for line in text[section.start:section.end].split("\n")]
+        # A header repeated later in the posting adds to the same section
+        sections.setdefault(section.name, []).extend(line for line in lines if line)
     return sections
 
+class SkillMatcher:
+    """
+    Finds every skill of a keyword list in one regex scan.
+    The keywords are folded into a case-insensitive trie pattern wrapped in a lookahead,
+    so overlapping skills ("React" / "React Native") are all reported. Each hit is confirmed
+    with the skill's own \\b<skill>\\b pattern, so results match a per-skill re.search.
+    """
+    def __init__(self, skills):
+        self.skills = list(skills)
+        self.skill_patterns = {skill: re.compile(rf"\b{re.escape(skill)}\b", re.IGNORECASE) for skill in self.skills}
+
+        # Group skills by lowercase key (the keyword list has duplicates such as "Kotlin")
+        by_key = {}
+        for skill in self.skill_patterns:
+            by_key.setdefault(skill.lower(), []).append(skill)
+
+        # For every key, the skills that could also match at the same position (itself plus shorter prefixes)
+        self.candidates = {
+            key: [skill for other in by_key if key.startswith(other) for skill in by_key[other]]
+            for key in by_key
+        }
+
+        trie = {}
+        for key in by_key:
+            node = trie
+            for char in key:
+                node = node.setdefault(char, {})
+            node[""] = True
+        self.pattern = re.compile(rf"(?=\b({self._trie_to_regex(trie)})\b)", re.IGNORECASE)
+
+    def _trie_to_regex(self, node):
+        # Children first and a greedy optional end, so the longest matching key is captured
+        branches = [re.escape(char) + self._trie_to_regex(child) for char, child in node.items() if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            return "(?:" + body + ")?"
+        return body
+
+    def find(self, text):
+        """Return the set of skills found in text"""
+        found = set()
+        for match in self.pattern.finditer(text):
+            start = match.start()
+            for skill in self.candidates.get(match.group(1).lower(), ()):
+                if skill not in found and self.skill_patterns[skill].match(text, start):
+                    found.add(skill)
+        return found
+
+# Built once at import; pass a SkillMatcher(custom_list) to extract_skills for other keyword lists
+SKILL_MATCHER = SkillMatcher(TECHNICAL_SKILLS_KEYWORDS)
+
 # Extract technical skills (case-insensitive)
-def extract_skills(sections):
-    extracted_skills = set()
-    for section_name, text_lines in sections.items():
-        for sentence in text_lines:
-            for skill in TECHNICAL_SKILLS_KEYWORDS:
-                if re.search(rf"\b{re.escape(skill)}\b", sentence, re.IGNORECASE):
-                    extracted_skills.add(skill)
-    return list(extracted_skills)
+@profiled()
+def extract_skills(sections, matcher=SKILL_MATCHER):
+    # Lines never contain a newline, so joining them keeps every \b boundary the same as matching line by line
+    text = "\n".join(line for text_lines in sections.values() for line in text_lines)
+    return list(matcher.find(text))
 
-# Extract experience level
-def extract_experience_level(sections):
-    patterns = [
+# Compiled once at import instead of on every call
+EXPERIENCE_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in [
     r"(\d+\s*-\s*\d+|\d+\+?)\s*(?:years|yrs)\s*(?:of\s+)?(?:experience|exp|work)?",  # Matches "5+ years experience", "2-4 years exp"
     r"(?:experience|exp|work)\s*:\s*(\d+\s*-\s*\d+|\d+\+?)\s*(?:years|yrs)?",  # Matches "Experience: 3-5 years"
     r"(?:at least|minimum of|requires)\s*(\d+\+?)\s*(?:years|yrs)\s*(?:of\s+)?(?:experience|exp|work)?"  # Matches "At least 3+ years experience"
-    ]
+]]
+
+SALARY_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'\$\s*(?:\d{2,3},?\d{3}|\d{2,3}K)\s*[–—-]\s*\$\s*(?:\d{2,3},?\d{3}|\d{2,3}K)',  # Added more dash types
+    r'\$\s*\d{2,3},?\d{3}\s*[–—-]\s*\d{2,3},?\d{3}',  # Added more dash types
+    r'(?:USD|CAD)?\s*\$\s*\d{2,3},?\d{3}',
+    r'(?:salary|compensation|pay).{0,20}\$\s*\d{2,3},?\d{3}'
+]]
 
+# Extract experience level
+@profiled()
+def extract_experience_level(sections):
     for section_name, text_lines in sections.items():
-        for pattern in patterns:
-            match = re.search(pattern, section_name, re.IGNORECASE)
+        section_text = "\n".join(text_lines)
+        for pattern in EXPERIENCE_PATTERNS:
+            match = pattern.search(section_text)
             if match:
                 return match.group(0) 
     return "Not specified"
 
 # Extract salary range
+@profiled()
 def extract_salary(text):
-    """Extract salary with improved regex patterns"""
-    salary_patterns = [
-        r'\$\s*(?:\d{2,3},?\d{3}|\d{2,3}K)\s*[–—-]\s*\$\s*(?:\d{2,3},?\d{3}|\d{2,3}K)',  # Added more dash types
-        r'\$\s*\d{2,3},?\d{3}\s*[–—-]\s*\d{2,3},?\d{3}',  # Added more dash types
-        r'(?:USD|CAD)?\s*\$\s*\d{2,3},?\d{3}',
-        r'(?:salary|compensation|pay).{0,20}\$\s*\d{2,3},?\d{3}'
-    ]
-    
-    for pattern in salary_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    """Extract salary with improved regex patterns (see batch_extraction.py for typed columns over many postings)"""
+    for pattern in SALARY_PATTERNS:
+        match = pattern.search(text)
         if match:
             return match.group(0).strip()
     return "Not specified"
 
 # Main function to process job description
+@profiled()
 def process_job_description(job_description):
     sections = extract_sections(job_description)
     # print(sections)
@@ -137,50 +267,76 @@ def process_job_description(job_description):
     }
     return extracted_data
 
-def main():
-    job_description = """
-    Tailscale is hiring a Software Engineer.
-    Key Responsibilities:
-    • Work with CI/CD, Secrets Management, and Observability tools.
-    • Build infrastructure as code solutions.
-    • Work with Go, SQL, and Networking, Distributed Systems, and Cloud.
-
-    Qualifications:
-    - 5+ years of experience in software engineering.
-    - Experience with SQL, Go, and Networking.
-
-    Preferred Qualifications:
-    - Experience with CI/CD, Secrets Management, and Observability tools.
-    - Experience with infrastructure as code solutions.
-
-    US Pay Ranges:
-    $163k - $204k USD
-    US citizen only 
-    Must be authorized to work in the US.
+def process_job_descriptions(job_descriptions, workers=None, chunksize=64):
     """
-
-    job_description2 = """
-    A leading sell-side equity firm is seeking a highly skilled Java Developer to design, develop, and enhance proprietary algorithmic equity execution models for institutional trading. This role offers the opportunity to build and optimize advanced electronic trading systems, working closely with sales, traders, and clients to deliver innovative execution strategies.ResponsibilitiesDevelop and implement a proprietary algorithmic equity execution platform.Collaborate with traders, quants, and sales teams to create customized execution strategies.Design and build low-latency, high-performance algorithmic trading systems.Work on advanced execution models, including VWAP, TWAP, pairs trading, and program trading.Enhance execution efficiency through data-driven analytics and real-time performance tuning.RequirementsMust have 3+ years of experience developing equity algorithmic execution systems.Strong Java 8+ programming skills, with proficiency in SQL and Python.Deep understanding of equity market structures and algorithmic trading.Hands-on experience in building high-performance trading applications.Excellent communication skills to engage with traders, quants, and clients.Prior experience at a bulge-bracket firm is highly desirable.KeywordsJava, Algorithmic Trading, Equity Execution, Program Trading, VWAP, TWAP, Pairs Trading, Low-Latency Systems, Electronic Trading, High-Frequency Trading (HFT), Market Microstructure
-    Please send your resume to Jim Geiger jeg@analyticrecruiting.com
+    Process many job descriptions across a process pool, yielding results in input order.
+    Workers only import this module (regex tables and SkillMatcher); spaCy stays unloaded
+    because the extraction functions never call get_nlp().
+    workers=1 processes serially in this process; None uses every CPU.
+    job_descriptions may be a generator: Pool.imap would read all of its input up front, so it is
+    fed a window of workers * chunksize * 4 descriptions at a time and memory stays bounded.
     """
+    if workers == 1:
+        yield from map(process_job_description, job_descriptions)
+        return
+    from multiprocessing import Pool
+    workers = workers or os.cpu_count() or 1
+    window = workers * chunksize * 4
+    job_descriptions = iter(job_descriptions)
+    with Pool(processes=workers) as pool:
+        while True:
+            batch = list(islice(job_descriptions, window))
+            if not batch:
+                break
+            yield from pool.imap(process_job_description, batch, chunksize=chunksize)
 
-    job_description3 = """
-    As a Software Developer, Backend at Gruve, you will build and own key backend services, infrastructure, and data that power our core financial products. This is a unique opportunity to gain an in-depth understanding of how the US financial system operates and strengthen your financial-domain knowledge.
-    We strive for high engineering standards while solving scalability challenges, and you will have a significant impact at a relatively small company serving a large user base.
-    Key Teams: Brokerage: Our mission is to launch new features, expand into different financial services, and bring millions more people into the financial system.Futures Team: Introduce futures trading and event contracts to millions of users with a seamless, secure, and innovative experience.Crypto Team: Drive the delivery of a seamless, intuitive, and powerful crypto trading experience for millions of crypto users.
-    Key Roles & ResponsibilitiesBuild scalable systems and components, balancing stability with long-term maintainability.Design, write, test, and release platform or product-facing features with stringent correctness and scalability requirements.Identify opportunities to improve system performance, team productivity, and reduce risks.Collaborate closely with cross-functional teams, client teams, and vendors.
-    Basic Qualifications3+ years of experience as a software developer.Proven track record of collaborating with cross-functional teams and delivering large-scope technical projects.Deep understanding of design, product, and backend development, enabling effective collaboration.Experience with Go or Python.Experience with Kafka and data streaming technologies.Experience handling and processing large volumes of data.Familiarity with technologies such as Postgres, K8s, Redis, AWS (or similar).
-    Bonus PointsExperience at a fintech company or financial firm.
-    Equal Employment OpportunityGruve is an equal opportunity employer and values diversity. We do not discriminate on the basis of race, religion, color, national origin, gender, sexual orientation, age, marital status, veteran status, or disability status.
-    Compliance StatementsThis job description complies with the Fair Labor Standards Act (FLSA) and Americans with Disabilities Act (ADA).The essential functions listed are necessary for ADA compliance.Salary ranges are provided in accordance with New York and California pay transparency laws.
-    Physical DemandsAbility to remain in a stationary position for extended periods.Occasionally move about the office to access files and office equipment.
-    Work EnvironmentThis position may require working in a fast-paced environment.On-site presence is required.
-    Reasonable Accommodation StatementGruve is committed to the full inclusion of all qualified individuals. As part of this commitment, Gruve will ensure that persons with disabilities are provided reasonable accommodations. If reasonable accommodation is needed to participate in the job application or interview process, perform essential job functions, and/or receive other benefits and privileges of employment, please contact hr.usa@gruve.ai.
-    """
+# Sample postings: a well-formatted one and two with LinkedIn's run-together section headers
+SAMPLE_JOB_DESCRIPTION = """
+Tailscale is hiring a Software Engineer.
+Key Responsibilities:
+• Work with CI/CD, Secrets Management, and Observability tools.
+• Build infrastructure as code solutions.
+• Work with Go, SQL, and Networking, Distributed Systems, and Cloud.
+
+Qualifications:
+- 5+ years of experience in software engineering.
+- Experience with SQL, Go, and Networking.
+
+Preferred Qualifications:
+- Experience with CI/CD, Secrets Management, and Observability tools.
+- Experience with infrastructure as code solutions.
 
-    # print(process_job_description(job_description))
-    print(process_job_description(job_description2))
-    print(process_job_description(job_description3))
+US Pay Ranges:
+$163k - $204k USD
+US citizen only 
+Must be authorized to work in the US.
+"""
+
+SAMPLE_JOB_DESCRIPTION2 = """
+A leading sell-side equity firm is seeking a highly skilled Java Developer to design, develop, and enhance proprietary algorithmic equity execution models for institutional trading. This role offers the opportunity to build and optimize advanced electronic trading systems, working closely with sales, traders, and clients to deliver innovative execution strategies.ResponsibilitiesDevelop and implement a proprietary algorithmic equity execution platform.Collaborate with traders, quants, and sales teams to create customized execution strategies.Design and build low-latency, high-performance algorithmic trading systems.Work on advanced execution models, including VWAP, TWAP, pairs trading, and program trading.Enhance execution efficiency through data-driven analytics and real-time performance tuning.RequirementsMust have 3+ years of experience developing equity algorithmic execution systems.Strong Java 8+ programming skills, with proficiency in SQL and Python.Deep understanding of equity market structures and algorithmic trading.Hands-on experience in building high-performance trading applications.Excellent communication skills to engage with traders, quants, and clients.Prior experience at a bulge-bracket firm is highly desirable.KeywordsJava, Algorithmic Trading, Equity Execution, Program Trading, VWAP, TWAP, Pairs Trading, Low-Latency Systems, Electronic Trading, High-Frequency Trading (HFT), Market Microstructure
+Please send your resume to Jim Geiger jeg@analyticrecruiting.com
+"""
+
+SAMPLE_JOB_DESCRIPTION3 = """
+As a Software Developer, Backend at Gruve, you will build and own key backend services, infrastructure, and data that power our core financial products. This is a unique opportunity to gain an in-depth understanding of how the US financial system operates and strengthen your financial-domain knowledge.
+We strive for high engineering standards while solving scalability challenges, and you will have a significant impact at a relatively small company serving a large user base.
+Key Teams: Brokerage: Our mission is to launch new features, expand into different financial services, and bring millions more people into the financial system.Futures Team: Introduce futures trading and event contracts to millions of users with a seamless, secure, and innovative experience.Crypto Team: Drive the delivery of a seamless, intuitive, and powerful crypto trading experience for millions of crypto users.
+Key Roles & ResponsibilitiesBuild scalable systems and components, balancing stability with long-term maintainability.Design, write, test, and release platform or product-facing features with stringent correctness and scalability requirements.Identify opportunities to improve system performance, team productivity, and reduce risks.Collaborate closely with cross-functional teams, client teams, and vendors.
+Basic Qualifications3+ years of experience as a software developer.Proven track record of collaborating with cross-functional teams and delivering large-scope technical projects.Deep understanding of design, product, and backend development, enabling effective collaboration.Experience with Go or Python.Experience with Kafka and data streaming technologies.Experience handling and processing large volumes of data.Familiarity with technologies such as Postgres, K8s, Redis, AWS (or similar).
+Bonus PointsExperience at a fintech company or financial firm.
+Equal Employment OpportunityGruve is an equal opportunity employer and values diversity. We do not discriminate on the basis of race, religion, color, national origin, gender, sexual orientation, age, marital status, veteran status, or disability status.
+Compliance StatementsThis job description complies with the Fair Labor Standards Act (FLSA) and Americans with Disabilities Act (ADA).The essential functions listed are necessary for ADA compliance.Salary ranges are provided in accordance with New York and California pay transparency laws.
+Physical DemandsAbility to remain in a stationary position for extended periods.Occasionally move about the office to access files and office equipment.
+Work EnvironmentThis position may require working in a fast-paced environment.On-site presence is required.
+Reasonable Accommodation StatementGruve is committed to the full inclusion of all qualified individuals. As part of this commitment, Gruve will ensure that persons with disabilities are provided reasonable accommodations. If reasonable accommodation is needed to participate in the job application or interview process, perform essential job functions, and/or receive other benefits and privileges of employment, please contact hr.usa@gruve.ai.
+"""
+
+SAMPLE_JOB_DESCRIPTIONS = [SAMPLE_JOB_DESCRIPTION, SAMPLE_JOB_DESCRIPTION2, SAMPLE_JOB_DESCRIPTION3]
+
+def main():
+    # print(process_job_description(SAMPLE_JOB_DESCRIPTION))
+    print(process_job_description(SAMPLE_JOB_DESCRIPTION2))
+    print(process_job_description(SAMPLE_JOB_DESCRIPTION3))
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
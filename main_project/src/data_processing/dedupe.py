@@ -0,0 +1,54 @@
+import hashlib
+
+class JobDeduplicator:
+    """
+    Removes duplicate postings across overlapping searches.
+    By ID: the same entityUrn returned by several queries is only fetched once.
+    Near duplicates (optional): reposts under a new ID with the same company, title and description
+    are dropped after their details are fetched, before they are processed and written.
+    """
+    def __init__(self, completed_ids=None, near_duplicates=True):
+        # IDs finished by an earlier, interrupted run are skipped but not counted as duplicates
+        self.completed_ids = set(completed_ids) if completed_ids else set()
+        self.seen_ids = set()
+        self.near_duplicates = near_duplicates
+        self.content_hashes = set()
+        self.id_duplicates = 0
+        self.completed_skipped = 0
+        self.near_duplicates_removed = 0
+
+    def is_new_id(self, job_id):
+        """True the first time job_id is seen"""
+        if job_id in self.completed_ids:
+            self.completed_skipped += 1
+            return False
+        if job_id in self.seen_ids:
+            self.id_duplicates += 1
+            return False
+        self.seen_ids.add(job_id)
+        return True
+
+    @staticmethod
+    def content_hash(details):
+        """Hash of normalized company, title and description of a get_job payload"""
+        company = details.get('companyDetails', {}).get('com.linkedin.voyager.deco.jobs.web.shared.WebCompactJobPostingCompany', {}).get('companyResolutionResult', {}).get('name', '')
+        title = details.get('title', '')
+        description = details.get('description', {}).get('text', '')
+        normalized = "\0".join(" ".join(part.lower().split()) for part in (company, title, description))
+        return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).digest()
+
+    def is_near_duplicate(self, details):
+        """True if a posting with the same content was already seen (never for empty payloads)"""
+        if not self.near_duplicates or not details:
+            return False
+        digest = self.content_hash(details)
+        if digest in self.content_hashes:
+            self.near_duplicates_removed += 1
+            return True
+        self.content_hashes.add(digest)
+        return False
+
+    def report(self):
+        return (f"Dedupe: {self.id_duplicates} duplicate IDs removed before fetching, "
+                f"{self.near_duplicates_removed} reposts with identical content removed, "
+                f"{self.completed_skipped} already completed jobs skipped")
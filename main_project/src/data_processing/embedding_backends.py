@@ -0,0 +1,143 @@
+import re
+from pathlib import Path
+from profiling import profiled
+
+'''
+    Pluggable embedding backends. Every backend has a model_name (used in cache paths), a cache_key
+    (model_name plus any setting that changes the vectors, used in embedding cache keys, so vectors
+    from different models or settings never mix) and embed(texts), which returns one vector or None
+    per text, in input order.
+
+    openai: text-embedding-ada-002 through the OpenAI API (openai_embeddings.OpenAIEmbeddingBackend)
+    local:  a Hugging Face encoder run on the CPU, fully offline once the model is downloaded
+'''
+
+DEFAULT_LOCAL_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+def local_cache_key(model_name, max_length, truncation, quantize):
+    """Cache key of a local encoder: int8 and fp32 weights, truncation and max_length all change the vectors"""
+    return f"{model_name}|len={max_length}|trunc={truncation}|{'int8' if quantize else 'fp32'}"
+
+class EmbeddingBackend:
+    model_name = None
+
+    def embed(self, texts):
+        """Return one embedding (or None on failure / empty text) per text, in input order"""
+        raise NotImplementedError
+
+    @property
+    def cache_key(self):
+        """Model identifier for EmbeddingCache keys"""
+        return self.model_name
+
+    def cache_dir(self, root="cache"):
+        """Per-model directory for the embedding cache and job index"""
+        return Path(root) / re.sub(r"[^A-Za-z0-9._-]+", "_", self.model_name)
+
+class LocalTransformerBackend(EmbeddingBackend):
+    """
+    Mean-pooled embeddings from a local transformer encoder.
+    Inputs are sorted by token count and padded only to the longest text of their batch (instead of a
+    fixed max_length), and inference runs under torch.no_grad. torch and transformers are imported and
+    the model is loaded on first use. With local_files_only=True no network access is attempted.
+
+    truncation decides what is kept of texts longer than max_length tokens:
+    "head" keeps the start, "tail" the end, "head_tail" the first quarter and last three quarters.
+    quantize=True applies int8 dynamic quantization to the Linear layers (CPU only).
+    """
+    TRUNCATION_STRATEGIES = ("head", "tail", "head_tail")
+
+    def __init__(self, model_name=DEFAULT_LOCAL_MODEL, batch_size=32, max_length=512, local_files_only=False,
+                 num_threads=None, truncation="head", quantize=False):
+        if truncation not in self.TRUNCATION_STRATEGIES:
+            raise ValueError(f"Unknown truncation strategy: {truncation}")
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.max_length = max_length
+        self.requested_max_length = max_length
+        self.local_files_only = local_files_only
+        self.num_threads = num_threads
+        self.truncation = truncation
+        self.quantize = quantize
+        self.model = None
+        self.tokenizer = None
+
+    @property
+    def cache_key(self):
+        # Uses the requested max_length, which load() may lower to the model's limit
+        return local_cache_key(self.model_name, self.requested_max_length, self.truncation, self.quantize)
+
+    def load(self):
+        if self.model is None:
+            import torch
+            from transformers import AutoModel, AutoTokenizer
+            if self.num_threads:
+                torch.set_num_threads(self.num_threads)
+            self.tokenizer = AutoTokenizer.from_pretrained(self.model_name, local_files_only=self.local_files_only)
+            model = AutoModel.from_pretrained(self.model_name, local_files_only=self.local_files_only)
+            model.eval()
+            if self.quantize:
+                model = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+            self.model = model
+            # The model's own position limit caps max_length (e.g. 512 for BERT, 4096 for BigBird)
+            self.max_length = min(self.max_length, getattr(model.config, "max_position_embeddings", self.max_length))
+        return self.model
+
+    def _truncate(self, token_ids):
+        """Cut token_ids (with special tokens) to max_length, keeping the leading/trailing special tokens"""
+        if len(token_ids) <= self.max_length:
+            return token_ids
+        special = set(self.tokenizer.all_special_ids)
+        lead = 0
+        while lead < len(token_ids) and token_ids[lead] in special:
+            lead += 1
+        trail = 0
+        while trail < len(token_ids) - lead and token_ids[-1 - trail] in special:
+            trail += 1
+        prefix, content, suffix = token_ids[:lead], token_ids[lead:len(token_ids) - trail], token_ids[len(token_ids) - trail:]
+        budget = self.max_length - lead - trail
+        if self.truncation == "head":
+            content = content[:budget]
+        elif self.truncation == "tail":
+            content = content[len(content) - budget:]
+        else:
+            head = budget // 4
+            content = content[:head] + content[len(content) - (budget - head):]
+        return prefix + content + suffix
+
+    @profiled()
+    def embed(self, texts):
+        import torch
+        self.load()
+        embeddings = [None] * len(texts)
+        indices = [i for i, text in enumerate(texts) if text and text.strip()]
+        # Tokenize once without truncation so every strategy can pick which tokens to keep
+        encoded = self.tokenizer([texts[i] for i in indices], truncation=False, verbose=False)["input_ids"]
+        token_ids = {i: self._truncate(ids) for i, ids in zip(indices, encoded)}
+        # Similar lengths share a batch, so dynamic padding adds little waste
+        indices.sort(key=lambda i: len(token_ids[i]))
+
+        with torch.no_grad():
+            for start in range(0, len(indices), self.batch_size):
+                batch_indices = indices[start:start + self.batch_size]
+                inputs = self.tokenizer.pad(
+                    {"input_ids": [token_ids[i] for i in batch_indices]},
+                    padding="longest",
+                    return_tensors="pt",
+                )
+                hidden = self.model(**inputs).last_hidden_state
+                mask = inputs["attention_mask"].unsqueeze(-1).to(hidden.dtype)
+                pooled = (hidden * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1)
+                for i, vector in zip(batch_indices, pooled.float().numpy()):
+                    embeddings[i] = vector
+        return embeddings
+
+def get_backend(name, **kwargs):
+    """Create a backend by name ("openai" or "local")"""
+    if name == "openai":
+        # Imported here so the local backend never needs the OpenAI client
+        from openai_embeddings import OpenAIEmbeddingBackend
+        return OpenAIEmbeddingBackend(**kwargs)
+    if name == "local":
+        return LocalTransformerBackend(**kwargs)
+    raise ValueError(f"Unknown embedding backend: {name}")
@@ -0,0 +1,119 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+from profiling import profiled
+
+class EmbeddingCache:
+    """
+    Persistent, content-addressed embedding store.
+    Keys are sha256(model, normalized text); vectors are appended as float32 rows to
+    vectors.f32 and the matching 32-byte keys to keys.bin, so both files are append-only
+    and row i of one belongs to row i of the other.
+    """
+    KEY_SIZE = 32
+
+    def __init__(self, directory="cache/embeddings"):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.meta_path = self.directory / "meta.json"
+        self.keys_path = self.directory / "keys.bin"
+        self.vectors_path = self.directory / "vectors.f32"
+        self.dim = None
+        self.index = {}
+        self.hits = 0
+        self.misses = 0
+        self._vectors = None
+        self._load()
+
+    @staticmethod
+    def normalize(text):
+        """Collapse whitespace so formatting-only changes hit the same entry"""
+        return " ".join(text.split())
+
+    @classmethod
+    def make_key(cls, model, text):
+        return hashlib.sha256(f"{model}\0{cls.normalize(text)}".encode("utf-8")).digest()
+
+    def _load(self):
+        if not self.meta_path.exists():
+            return
+        self.dim = json.loads(self.meta_path.read_text())["dim"]
+        keys = self.keys_path.read_bytes() if self.keys_path.exists() else b""
+        row_bytes = self.dim * 4
+        vector_rows = self.vectors_path.stat().st_size // row_bytes if self.vectors_path.exists() else 0
+        # An interrupted append can leave one file longer than the other; only trust complete pairs,
+        # and cut both files back to them so the next append lines up row for row again
+        rows = min(len(keys) // self.KEY_SIZE, vector_rows)
+        if len(keys) != rows * self.KEY_SIZE:
+            os.truncate(self.keys_path, rows * self.KEY_SIZE)
+        if self.vectors_path.exists() and self.vectors_path.stat().st_size != rows * row_bytes:
+            os.truncate(self.vectors_path, rows * row_bytes)
+        self.index = {keys[i * self.KEY_SIZE:(i + 1) * self.KEY_SIZE]: i for i in range(rows)}
+
+    def _matrix(self):
+        """Memory-mapped view of every stored vector (re-mapped after appends)"""
+        rows = len(self.index)
+        if self._vectors is None or self._vectors.shape[0] != rows:
+            self._vectors = np.memmap(self.vectors_path, dtype=np.float32, mode="r", shape=(rows, self.dim)) if rows else None
+        return self._vectors
+
+    def get_many(self, keys):
+        """Return a list with the cached vector (float32 array) or None for each key"""
+        rows = [self.index.get(key) for key in keys]
+        found = [row for row in rows if row is not None]
+        self.hits += len(found)
+        self.misses += len(rows) - len(found)
+        if not found:
+            return [None] * len(rows)
+        vectors = np.asarray(self._matrix()[found])
+        found_iter = iter(vectors)
+        return [next(found_iter) if row is not None else None for row in rows]
+
+    def put_many(self, keys, vectors):
+        """Append new vectors; keys already stored are skipped"""
+        new = [(key, vector) for key, vector in zip(keys, vectors) if vector is not None and key not in self.index]
+        if not new:
+            return
+        matrix = np.asarray([vector for _, vector in new], dtype=np.float32)
+        if self.dim is None:
+            self.dim = matrix.shape[1]
+            self.meta_path.write_text(json.dumps({"dim": self.dim}))
+        if matrix.shape[1] != self.dim:
+            raise ValueError(f"Embedding dimension {matrix.shape[1]} does not match cache dimension {self.dim}")
+        with open(self.vectors_path, "ab") as f:
+            f.write(matrix.tobytes())
+        with open(self.keys_path, "ab") as f:
+            f.write(b"".join(key for key, _ in new))
+        for key, _ in new:
+            self.index[key] = len(self.index)
+
+    @profiled()
+    def get_or_embed(self, texts, model, embed_fn):
+        """
+        Return one vector (or None on failure) per text, in input order.
+        Only cache misses are passed to embed_fn, which takes a list of texts and returns a list of vectors.
+        """
+        keys = [self.make_key(model, text) for text in texts]
+        vectors = self.get_many(keys)
+
+        # Embed each distinct missing text once, even if it appears several times in texts
+        missing = {}
+        for i, (key, vector) in enumerate(zip(keys, vectors)):
+            if vector is None:
+                missing.setdefault(key, []).append(i)
+        if missing:
+            miss_keys = list(missing)
+            new_vectors = embed_fn([texts[missing[key][0]] for key in miss_keys])
+            self.put_many(miss_keys, new_vectors)
+            for key, vector in zip(miss_keys, new_vectors):
+                for i in missing[key]:
+                    vectors[i] = np.asarray(vector, dtype=np.float32) if vector is not None else None
+        return vectors
+
+    def report(self):
+        lookups = self.hits + self.misses
+        hit_rate = self.hits / lookups * 100 if lookups else 0.0
+        return f"Embedding cache: {self.hits} hits, {self.misses} misses ({hit_rate:.1f}% hit rate, {len(self.index)} stored)"
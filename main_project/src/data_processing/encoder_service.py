@@ -0,0 +1,92 @@
+import multiprocessing
+
+from embedding_backends import EmbeddingBackend, LocalTransformerBackend, local_cache_key
+
+BIGBIRD_MODEL = "google/bigbird-roberta-base"
+
+def _serve(conn, backend_kwargs):
+    """Worker process loop: load the model once, then answer ("embed", texts) requests until ("stop", None)"""
+    backend = LocalTransformerBackend(**backend_kwargs)
+    try:
+        backend.load()
+        conn.send(("ready", None))
+    except Exception as e:
+        conn.send(("error", f"{type(e).__name__}: {e}"))
+        return
+    while True:
+        command, payload = conn.recv()
+        if command == "stop":
+            break
+        try:
+            conn.send(("ok", backend.embed(payload)))
+        except Exception as e:
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+
+class EncoderService(EmbeddingBackend):
+    """
+    Long-lived text encoder (BigBird by default, for long job descriptions) that loads its model once.
+    With in_worker=True the model lives in a separate process, which stays warm between calls
+    and keeps the model's memory out of the caller. Other keyword arguments go to LocalTransformerBackend
+    (batch_size, max_length, truncation, quantize, local_files_only, ...).
+    """
+    def __init__(self, model_name=BIGBIRD_MODEL, in_worker=False, **backend_kwargs):
+        backend_kwargs.setdefault("max_length", 4096)
+        backend_kwargs.setdefault("batch_size", 4)
+        self.model_name = model_name
+        self.in_worker = in_worker
+        self.backend_kwargs = dict(backend_kwargs, model_name=model_name)
+        self.backend = None
+        self.process = None
+        self.conn = None
+
+    @property
+    def cache_key(self):
+        kwargs = self.backend_kwargs
+        return local_cache_key(self.model_name, kwargs["max_length"], kwargs.get("truncation", "head"), kwargs.get("quantize", False))
+
+    def start(self):
+        """Load the model (in this process or in the worker); called automatically on first use"""
+        if self.in_worker:
+            if self.process is None:
+                context = multiprocessing.get_context("spawn")
+                self.conn, child_conn = context.Pipe()
+                self.process = context.Process(target=_serve, args=(child_conn, self.backend_kwargs), daemon=True)
+                self.process.start()
+                status, error = self.conn.recv()
+                if status != "ready":
+                    self.close()
+                    raise RuntimeError(f"Encoder worker failed to start: {error}")
+        elif self.backend is None:
+            self.backend = LocalTransformerBackend(**self.backend_kwargs)
+            self.backend.load()
+        return self
+
+    def embed(self, texts):
+        self.start()
+        if not self.in_worker:
+            return self.backend.embed(texts)
+        self.conn.send(("embed", list(texts)))
+        status, payload = self.conn.recv()
+        if status != "ok":
+            raise RuntimeError(f"Encoder worker error: {payload}")
+        return payload
+
+    def encode(self, resume_texts, job_texts):
+        """Embed resumes and job descriptions in one batched call; returns (resume_embeddings, job_embeddings)"""
+        embeddings = self.embed(list(resume_texts) + list(job_texts))
+        return embeddings[:len(resume_texts)], embeddings[len(resume_texts):]
+
+    def close(self):
+        if self.process is not None:
+            if self.process.is_alive():
+                self.conn.send(("stop", None))
+                self.process.join(timeout=10)
+            self.process = None
+            self.conn = None
+        self.backend = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,67 @@
+import itertools
+import numbers
+
+# xlsxwriter refuses more hyperlinks than this per worksheet and URLs longer than MAX_URL_LENGTH;
+# past either limit the URL is written as plain text
+MAX_URLS_PER_SHEET = 65530
+MAX_URL_LENGTH = 2079
+
+def cell_text(value):
+    """Text written for a non-numeric cell; lists (e.g. Skills) become comma-separated"""
+    if isinstance(value, (list, tuple, set)):
+        return ", ".join(str(item) for item in value)
+    return str(value)
+
+def column_widths(records, columns, padding=2, max_width=80):
+    """Column widths from the longest header or cell text in records (usually a sample)"""
+    widths = [len(str(column)) for column in columns]
+    for record in records:
+        for i, column in enumerate(columns):
+            value = record.get(column)
+            if value is not None:
+                widths[i] = max(widths[i], len(cell_text(value)))
+    return [min(width + padding, max_width) for width in widths]
+
+def write_excel(records, path, columns=None, url_column="Apply URL", width_sample=1000, sheet_name="Sheet1"):
+    """
+    Stream records (dicts) into an .xlsx file in one pass and return the number of rows written.
+    xlsxwriter's constant_memory mode flushes each row to disk once the next row starts, so memory stays
+    flat however many records there are; records may be a generator. Column widths are taken from the
+    first width_sample records, and url_column cells are written as hyperlinks as their row is written.
+    columns defaults to the keys of the sampled records, in first-seen order.
+    """
+    import xlsxwriter
+
+    records = iter(records)
+    sample = list(itertools.islice(records, width_sample))
+    if columns is None:
+        columns = list(dict.fromkeys(key for record in sample for key in record))
+
+    workbook = xlsxwriter.Workbook(str(path), {"constant_memory": True, "nan_inf_to_errors": True})
+    worksheet = workbook.add_worksheet(sheet_name)
+    header_format = workbook.add_format({"bold": True, "border": 1, "align": "center", "valign": "top"})
+    link_format = workbook.add_format({"font_color": "blue", "underline": True})
+
+    for i, width in enumerate(column_widths(sample, columns)):
+        worksheet.set_column(i, i, width)
+    for i, column in enumerate(columns):
+        worksheet.write_string(0, i, str(column), header_format)
+
+    url_index = columns.index(url_column) if url_column in columns else None
+    urls_written = 0
+    row = 0
+    for row, record in enumerate(itertools.chain(sample, records), start=1):
+        for i, column in enumerate(columns):
+            value = record.get(column)
+            if value is None:
+                continue
+            if i == url_index and value != "N/A" and urls_written < MAX_URLS_PER_SHEET and len(value) <= MAX_URL_LENGTH:
+                worksheet.write_url(row, i, value, link_format, value)
+                urls_written += 1
+            elif isinstance(value, numbers.Number) and not isinstance(value, bool):
+                worksheet.write_number(row, i, value)
+            else:
+                # write_string skips xlsxwriter's type sniffing and never turns text into formulas
+                worksheet.write_string(row, i, cell_text(value))
+    workbook.close()
+    return row
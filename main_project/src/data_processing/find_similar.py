@@ -0,0 +1,62 @@
+import argparse
+import time
+from pathlib import Path
+
+from vector_index import IVFIndex
+from embedding_backends import DEFAULT_LOCAL_MODEL, get_backend
+from embedding_cache import EmbeddingCache
+
+'''
+    Interactive "find similar jobs" over every posting embedded so far (cache/<model>/job_index.npz,
+    filled by job_search_embedding.py). Query by a stored posting or by a text file such as a resume.
+    Use the same --backend as the run that built the index.
+
+    python find_similar.py --job-id 4145512345
+    python find_similar.py --text-file resume.txt --k 20
+'''
+
+def main():
+    parser = argparse.ArgumentParser(description="Find postings similar to a job or a resume")
+    query = parser.add_mutually_exclusive_group(required=True)
+    query.add_argument("--job-id", help="ID of a posting already in the index")
+    query.add_argument("--text-file", help="text file to embed and search with (e.g. a resume)")
+    parser.add_argument("--backend", choices=["openai", "local"], default="openai", help="embedding backend the index was built with")
+    parser.add_argument("--local-model", default=DEFAULT_LOCAL_MODEL, help="Hugging Face model for --backend local")
+    parser.add_argument("--index", default=None, help="index file (default: the backend's cache directory)")
+    parser.add_argument("--k", type=int, default=10, help="number of results")
+    parser.add_argument("--nprobe", type=int, default=None, help="lists to scan (more is slower but more accurate)")
+    parser.add_argument("--exact", action="store_true", help="brute-force search instead of the IVF lists")
+    args = parser.parse_args()
+
+    backend = get_backend("local", model_name=args.local_model) if args.backend == "local" else get_backend("openai")
+    index_path = Path(args.index) if args.index else backend.cache_dir() / "job_index.npz"
+    if not index_path.exists():
+        print(f"No index at {index_path}; run job_search_embedding.py first")
+        return
+    index = IVFIndex.load(index_path)
+
+    if args.job_id:
+        row = index.row_of.get(args.job_id)
+        if row is None:
+            print(f"Job {args.job_id} is not in the index")
+            return
+        vector = index.vectors[row]
+    else:
+        text = Path(args.text_file).read_text(encoding="utf-8")
+        embedding_cache = EmbeddingCache(backend.cache_dir() / "embeddings")
+        vector = embedding_cache.get_or_embed([text], backend.cache_key, backend.embed)[0]
+        if vector is None:
+            print("Could not embed the query text")
+            return
+
+    start = time.perf_counter()
+    results = index.search(vector, k=args.k + 1 if args.job_id else args.k, nprobe=args.nprobe, exact=args.exact)
+    elapsed = (time.perf_counter() - start) * 1000
+    results = [result for result in results if result[0] != args.job_id][:args.k]
+
+    for job_id, score, meta in results:
+        print(f"{score:6.2f}%  {job_id:>12}  {meta.get('title', 'N/A')} @ {meta.get('company', 'N/A')}  {meta.get('apply_url', '')}")
+    print(f"{len(results)} results from {index.count()} postings in {elapsed:.1f}ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+class JobCache:
+    """
+    On-disk cache of raw get_job payloads keyed by job ID (SQLite).
+    Entries older than ttl_days are treated as misses; the least recently used entries
+    are evicted once the cache holds more than max_entries.
+    """
+    def __init__(self, path="cache/job_details.db", ttl_days=7, max_entries=50000, flush_every=1000):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl_days * 86400 if ttl_days is not None else None
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # IDs whose entry expired during this run; re-fetching them is a refresh rather than a new posting
+        self.stale_ids = set()
+        # accessed_at of cache hits, written in one batch (on put, every flush_every hits, and on close)
+        # instead of an UPDATE and a commit per hit
+        self.flush_every = flush_every
+        self.pending_access = {}
+        # The connection is shared by the fetcher threads, so every access goes through the lock
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "job_id TEXT PRIMARY KEY, payload TEXT NOT NULL, stored_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_accessed ON jobs (accessed_at)")
+        self.conn.commit()
+
+    def get(self, job_id):
+        """Return the cached payload for job_id, or None on a miss or expired entry"""
+        job_id = str(job_id)
+        now = time.time()
+        with self.lock:
+            row = self.conn.execute("SELECT payload, stored_at FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            payload, stored_at = row
+            if self.ttl is not None and now - stored_at > self.ttl:
+                self.conn.execute("DELETE FROM jobs WHERE job_id = ?", (job_id,))
+                self.conn.commit()
+                self.evictions += 1
+                self.misses += 1
+                self.stale_ids.add(job_id)
+                return None
+            self.pending_access[job_id] = now
+            if len(self.pending_access) >= self.flush_every:
+                self._flush_access()
+                self.conn.commit()
+            self.hits += 1
+        return json.loads(payload)
+
+    def peek(self, job_id):
+        """Return the stored payload for job_id (expired or not) without counting a lookup or touching LRU order"""
+        with self.lock:
+            row = self.conn.execute("SELECT payload FROM jobs WHERE job_id = ?", (str(job_id),)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def is_stale(self, job_id):
+        """True if job_id was cached before but its entry had expired"""
+        return str(job_id) in self.stale_ids
+
+    def put(self, job_id, payload):
+        """Store a payload; empty payloads (failed fetches) are not cached"""
+        if not payload:
+            return
+        now = time.time()
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO jobs (job_id, payload, stored_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (str(job_id), json.dumps(payload, ensure_ascii=False), now, now),
+            )
+            # Eviction goes by accessed_at, so this run's hits are written first
+            self._flush_access()
+            self._evict_over_size()
+            self.conn.commit()
+
+    def _flush_access(self):
+        if self.pending_access:
+            self.conn.executemany(
+                "UPDATE jobs SET accessed_at = ? WHERE job_id = ?",
+                [(accessed_at, job_id) for job_id, accessed_at in self.pending_access.items()],
+            )
+            self.pending_access.clear()
+
+    def _evict_over_size(self):
+        if self.max_entries is None:
+            return
+        (count,) = self.conn.execute("SELECT COUNT(*) FROM jobs").fetchone()
+        excess = count - self.max_entries
+        if excess > 0:
+            self.conn.execute(
+                "DELETE FROM jobs WHERE job_id IN (SELECT job_id FROM jobs ORDER BY accessed_at LIMIT ?)", (excess,)
+            )
+            self.evictions += excess
+
+    def purge_expired(self):
+        """Delete every expired entry"""
+        if self.ttl is None:
+            return
+        with self.lock:
+            cursor = self.conn.execute("DELETE FROM jobs WHERE stored_at < ?", (time.time() - self.ttl,))
+            self.evictions += cursor.rowcount
+            self.conn.commit()
+
+    def report(self):
+        """One-line summary of cache activity for the end of a run"""
+        lookups = self.hits + self.misses
+        hit_rate = self.hits / lookups * 100 if lookups else 0.0
+        return (f"Job cache: {self.hits} hits, {self.misses} misses, {self.evictions} evictions "
+                f"({hit_rate:.1f}% hit rate, {self.hits} API calls saved)")
+
+    def close(self):
+        with self.lock:
+            self._flush_access()
+            self.conn.commit()
+            self.conn.close()
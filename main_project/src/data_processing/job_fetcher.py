@@ -0,0 +1,78 @@
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from profiling import count, timed
+
+class RateLimiter:
+    """Spaces calls so that at most 'rate' of them start per second (shared across threads)"""
+    def __init__(self, rate=None):
+        self.interval = 1.0 / rate if rate else 0.0
+        self.next_time = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next_time)
+            self.next_time = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+def fetch_with_retry(fetch, job_id, limiter, retries=3, backoff=1.0):
+    """Call fetch(job_id), retrying with exponential backoff (backoff, 2*backoff, ...) on errors"""
+    for attempt in range(retries + 1):
+        limiter.wait()
+        try:
+            with timed("fetch.get_job"):
+                return fetch(job_id)
+        except Exception as e:
+            count("fetch.errors")
+            if attempt == retries:
+                print(f"Error getting job details for {job_id}: {e}")
+                return {}
+            time.sleep(backoff * 2 ** attempt)
+
+def fetch_job_details(fetch, job_ids, max_workers=8, rate_limit=None, retries=3, backoff=1.0, cache=None):
+    """
+    Fetch job details concurrently with a bounded thread pool.
+    fetch is any callable taking a job ID (e.g. Linkedin.get_job).
+    job_ids may be any iterable (including a generator); it is consumed lazily, keeping at most
+    2 * max_workers fetches in flight.
+    rate_limit caps requests started per second across all workers (None for no cap).
+    cache is an optional JobCache: hits are yielded without a request and fetched payloads are stored.
+    Yields (job_id, details) pairs as they complete; failed jobs yield {} after the last retry.
+    """
+    limiter = RateLimiter(rate_limit)
+    job_ids = iter(job_ids)
+    exhausted = False
+    in_flight = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            while True:
+                while not exhausted and len(in_flight) < 2 * max_workers:
+                    job_id = next(job_ids, None)
+                    if job_id is None:
+                        exhausted = True
+                        break
+                    cached = cache.get(job_id) if cache is not None else None
+                    if cached is not None:
+                        count("fetch.cache_hits")
+                        yield job_id, cached
+                        continue
+                    future = executor.submit(fetch_with_retry, fetch, job_id, limiter, retries, backoff)
+                    in_flight[future] = job_id
+                if not in_flight:
+                    break
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job_id = in_flight.pop(future)
+                    details = future.result()
+                    if cache is not None:
+                        cache.put(job_id, details)
+                    yield job_id, details
+        finally:
+            # Stop queued fetches if the caller stops iterating early
+            for future in in_flight:
+                future.cancel()
@@ -1,50 +1,42 @@
-from linkedin_api import Linkedin
-from dotenv import load_dotenv
+import argparse
 import os
-import pandas as pd
 import json
 from pathlib import Path
-import openai
 import re
 from datetime import datetime
 from data_extraction import process_job_description
+from job_cache import JobCache
+from linkedin_client import LinkedinClient
+from pipeline import company_name_of, max_age_cutoff, max_age_stage, search_stage, poll_stage, dedupe_stage, fetch_stage, near_duplicate_stage, description_archive_stage, process_stage, jsonl_sink, read_jsonl, completed_job_ids
+from dedupe import JobDeduplicator
+from results_store import ResultsStore
+from polling import PollState, Poller
+from llm_scoring import MATCH_MODEL, MatchCache, MatchScorer, StubLLMClient, build_messages, select_candidates, skill_overlap_scores
+from resume_ingest import ResumeStore
+from excel_export import write_excel
+from profiling import timed, add_profile_arguments, start_profiling, finish_profiling
 
-# Load environment variables
-load_dotenv()
+# Load environment variables from .env; without python-dotenv (e.g. offline benchmarks) only the real environment is used
+try:
+    from dotenv import load_dotenv
+    load_dotenv()
+except ImportError:
+    pass
 
-class JobSearch:
-    def __init__(self):
-        self.usrname = os.getenv("LINKEDIN_USERNAME")
-        self.pwd = os.getenv("LINKEDIN_PASSWORD")
+class JobSearch(LinkedinClient):
+    def __init__(self, api=None, cache=None):
+        super().__init__(api=api, cache=cache)
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
-        self.api = Linkedin(self.usrname, self.pwd)
-        openai.api_key = self.openai_api_key
-
-    def search_jobs(self, search_param):
-        """Search for jobs on LinkedIn"""
-        try:
-            return self.api.search_jobs(**search_param)
-        except Exception as e:
-            print(f"Error searching for jobs: {e}")
-            return []
-    
-    def get_job_details_by_id(self, job_id):
-        """Get job details by job ID"""
-        try:
-            return self.api.get_job(job_id)
-        except Exception as e:
-            print(f"Error getting job details: {e}")
-            return {}
 
     def match_resume_with_job(self, job_desc, resume_text):
         """Uses OpenAI to calculate match percentage between job description and resume"""
         try:
+            # One blocking call per job; use llm_scoring.MatchScorer to score many jobs concurrently with a cache
+            import openai
+            openai.api_key = self.openai_api_key
             response = openai.chat.completions.create(
-                model="gpt-4o-mini",
-                messages = [
-                    {"role": "system", "content": "You are a job matching AI. Your task is to analyze the similarity between a job description and a resume. Respond with a single integer between 0 and 100, representing the match percentage. Do not include a % symbol, explanation, or any other text."},
-                    {"role": "user", "content": f"Evaluate the match percentage between this job description and resume:\n\nJob Description:\n{job_desc}\n\nResume:\n{resume_text}\n\nReturn only a number from 0 to 100."}
-                ]
+                model=MATCH_MODEL,
+                messages=build_messages(job_desc, resume_text)
             )
             output = response.choices[0].message.content.strip()
             return int(output) if output.isdigit() else "Unknown"
@@ -53,18 +45,106 @@ class JobSearch:
             return "Error"
     
     def filter_job_by_date(self, jobs, days=1):
-        """Filter jobs by date posted (within the last 'days' days)"""
-        current_time = datetime.now()
-        filtered_jobs = []
-        for job in jobs:
-            listed_time = job.get('listedAt', 'N/A')
-            if listed_time != 'N/A':
-                listed_time = datetime.fromtimestamp(int(listed_time)/1000)
-                if (current_time - listed_time).days <= days:
-                    filtered_jobs.append(job)
-        return filtered_jobs
+        """Filter jobs by date posted (within the last 'days' days; the same cutoff as --max-age-days and polling)"""
+        return list(max_age_stage(jobs, max_age_cutoff(days)))
+
+BLACK_LIST = ["Revature", "BeaconFire Inc.", "BeaconFire Solution Inc.", "Canoical", "SynergisticIT"]
+
+def build_job_record(job_id, details):
+    """Build the output record for one job from its get_job payload (None for blacklisted companies)"""
+    # Extract metadata directly from LinkedIn API
+    job_title = details.get('title', 'N/A')
+    company = company_name_of(details)
+
+    # filter out unwanted company
+    if company in BLACK_LIST:
+        return None
+
+    company_linkedin_url = details.get('companyDetails', {}).get('com.linkedin.voyager.deco.jobs.web.shared.WebCompactJobPostingCompany', {}).get('companyResolutionResult', {}).get('url', 'N/A')
+    location = details.get('formattedLocation', 'N/A')
+    workplace_type = details.get('workplaceTypesResolutionResults', {}).get('urn:li:fs_workplaceType:2', {}).get('localizedName', 'N/A')
+    job_desc = details.get('description', {}).get('text', '')
+    listed_time = details.get('listedAt', 'N/A')
+
+    # print(job_desc)
+
+    # Convert Unix timestamp (milliseconds) to readable date
+    if listed_time != 'N/A':
+        listed_time = datetime.fromtimestamp(int(listed_time)/1000).strftime('%Y-%m-%d %H:%M')
+
+    # Extract apply URL (Easy Apply or External)
+    apply_method = details.get('applyMethod', {}).get('com.linkedin.voyager.jobs.OffsiteApply', {}) or details.get('applyMethod', {}).get('com.linkedin.voyager.jobs.ComplexOnsiteApply', {})
+    apply_url = apply_method.get('companyApplyUrl', company_linkedin_url)
+
+    job_state = details.get('jobState', 'N/A')
+
+    ## Match resume with job description
+    # match_percentage = job_search.match_resume_with_job(job_desc, resume_text)
+    job_data = process_job_description(job_desc)
+
+    print("job_data", job_data)
+
+    # Extracted job details
+    return {
+        "Job ID": job_id,
+        "Listed Date": listed_time,
+        "Job Title": job_title,
+        "Company": company,
+        "Location": location,
+        "Workplace Type": workplace_type,
+        "Skills": job_data.get("skills"),
+        "Experience Level": job_data.get("experience_level"),
+        "Salary": job_data.get("salary"),
+        "Apply URL": apply_url,
+        # "Job State": job_state,
+        "Salary": job_data.get("salary"),
+        # "Match Level (%)": match_percentage
+    }
+
+def add_llm_match_scores(records, resume, description_of, scorer, top_n=20):
+    """
+    Add "Match Level (%)" to the top_n records by skill overlap with the resume, scored by the LLM.
+    description_of(job_id) returns a job's description text; the other records get None.
+    """
+    for record in records:
+        record["Match Level (%)"] = None
+    overlap = skill_overlap_scores(resume["skills"], [record.get("Skills") or [] for record in records])
+    descriptions = {i: description_of(records[i]["Job ID"]) for i in select_candidates(overlap, top_n)}
+    candidates = [i for i, description in descriptions.items() if description]
+    scores = scorer.score_many(resume["text"], [descriptions[i] for i in candidates])
+    for i, score in zip(candidates, scores):
+        records[i]["Match Level (%)"] = score
+    return records
+
+def export_results(job_results, output_dir):
+    """Write job results to job_data.json and job_data.xlsx (with clickable apply links)"""
+    # Save data
+    json_path = output_dir / "job_data.json"
+    with timed("export.json"), open(json_path, "w", encoding="utf-8") as f:
+        json.dump(job_results, f, indent=4, ensure_ascii=False)
+
+    # Save to Excel with hyperlinks, streamed row by row
+    with timed("export.excel"):
+        write_excel(job_results, output_dir / "job_data.xlsx")
+
+    print(f"Data saved successfully to:\n- {json_path}\n- {output_dir / 'job_data.xlsx'}")
 
 def main():
+    parser = argparse.ArgumentParser(description="Search LinkedIn jobs and extract skills, experience and salary")
+    parser.add_argument("--resume", action="store_true", help="continue an interrupted run from output/job_data.jsonl")
+    parser.add_argument("--keep-reposts", action="store_true", help="do not drop reposts with identical company, title and description")
+    parser.add_argument("--poll", action="store_true",
+                        help="only fetch postings listed since the last --poll run (for scheduled runs)")
+    parser.add_argument("--max-age-days", type=float, default=None, help="skip postings listed longer ago than this")
+    parser.add_argument("--match-resume", default=None,
+                        help="resume (.pdf, .json or .txt) to score the best jobs against with the LLM")
+    parser.add_argument("--match-top", type=int, default=20, help="how many jobs (by skill overlap) get an LLM score")
+    parser.add_argument("--match-stub", action="store_true", help="use the offline stub LLM client instead of OpenAI")
+    parser.add_argument("--export-all", action="store_true", help="export every archived job, not just this run's")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    start_profiling(args)
+
     search_params = {
         "keywords": "Software Engineer",
         "location_name": "United States",
@@ -91,114 +171,71 @@ def main():
     }
     
     # resume_text = Path("main_project/resume.json").read_text()  # Load user's resume
-    job_search = JobSearch()
-    jobs = []
-    jobs.extend(job_search.search_jobs(search_params))
-    jobs.extend(job_search.search_jobs(search_params2))
-    jobs.extend(job_search.search_jobs(search_params3))
-    
-    job_results = []
-
-    for job in jobs:
-        job_id = job["entityUrn"].split(":")[-1]
-        details = job_search.get_job_details_by_id(job_id)
-        
-        # print(details)
-        
-        # Extract metadata directly from LinkedIn API
-        job_title = details.get('title', 'N/A')
-        company = details.get('companyDetails', {}).get('com.linkedin.voyager.deco.jobs.web.shared.WebCompactJobPostingCompany', {}).get('companyResolutionResult', {}).get('name', 'N/A')
-        
-        # filter out unwanted company
-        black_list = ["Revature", "BeaconFire Inc.", "BeaconFire Solution Inc.", "Canoical", "SynergisticIT"]
-        if company in black_list:
-            continue
-        
-        company_linkedin_url = details.get('companyDetails', {}).get('com.linkedin.voyager.deco.jobs.web.shared.WebCompactJobPostingCompany', {}).get('companyResolutionResult', {}).get('url', 'N/A')
-        location = details.get('formattedLocation', 'N/A')
-        workplace_type = details.get('workplaceTypesResolutionResults', {}).get('urn:li:fs_workplaceType:2', {}).get('localizedName', 'N/A')
-        job_desc = details.get('description', {}).get('text', '')
-        listed_time = details.get('listedAt', 'N/A')
-        
-        # print(job_desc)
-
-        # Convert Unix timestamp (milliseconds) to readable date
-        if listed_time != 'N/A':
-            listed_time = datetime.fromtimestamp(int(listed_time)/1000).strftime('%Y-%m-%d %H:%M')
-
-        # Extract apply URL (Easy Apply or External)
-        apply_method = details.get('applyMethod', {}).get('com.linkedin.voyager.jobs.OffsiteApply', {}) or details.get('applyMethod', {}).get('com.linkedin.voyager.jobs.ComplexOnsiteApply', {})
-        apply_url = apply_method.get('companyApplyUrl', company_linkedin_url)
-        
-        job_state = details.get('jobState', 'N/A')
-        
-        ## Match resume with job description
-        # match_percentage = job_search.match_resume_with_job(job_desc, resume_text)
-        job_data = process_job_description(job_desc)
-        
-        print("job_data", job_data)
-
-        # Store extracted job details
-        job_results.append({
-            "Listed Date": listed_time,
-            "Job Title": job_title,
-            "Company": company,
-            "Location": location,
-            "Workplace Type": workplace_type,
-            "Skills": job_data.get("skills"),
-            "Experience Level": job_data.get("experience_level"),
-            "Salary": job_data.get("salary"),
-            "Apply URL": apply_url,
-            # "Job State": job_state,
-            "Salary": job_data.get("salary"),
-            # "Match Level (%)": match_percentage
-        })
-    
-    # Convert to DataFrame and save results
-    df = pd.DataFrame(job_results)
+    job_search = JobSearch(cache=JobCache())
 
     output_dir = Path("output")
     output_dir.mkdir(exist_ok=True)
+    jsonl_path = output_dir / "job_data.jsonl"
 
-    # Save data
-    json_path = output_dir / "job_data.json"
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(job_results, f, indent=4, ensure_ascii=False)
+    # Records are appended as they are processed; --resume skips jobs already written
+    completed = completed_job_ids(jsonl_path) if args.resume else set()
+    if not args.resume:
+        jsonl_path.write_text("", encoding="utf-8")
+    print(f"Resuming after {len(completed)} completed jobs" if args.resume else "Starting a new run")
 
-    # Save to Excel with hyperlinks
-    writer = pd.ExcelWriter(output_dir / "job_data.xlsx", engine='xlsxwriter')
-    df.to_excel(writer, index=False)
-    
-    # Get the xlsxwriter workbook and worksheet objects
-    workbook = writer.book
-    worksheet = writer.sheets['Sheet1']
-    
-    # Auto-adjust columns width
-    for idx, col in enumerate(df.columns):
-        # Get the maximum length in the column
-        max_length = max(
-            df[col].astype(str).apply(len).max(),  # max length of values
-            len(str(col))  # length of column name
-        )
-        worksheet.set_column(idx, idx, max_length + 2)  # Add some padding
-    
-    # Add hyperlink format
-    link_format = workbook.add_format({
-        'font_color': 'blue',
-        'underline': True,
-    })
-    
-    # Find the Apply URL column index
-    url_col = df.columns.get_loc('Apply URL')
-    
-    # Add hyperlinks to each row in the Apply URL column
-    for row_num, url in enumerate(df['Apply URL'], start=1):
-        if url != 'N/A':
-            worksheet.write_url(row_num, url_col, url, link_format, url)
-    
-    writer.close()
+    # The searches overlap, so duplicates are removed by ID before any get_job call
+    deduplicator = JobDeduplicator(completed_ids=completed, near_duplicates=not args.keep_reposts)
+    all_search_params = [search_params, search_params2, search_params3]
+    if args.poll:
+        # Pages each search until it reaches postings seen before; date and blacklist filters run before get_job
+        poll_state = PollState()
+        poller = Poller(job_search, poll_state, max_age_days=args.max_age_days, blacklist=BLACK_LIST)
+        jobs = poll_stage(poller, all_search_params)
+    else:
+        jobs = max_age_stage(search_stage(job_search, all_search_params), max_age_cutoff(args.max_age_days))
+    job_ids = dedupe_stage(jobs, deduplicator)
+    failed_ids = []
+    details = near_duplicate_stage(fetch_stage(job_search, job_ids, on_failure=failed_ids.append), deduplicator)
+    # Descriptions are not part of the records, so they are archived separately for reprocess.py
+    details = description_archive_stage(details, output_dir / "job_descriptions.jsonl")
+    records = process_stage(details, build_job_record)
+    written = jsonl_sink(records, jsonl_path)
+    print(f"Processed {written} new jobs")
+    if failed_ids:
+        print(f"{len(failed_ids)} jobs could not be fetched and were skipped; a later run retries them")
+    if args.poll:
+        for job_id in failed_ids:
+            poller.forget(job_id)
+        # Only now is this run's progress durable, so only now does the watermark move
+        poll_state.save()
+        print(poller.report())
 
-    print(f"Data saved successfully to:\n- {json_path}\n- {output_dir / 'job_data.xlsx'}")
+    # This run's records join the archive of earlier runs; JSON/Excel are exported from it without the internal Job ID column
+    store = ResultsStore(output_dir / "job_results.db")
+    run_id = ResultsStore.new_run_id()
+    records = read_jsonl(jsonl_path)
+    if args.match_resume:
+        # Descriptions are not part of the records, but every fetched payload is in the job cache;
+        # peek reads them without counting as cache hits or refreshing entries
+        records = list(records)
+        description_of = lambda job_id: (job_search.cache.peek(job_id) or {}).get("description", {}).get("text", "")
+        scorer = MatchScorer(client=StubLLMClient() if args.match_stub else None, cache=MatchCache())
+        with timed("llm.match_scores"):
+            add_llm_match_scores(records, ResumeStore().load(args.match_resume), description_of, scorer, args.match_top)
+        print(scorer.report())
+    with timed("store.add_many"):
+        store.add_many(records, run_id=run_id)
+    with timed("store.query"):
+        archived = store.query() if args.export_all else store.query(run_id=run_id)
+    print(f"Results archive: {store.count()} jobs in {store.path}")
+    store.close()
+    job_results = [{key: val for key, val in record.items() if key != "Job ID"} for record in archived]
+    export_results(job_results, output_dir)
+    print(deduplicator.report())
+    print(job_search.cache.report())
+    job_search.cache.close()
+    job_search.export_report(output_dir / "api_metrics.json")
+    finish_profiling(args, output_dir)
 
 if __name__ == "__main__":
     main()
@@ -1,18 +1,27 @@
-import os
 import json
-import pandas as pd
+import time
+import argparse
 import numpy as np
 from pathlib import Path
-from dotenv import load_dotenv
-from openai import OpenAI
-from linkedin_api import Linkedin
-from sklearn.metrics.pairwise import cosine_similarity
-
-# Load environment variables
-load_dotenv()
-
-# OpenAI API Client
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+from job_cache import JobCache
+from linkedin_client import LinkedinClient
+from embedding_cache import EmbeddingCache
+from ranking import build_job_matrix, score_jobs, top_k
+from resume_ingest import ResumeStore
+from vector_index import IVFIndex
+from embedding_backends import get_backend, DEFAULT_LOCAL_MODEL
+from excel_export import write_excel
+from profiling import timed, add_profile_arguments, start_profiling, finish_profiling
+
+# Load environment variables from .env; without python-dotenv (e.g. offline benchmarks) only the real environment is used
+try:
+    from dotenv import load_dotenv
+    load_dotenv()
+except ImportError:
+    pass
+
+# History of embedded postings for find_similar.py; postings listed longer ago than this are dropped
+JOB_INDEX_MAX_AGE_DAYS = 60
 
 
 '''
@@ -21,80 +30,50 @@ client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
     It then calculates the cosine similarity between the resume and job description embeddings.
     It then returns the jobs that have the highest similarity to the resume.
 '''
-class JobSearch:
-    def __init__(self):
-        self.usrname = os.getenv("LINKEDIN_USERNAME")
-        self.pwd = os.getenv("LINKEDIN_PASSWORD")
-        self.api = Linkedin(self.usrname, self.pwd)
-
-    def search_jobs(self, search_param):
-        """Search for jobs on LinkedIn"""
-        try:
-            jobs = self.api.search_jobs(**search_param)
-            return jobs
-        except Exception as e:
-            print(f"Error searching for jobs: {e}")
-            return []
-
-    def get_job_details_by_id(self, job_id):
-        """Get job details by job ID"""
-        try:
-            job_details = self.api.get_job(job_id)
-            return job_details
-        except Exception as e:
-            print(f"Error getting job details: {e}")
-            return {}
-
-def get_openai_embedding(text):
-    """Generates an embedding for a given text using OpenAI API"""
-    try:
-        response = client.embeddings.create(
-            input=text,
-            model="text-embedding-ada-002"
-        )
-        return response.data[0].embedding
-    except Exception as e:
-        print(f"Error generating embedding: {e}")
-        return None
+class JobSearch(LinkedinClient):
+    pass
 
 def calculate_similarity(resume_embedding, job_embedding):
     """Calculates cosine similarity between resume and job description embeddings"""
     if resume_embedding is None or job_embedding is None:
         return 0.0
+    # sklearn is only needed here, so import it on first use rather than at startup
+    from sklearn.metrics.pairwise import cosine_similarity
     return cosine_similarity([resume_embedding], [job_embedding])[0][0]
 
-def main():
-    search_params = {
-        "keywords": "Software Engineer",
-        "location_name": "United States",
-        "remote": ["2"],  # Remote jobs only
-        "experience": ["2", "3"],  # Entry level and Associate
-        "job_type": ["F", "C"],  # Full-time and Contract
-        "limit": 3,
-    }
-
-    # Load and format resume text
-    resume_path = Path("main_project/resume.json")
-    with open(resume_path, "r", encoding="utf-8") as f:
-        resume_data = json.load(f)
-        # Convert JSON to string format
-        resume_text = f"""
-        Experience: {resume_data.get('experience', '')}
-        Education: {resume_data.get('education', '')}
-        Skills: {resume_data.get('skills', '')}
-        """
-
-    # Generate embedding for the resume
-    resume_embedding = get_openai_embedding(resume_text)
-
-    job_search = JobSearch()
+def update_job_index(postings, job_embeddings, path, max_age_days=JOB_INDEX_MAX_AGE_DAYS):
+    """Add (job_id, listed_at_ms, meta) postings with their embeddings to the on-disk index and expire old ones"""
+    entries = [(posting, embedding) for posting, embedding in zip(postings, job_embeddings) if embedding is not None]
+    if not entries:
+        return
+    index = IVFIndex.open(path, dim=len(entries[0][1]))
+    index.add(
+        [job_id for (job_id, _, _), _ in entries],
+        [embedding for _, embedding in entries],
+        listed_at=[listed_at for (_, listed_at, _), _ in entries],
+        meta=[meta for (_, _, meta), _ in entries],
+    )
+    expired = index.expire((time.time() - max_age_days * 86400) * 1000)
+    index.save(path)
+    print(f"Job index: {index.count()} postings ({expired} expired) in {path}")
+
+def run_embedding_search(job_search, backend, resumes, search_params, output_dir, cache_root="cache"):
+    """
+    Search, fetch details, embed the resumes and descriptions (through the embedding cache), add the postings
+    to the job index, rank the jobs against the resumes and write job_matches.xlsx to output_dir.
+    Returns (ranked job records, embedding cache).
+    """
     jobs = job_search.search_jobs(search_params)
 
     extracted_data = []
+    postings = []  # (job_id, listed_at, meta) in the same order as extracted_data, for the history index
+
+    job_ids = [job["entityUrn"].split(":")[-1] for job in jobs]
 
-    for job in jobs:
-        job_id = job["entityUrn"].split(":")[-1]
-        details = job_search.get_job_details_by_id(job_id)
+    for job_id, details in job_search.get_job_details_many(job_ids, max_workers=8, retries=0):
+        if not details:
+            # The fetch failed after its retries; skip it rather than index an empty posting
+            continue
 
         title = details.get("title", "N/A")
         company = details.get("companyDetails", {}).get("com.linkedin.voyager.deco.jobs.web.shared.WebCompactJobPostingCompany", {}).get("companyResolutionResult", {}).get("name", "N/A")
@@ -105,32 +84,95 @@ def main():
         description = details.get("description", {}).get("text", "")
         print(description)
 
-        # Generate embedding for job description
-        job_embedding = get_openai_embedding(description)
-
-        # Compute similarity
-        match_percentage = calculate_similarity(resume_embedding, job_embedding) * 100
-
         # Store data
         extracted_data.append({
-            "Match %": round(match_percentage, 2),
+            "Match %": None,  # filled in once all embeddings are available
+            "Description": description,
             "Title": title,
             "Company": company,
             "Location": location,
             "Workplace Type": workplace_type,
             "Apply URL": apply_url
         })
+        listed_at = details.get("listedAt") or time.time() * 1000
+        postings.append((job_id, listed_at, {"title": title, "company": company, "apply_url": apply_url}))
+
+    # Embed the resumes and all descriptions in one cached lookup; only unseen texts hit the backend
+    embedding_cache = EmbeddingCache(backend.cache_dir(cache_root) / "embeddings")
+    embeddings = embedding_cache.get_or_embed(
+        [resume["text"] for resume in resumes] + [job.pop("Description") for job in extracted_data],
+        backend.cache_key,
+        backend.embed,
+    )
+    resume_embeddings, job_embeddings = embeddings[:len(resumes)], embeddings[len(resumes):]
+    with timed("index.update"):
+        update_job_index(postings, job_embeddings, backend.cache_dir(cache_root) / "job_index.npz")
+
+    # Score every job against every resume with one matrix product and order them by best match
+    scored_resumes = [(resume, embedding) for resume, embedding in zip(resumes, resume_embeddings) if embedding is not None]
+    if scored_resumes and extracted_data:
+        with timed("ranking.score_jobs"):
+            job_matrix = build_job_matrix(job_embeddings, dim=len(scored_resumes[0][1]))
+            scores = score_jobs(job_matrix, [embedding for _, embedding in scored_resumes])  # (resumes, jobs)
+        best_scores = scores.max(axis=0)
+        for job, best_score, job_scores in zip(extracted_data, best_scores, scores.T):
+            job["Match %"] = round(float(best_score), 2)
+            if len(scored_resumes) > 1:
+                job["Best Resume"] = scored_resumes[int(np.argmax(job_scores))][0]["name"]
+                for (resume, _), score in zip(scored_resumes, job_scores):
+                    job[f"Match % ({resume['name']})"] = round(float(score), 2)
+        extracted_data = [extracted_data[i] for i in top_k(best_scores, len(best_scores))]
+    else:
+        for job in extracted_data:
+            job["Match %"] = 0.0
+
+    # Save to Excel, streamed row by row
+    with timed("export.excel"):
+        write_excel(extracted_data, Path(output_dir) / "job_matches.xlsx")
+    return extracted_data, embedding_cache
+
+def main():
+    parser = argparse.ArgumentParser(description="Search LinkedIn jobs and rank them against your resume by embedding similarity")
+    parser.add_argument("--backend", choices=["openai", "local"], default="openai", help="embedding backend")
+    parser.add_argument("--local-model", default=DEFAULT_LOCAL_MODEL, help="Hugging Face model for --backend local")
+    parser.add_argument("--offline", action="store_true", help="local backend: only use already downloaded model files")
+    parser.add_argument("--resume-file", action="append", default=None,
+                        help="resume (.pdf, .json or .txt) or a directory of them; repeat to score against several")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    start_profiling(args)
+
+    if args.backend == "local":
+        backend = get_backend("local", model_name=args.local_model, local_files_only=args.offline)
+    else:
+        backend = get_backend("openai")
+
+    search_params = {
+        "keywords": "Software Engineer",
+        "location_name": "United States",
+        "remote": ["2"],  # Remote jobs only
+        "experience": ["2", "3"],  # Entry level and Associate
+        "job_type": ["F", "C"],  # Full-time and Contract
+        "limit": 3,
+    }
 
-    # Convert to DataFrame
-    df = pd.DataFrame(extracted_data)
+    # Parsed resumes are cached by content hash, so unchanged files load instantly
+    resume_store = ResumeStore()
+    resumes = resume_store.load_many(args.resume_file or ["main_project/resume.json"])
 
-    # Save to Excel
+    job_search = JobSearch(cache=JobCache())
     output_dir = Path("output")
     output_dir.mkdir(exist_ok=True)
     excel_path = output_dir / "job_matches.xlsx"
-    df.to_excel(excel_path, index=False)
+    _, embedding_cache = run_embedding_search(job_search, backend, resumes, search_params, output_dir)
 
     print(f"Data saved successfully to {excel_path}")
+    print(job_search.cache.report())
+    job_search.cache.close()
+    print(embedding_cache.report())
+    print(f"Resumes: {resume_store.hits} loaded from cache, {resume_store.misses} parsed")
+    job_search.export_report(output_dir / "api_metrics.json")
+    finish_profiling(args, output_dir)
 
 if __name__ == "__main__":
     main()
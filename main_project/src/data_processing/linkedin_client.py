@@ -0,0 +1,57 @@
+import os
+from job_fetcher import fetch_job_details
+from api_scheduler import ScheduledLinkedin
+from profiling import timed
+
+class LinkedinClient:
+    """
+    LinkedIn search and job details behind the shared scheduler and the optional JobCache.
+    Used by both entry points (job_search.py and job_search_embedding.py).
+    """
+    def __init__(self, api=None, cache=None):
+        self.usrname = os.getenv("LINKEDIN_USERNAME")
+        self.pwd = os.getenv("LINKEDIN_PASSWORD")
+        # Optional JobCache; cached job details skip the LinkedIn API entirely
+        self.cache = cache
+        if api is None:
+            # The LinkedIn client is imported here, so code passing its own api (fakes, benchmarks) runs without it.
+            # Every LinkedIn call goes through one scheduler (rate limit, backoff on 429/5xx, circuit breaker);
+            # re-fetches of expired cache entries queue behind new postings
+            from linkedin_api import Linkedin
+            api = ScheduledLinkedin(Linkedin(self.usrname, self.pwd), is_refresh=cache.is_stale if cache is not None else None)
+        # api can be any object with search_jobs/get_job (e.g. a fake client, or one wrapped in ScheduledLinkedin, in tests)
+        self.api = api
+
+    def search_jobs(self, search_param):
+        """Search for jobs on LinkedIn"""
+        try:
+            with timed("search.search_jobs"):
+                return self.api.search_jobs(**search_param)
+        except Exception as e:
+            print(f"Error searching for jobs: {e}")
+            return []
+
+    def get_job_details_by_id(self, job_id):
+        """Get job details by job ID"""
+        if self.cache is not None:
+            cached = self.cache.get(job_id)
+            if cached is not None:
+                return cached
+        try:
+            details = self.api.get_job(job_id)
+        except Exception as e:
+            print(f"Error getting job details: {e}")
+            return {}
+        if self.cache is not None:
+            self.cache.put(job_id, details)
+        return details
+
+    def get_job_details_many(self, job_ids, max_workers=8, rate_limit=None, retries=3, backoff=1.0):
+        """Get job details for many job IDs concurrently, yielding (job_id, details) as they complete"""
+        return fetch_job_details(self.api.get_job, job_ids, max_workers=max_workers, rate_limit=rate_limit,
+                                 retries=retries, backoff=backoff, cache=self.cache)
+
+    def export_report(self, path):
+        """Write the scheduler's metrics to path (a no-op for clients that are not scheduled, e.g. fakes)"""
+        if isinstance(self.api, ScheduledLinkedin):
+            self.api.export_report(path)
@@ -0,0 +1,227 @@
+import asyncio
+import hashlib
+import os
+import random
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+from ranking import top_k
+
+'''
+    LLM match scoring for many jobs at once: the prompt of JobSearch.match_resume_with_job, sent
+    concurrently (bounded by a semaphore) through an async OpenAI-compatible client, with results
+    cached on disk by (model, prompt version, resume hash, description hash). Only the top-N jobs by
+    a cheap score (skill overlap or embedding similarity) are sent, so cost is bounded per run.
+    StubLLMClient stands in for the API offline.
+'''
+
+MATCH_MODEL = "gpt-4o-mini"
+# Bump when the prompt changes, so cached scores from the old prompt are not reused
+PROMPT_VERSION = "v1"
+SYSTEM_PROMPT = ("You are a job matching AI. Your task is to analyze the similarity between a job description and a resume. "
+                 "Respond with a single integer between 0 and 100, representing the match percentage. "
+                 "Do not include a % symbol, explanation, or any other text.")
+USER_PROMPT = ("Evaluate the match percentage between this job description and resume:\n\n"
+               "Job Description:\n{job_desc}\n\nResume:\n{resume_text}\n\nReturn only a number from 0 to 100.")
+
+# USD per million tokens (input, output), used for the cost estimate in reports
+MODEL_PRICES = {"gpt-4o-mini": (0.15, 0.60), "gpt-4o": (2.50, 10.00)}
+
+def build_messages(job_desc, resume_text):
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": USER_PROMPT.format(job_desc=job_desc, resume_text=resume_text)},
+    ]
+
+def parse_score(output):
+    """The 0-100 score in a model reply, or None if the reply is not a number in range"""
+    match = re.fullmatch(r"\s*(\d{1,3})\s*%?\s*", output or "")
+    if match and int(match.group(1)) <= 100:
+        return int(match.group(1))
+    return None
+
+def text_hash(text):
+    return hashlib.sha256(" ".join((text or "").split()).encode("utf-8")).hexdigest()
+
+def skill_overlap_scores(resume_skills, job_skills_list):
+    """Share of each job's skills found in the resume (0-1); jobs listing no skills score 0"""
+    resume_skills = {skill.lower() for skill in resume_skills}
+    return np.array([
+        sum(skill.lower() in resume_skills for skill in skills) / len(skills) if skills else 0.0
+        for skills in job_skills_list
+    ], dtype=np.float32)
+
+def select_candidates(cheap_scores, top_n):
+    """Indices of the top_n jobs by a cheap score, best first"""
+    return top_k(np.asarray(cheap_scores, dtype=np.float32), top_n)
+
+class MatchCache:
+    """On-disk cache of LLM match scores (SQLite) keyed by model, prompt version, resume and description"""
+    def __init__(self, path="cache/llm_matches.db"):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS matches (key TEXT PRIMARY KEY, score INTEGER NOT NULL, stored_at REAL NOT NULL)"
+        )
+        self.conn.commit()
+
+    @staticmethod
+    def make_key(model, prompt_version, resume_hash, description_hash):
+        return f"{model}:{prompt_version}:{resume_hash}:{description_hash}"
+
+    def get(self, key):
+        with self.lock:
+            row = self.conn.execute("SELECT score FROM matches WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def put(self, key, score):
+        with self.lock:
+            self.conn.execute("INSERT OR REPLACE INTO matches (key, score, stored_at) VALUES (?, ?, ?)",
+                              (key, score, time.time()))
+            self.conn.commit()
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+class StubLLMClient:
+    """
+    Offline stand-in for openai.AsyncOpenAI (chat.completions.create only).
+    Replies with a deterministic score from word overlap between the description and the resume,
+    after 'latency' seconds; error_rate of the calls raise instead.
+    """
+    def __init__(self, latency=0.05, error_rate=0.0, seed=0):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.calls = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, model, messages, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        if self.random.random() < self.error_rate:
+            raise RuntimeError("stub LLM error (HTTP 500)")
+        prompt = messages[-1]["content"]
+        job_desc, _, resume_text = prompt.partition("\n\nResume:\n")
+        job_words, resume_words = set(job_desc.lower().split()), set(resume_text.lower().split())
+        score = round(100 * len(job_words & resume_words) / max(1, len(job_words)))
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=str(score)))],
+            usage=SimpleNamespace(prompt_tokens=len(prompt) // 4 + len(SYSTEM_PROMPT) // 4, completion_tokens=1),
+        )
+
+class MatchScorer:
+    """
+    Scores (resume, description) pairs with an LLM, concurrently and through a MatchCache.
+    client is an async OpenAI-compatible client (StubLLMClient offline); without one, each score_many_async
+    call opens and closes its own openai.AsyncOpenAI, so score_many can be called repeatedly.
+    Identical descriptions are sent once; failed calls are retried with exponential backoff and give None.
+    """
+    def __init__(self, client=None, model=MATCH_MODEL, cache=None, concurrency=8, retries=3, backoff=1.0):
+        self.client = client
+        self.model = model
+        self.cache = cache
+        self.concurrency = concurrency
+        self.retries = retries
+        self.backoff = backoff
+        self.cache_hits = 0
+        self.calls = 0
+        self.errors = 0
+        self.unparsed = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.latencies = []
+
+    def _new_client(self):
+        # Imported on first use, like the other optional API clients
+        from openai import AsyncOpenAI
+        return AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
+    async def _score_one(self, client, semaphore, job_desc, resume_text):
+        for attempt in range(self.retries + 1):
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    response = await client.chat.completions.create(model=self.model, messages=build_messages(job_desc, resume_text))
+                except Exception as e:
+                    error = e
+                else:
+                    self.latencies.append(time.perf_counter() - start)
+                    self.calls += 1
+                    usage = getattr(response, "usage", None)
+                    if usage is not None:
+                        self.prompt_tokens += usage.prompt_tokens
+                        self.completion_tokens += usage.completion_tokens
+                    score = parse_score(response.choices[0].message.content)
+                    if score is None:
+                        self.unparsed += 1
+                    return score
+            if attempt == self.retries:
+                self.errors += 1
+                print(f"Error calculating match percentage: {error}")
+                return None
+            await asyncio.sleep(self.backoff * 2 ** attempt)
+
+    async def score_many_async(self, resume_text, descriptions):
+        """One score (0-100, or None) per description, in input order"""
+        resume_hash = text_hash(resume_text)
+        keys = [MatchCache.make_key(self.model, PROMPT_VERSION, resume_hash, text_hash(desc)) for desc in descriptions]
+        scores = [None] * len(descriptions)
+        pending = {}  # cache key -> indices waiting for it
+        for i, key in enumerate(keys):
+            cached = self.cache.get(key) if self.cache is not None else None
+            if cached is not None:
+                self.cache_hits += 1
+                scores[i] = cached
+            else:
+                pending.setdefault(key, []).append(i)
+
+        if not pending:
+            return scores
+        # An async client's connections belong to the event loop that opened them, so without a client
+        # passed in, each call gets its own and closes it before its loop ends
+        client = self.client or self._new_client()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        pending_keys = list(pending)
+        try:
+            results = await asyncio.gather(*(
+                self._score_one(client, semaphore, descriptions[pending[key][0]], resume_text) for key in pending_keys
+            ))
+        finally:
+            if client is not self.client:
+                await client.close()
+        for key, score in zip(pending_keys, results):
+            for i in pending[key]:
+                scores[i] = score
+            if score is not None and self.cache is not None:
+                self.cache.put(key, score)
+        return scores
+
+    def score_many(self, resume_text, descriptions):
+        """Synchronous wrapper around score_many_async (runs its own event loop)"""
+        return asyncio.run(self.score_many_async(resume_text, descriptions))
+
+    def cost(self):
+        """Estimated USD spent on this scorer's calls (0 for models without a known price)"""
+        input_price, output_price = MODEL_PRICES.get(self.model, (0.0, 0.0))
+        return (self.prompt_tokens * input_price + self.completion_tokens * output_price) / 1e6
+
+    def report(self):
+        """One-line summary of scoring activity for the end of a run"""
+        lookups = self.cache_hits + self.calls + self.errors
+        hit_rate = self.cache_hits / lookups * 100 if lookups else 0.0
+        latencies = np.array(self.latencies) * 1000
+        latency = (f"p50 {np.percentile(latencies, 50):.0f}ms, p95 {np.percentile(latencies, 95):.0f}ms"
+                   if len(latencies) else "no calls")
+        return (f"LLM match scoring ({self.model}): {self.calls} calls, {self.cache_hits} cached ({hit_rate:.1f}% hit rate), "
+                f"{self.errors} failed, {self.unparsed} unparsable, {latency}, "
+                f"{self.prompt_tokens + self.completion_tokens} tokens, ~${self.cost():.4f}")
@@ -0,0 +1,120 @@
+import os
+import time
+
+from embedding_backends import EmbeddingBackend
+from profiling import count, timed
+
+'''
+    Embeddings from the OpenAI API: requests batched by input count and estimated tokens, overlong
+    inputs truncated, failed batches retried on their own. The openai package is imported on first use.
+'''
+
+# Load environment variables from .env; without python-dotenv (e.g. offline benchmarks) only the real environment is used
+try:
+    from dotenv import load_dotenv
+    load_dotenv()
+except ImportError:
+    pass
+
+# OpenAI API client, created on first use so the module imports without the openai package
+_client = None
+
+def get_client():
+    """Return the module's OpenAI client, creating it on first call"""
+    global _client
+    if _client is None:
+        from openai import OpenAI
+        _client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    return _client
+
+EMBEDDING_MODEL = "text-embedding-ada-002"
+# Request limits of the embeddings endpoint (inputs per request, tokens per input and per request)
+MAX_INPUTS_PER_REQUEST = 2048
+MAX_TOKENS_PER_INPUT = 8191
+# Token counts are estimated without a tokenizer; 3 characters per token overestimates them for English text
+# and code, so both the per-input truncation and the per-request token budget stay under the real limits
+CHARS_PER_TOKEN = 3
+MAX_CHARS_PER_INPUT = MAX_TOKENS_PER_INPUT * CHARS_PER_TOKEN
+MAX_TOKENS_PER_REQUEST = 300000
+
+def get_openai_embedding(text):
+    """Generates an embedding for a given text using OpenAI API"""
+    try:
+        response = get_client().embeddings.create(
+            input=text,
+            model=EMBEDDING_MODEL
+        )
+        return response.data[0].embedding
+    except Exception as e:
+        print(f"Error generating embedding: {e}")
+        return None
+
+def estimate_tokens(text):
+    """Conservative token count (CHARS_PER_TOKEN characters per token, rounded up)"""
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+def truncate_for_embedding(text):
+    """Cut a text the endpoint would reject as too long, so it cannot fail the rest of its batch"""
+    return text[:MAX_CHARS_PER_INPUT]
+
+def make_embedding_batches(texts, batch_size, max_tokens_per_batch=MAX_TOKENS_PER_REQUEST):
+    """Split indices of texts into batches bounded by input count and estimated tokens"""
+    batches = []
+    batch, batch_tokens = [], 0
+    for i, text in enumerate(texts):
+        tokens = min(estimate_tokens(text), MAX_TOKENS_PER_INPUT)
+        if batch and (len(batch) >= batch_size or batch_tokens + tokens > max_tokens_per_batch):
+            batches.append(batch)
+            batch, batch_tokens = [], 0
+        batch.append(i)
+        batch_tokens += tokens
+    if batch:
+        batches.append(batch)
+    return batches
+
+def get_openai_embeddings(texts, batch_size=256, model=EMBEDDING_MODEL, embedding_client=None, retries=3, backoff=1.0):
+    """
+    Generates embeddings for many texts with one API request per batch.
+    Returns one embedding per text in input order; empty texts and batches that still fail
+    after the retries get None. Texts over MAX_CHARS_PER_INPUT are embedded from their start. Only the failed batch is retried, not the whole call.
+    embedding_client defaults to the module's OpenAI client (a stub client can be passed in tests).
+    """
+    embedding_client = embedding_client or get_client()
+    embeddings = [None] * len(texts)
+    # The endpoint rejects empty input, so those are never sent, and overlong input, so that is truncated
+    indices = [i for i, text in enumerate(texts) if text and text.strip()]
+    inputs = [truncate_for_embedding(texts[i]) for i in indices]
+    batch_size = min(batch_size, MAX_INPUTS_PER_REQUEST)
+
+    for batch in make_embedding_batches(inputs, batch_size):
+        batch_indices = [indices[i] for i in batch]
+        for attempt in range(retries + 1):
+            try:
+                with timed("openai.embeddings"):
+                    response = embedding_client.embeddings.create(
+                        input=[inputs[i] for i in batch],
+                        model=model
+                    )
+                count("openai.embedding_inputs", len(batch_indices))
+                # Each item carries the position of its input in the request
+                for item in response.data:
+                    embeddings[batch_indices[item.index]] = item.embedding
+                break
+            except Exception as e:
+                count("openai.errors")
+                if attempt == retries:
+                    print(f"Error generating embeddings for a batch of {len(batch_indices)}: {e}")
+                else:
+                    time.sleep(backoff * 2 ** attempt)
+    return embeddings
+
+class OpenAIEmbeddingBackend(EmbeddingBackend):
+    """Embeddings from the OpenAI API, batched through get_openai_embeddings"""
+    def __init__(self, model_name=EMBEDDING_MODEL, batch_size=256, embedding_client=None):
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.embedding_client = embedding_client
+
+    def embed(self, texts):
+        return get_openai_embeddings(texts, batch_size=self.batch_size, model=self.model_name,
+                                     embedding_client=self.embedding_client)
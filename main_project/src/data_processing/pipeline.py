@@ -0,0 +1,124 @@
+import json
+import time
+from pathlib import Path
+from profiling import count, timed
+
+'''
+    Generator stages for the job search pipeline: search -> dedupe -> fetch details -> near-duplicate filter
+    -> description archive -> process -> sink.
+    Each stage takes an iterable and yields one item at a time, so a record is written as soon as it
+    is processed and nothing is lost if a run stops halfway. A run can be resumed by passing the IDs
+    already in the JSON Lines output to the deduplicator.
+'''
+
+def job_id_of(job):
+    """Job ID from a search result's entityUrn (urn:li:fs_normalized_jobPosting:<id>)"""
+    return job["entityUrn"].split(":")[-1]
+
+def company_name_of(payload):
+    """Company name from a get_job payload or a search result that carries companyDetails ("N/A" if missing)"""
+    return (payload.get("companyDetails", {})
+            .get("com.linkedin.voyager.deco.jobs.web.shared.WebCompactJobPostingCompany", {})
+            .get("companyResolutionResult", {})
+            .get("name", "N/A"))
+
+def max_age_cutoff(days):
+    """listedAt (epoch ms) before which a posting is more than 'days' old, or None for no limit"""
+    return (time.time() - days * 86400) * 1000 if days is not None else None
+
+def is_too_old(job, cutoff):
+    """True if the job's listedAt is before cutoff; jobs without a listing date are kept"""
+    listed_at = job.get("listedAt")
+    return cutoff is not None and listed_at not in (None, "N/A") and int(listed_at) < cutoff
+
+def max_age_stage(jobs, cutoff):
+    """Drop search results listed before cutoff (see max_age_cutoff)"""
+    for job in jobs:
+        if not is_too_old(job, cutoff):
+            yield job
+
+def search_stage(job_search, search_params_list):
+    """Yield search results for each set of search parameters in turn"""
+    for search_params in search_params_list:
+        yield from job_search.search_jobs(search_params)
+
+def poll_stage(poller, search_params_list):
+    """Yield only the search results not seen by earlier runs (see polling.Poller)"""
+    for search_params in search_params_list:
+        yield from poller.poll(search_params)
+
+def dedupe_stage(jobs, deduplicator):
+    """Yield job IDs not seen before, so no duplicate reaches get_job"""
+    for job in jobs:
+        job_id = job_id_of(job)
+        if deduplicator.is_new_id(job_id):
+            yield job_id
+
+def fetch_stage(job_search, job_ids, max_workers=8, rate_limit=None, retries=0, on_failure=None):
+    """
+    Yield (job_id, details) as detail fetches complete.
+    Rate limiting and retries are left to the API scheduler by default (see api_scheduler.py).
+    Failed fetches (empty details) are dropped, so they are never written or resumed past and a later
+    run fetches them again; on_failure(job_id) is called for each.
+    """
+    for job_id, details in job_search.get_job_details_many(job_ids, max_workers=max_workers, rate_limit=rate_limit,
+                                                           retries=retries):
+        if not details:
+            count("fetch.failed")
+            if on_failure is not None:
+                on_failure(job_id)
+            continue
+        yield job_id, details
+
+def near_duplicate_stage(details_stream, deduplicator):
+    """Drop reposts whose company, title and description match a posting already seen"""
+    for job_id, details in details_stream:
+        if not deduplicator.is_near_duplicate(details):
+            yield job_id, details
+
+def description_archive_stage(details_stream, path):
+    """
+    Append each posting's {"Job ID", "description"} to a JSON Lines archive as it passes through,
+    so reprocess.py can re-run extraction later without fetching the postings again
+    """
+    with open(path, "a", encoding="utf-8") as f:
+        for job_id, details in details_stream:
+            description = details.get("description", {}).get("text", "")
+            f.write(json.dumps({"Job ID": job_id, "description": description}, ensure_ascii=False) + "\n")
+            f.flush()
+            yield job_id, details
+
+def process_stage(details_stream, build_record):
+    """Turn (job_id, details) into output records; build_record returns None to drop a job"""
+    for job_id, details in details_stream:
+        with timed("process.build_record"):
+            record = build_record(job_id, details)
+        if record is not None:
+            yield record
+
+def jsonl_sink(records, path):
+    """Append each record to a JSON Lines file as it arrives; returns the number written"""
+    count = 0
+    with open(path, "a", encoding="utf-8") as f:
+        for record in records:
+            with timed("sink.write_jsonl"):
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                f.flush()
+            count += 1
+    return count
+
+def read_jsonl(path):
+    """Yield records from a JSON Lines file, skipping a truncated last line from an interrupted run"""
+    path = Path(path)
+    if not path.exists():
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+def completed_job_ids(path, id_field="Job ID"):
+    """IDs of jobs already written to a JSON Lines file, used to resume a run"""
+    return {record[id_field] for record in read_jsonl(path) if id_field in record}
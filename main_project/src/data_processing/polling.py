@@ -0,0 +1,126 @@
+import json
+from pathlib import Path
+
+from pipeline import company_name_of, is_too_old, job_id_of, max_age_cutoff
+
+class PollState:
+    """
+    Per-query polling state persisted as JSON: the newest listedAt seen (watermark, ms) and the
+    IDs of postings already seen, so a scheduled run only fetches postings that appeared since.
+    Changes stay in memory until save(), which is meant to run once the run's records are written,
+    so an interrupted run polls the same postings again.
+    """
+    def __init__(self, path="cache/poll_state.json", max_seen_per_query=20000):
+        self.path = Path(path)
+        self.max_seen_per_query = max_seen_per_query
+        self.queries = {}
+        if self.path.exists():
+            try:
+                self.queries = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"Ignoring unreadable poll state {self.path}: {e}")
+        # Seen IDs as dicts (insertion ordered), so the oldest can be dropped once a query holds too many
+        self.seen_ids = {key: dict.fromkeys(query.get("seen", [])) for key, query in self.queries.items()}
+
+    @staticmethod
+    def query_key(search_params):
+        """Stable key for a search, ignoring paging parameters"""
+        return json.dumps({k: v for k, v in search_params.items() if k not in ("limit", "offset")}, sort_keys=True)
+
+    def watermark(self, key):
+        return self.queries.get(key, {}).get("watermark")
+
+    def seen(self, key):
+        return self.seen_ids.setdefault(key, {})
+
+    def mark_seen(self, key, job_id, listed_at=None):
+        seen = self.seen(key)
+        seen.pop(job_id, None)
+        seen[job_id] = None
+        query = self.queries.setdefault(key, {})
+        if listed_at is not None and listed_at > (query.get("watermark") or 0):
+            query["watermark"] = listed_at
+
+    def forget(self, key, job_id):
+        """Drop a posting from the seen IDs (e.g. its get_job failed), so the next run polls it again"""
+        self.seen(key).pop(job_id, None)
+
+    def save(self):
+        for key, seen in self.seen_ids.items():
+            self.queries.setdefault(key, {})["seen"] = list(seen)[-self.max_seen_per_query:]
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self.queries), encoding="utf-8")
+        tmp_path.replace(self.path)
+
+class Poller:
+    """
+    Pages through search_jobs results newest first and yields only postings not seen by earlier runs.
+    Results are newest first, so paging stops once a page ends on a posting already seen or listed
+    before the watermark (minus overlap_minutes, for postings LinkedIn indexes late), or has nothing new.
+    Cheap filters run on the search metadata, before any get_job call: postings older than
+    max_age_days and companies in blacklist (when the search result names the company) are dropped.
+    """
+    def __init__(self, job_search, state, page_size=25, max_pages=40, max_age_days=None, blacklist=(),
+                 overlap_minutes=60):
+        self.job_search = job_search
+        self.state = state
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.max_age_days = max_age_days
+        self.blacklist = set(blacklist)
+        self.overlap_ms = overlap_minutes * 60000
+        self.pages = 0
+        self.returned = 0
+        self.already_seen = 0
+        self.too_old = 0
+        self.blacklisted = 0
+        self.new = 0
+        self.yielded_by = {}  # job ID -> keys of the queries that yielded it
+
+    def poll(self, search_params):
+        """Yield the new search results of one query"""
+        key = PollState.query_key(search_params)
+        seen = self.state.seen(key)
+        watermark = self.state.watermark(key)
+        # Cutoffs are computed once per query, as epoch milliseconds like listedAt
+        stop_before = watermark - self.overlap_ms if watermark is not None else None
+        cutoff = max_age_cutoff(self.max_age_days)
+
+        for page in range(self.max_pages):
+            results = self.job_search.search_jobs(dict(search_params, limit=self.page_size, offset=page * self.page_size))
+            self.pages += 1
+            self.returned += len(results)
+            anything_new = False
+            reached_old = False
+            for job in results:
+                job_id = job_id_of(job)
+                listed_at = job.get("listedAt")
+                reached_old = job_id in seen or (stop_before is not None and listed_at is not None and listed_at < stop_before)
+                if job_id in seen:
+                    self.already_seen += 1
+                    continue
+                self.state.mark_seen(key, job_id, listed_at)
+                if is_too_old(job, cutoff):
+                    self.too_old += 1
+                    continue
+                if stop_before is None or listed_at is None or listed_at >= stop_before:
+                    anything_new = True
+                if company_name_of(job) in self.blacklist:
+                    self.blacklisted += 1
+                    continue
+                self.new += 1
+                self.yielded_by.setdefault(job_id, []).append(key)
+                yield job
+            if not anything_new or reached_old or len(results) < self.page_size:
+                break
+
+    def forget(self, job_id):
+        """Un-see a posting this run yielded but could not fetch, so the next run yields it again"""
+        for key in self.yielded_by.pop(job_id, []):
+            self.state.forget(key, job_id)
+
+    def report(self):
+        """One-line summary of the polling for the end of a run"""
+        return (f"Polling: {self.pages} search pages, {self.returned} results, {self.already_seen} already seen, "
+                f"{self.too_old} too old, {self.blacklisted} blacklisted, {self.new} new")
@@ -0,0 +1,168 @@
+import cProfile
+import functools
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+# Setting this environment variable to anything but ""/"0" turns profiling on without the --profile flag
+PROFILE_ENV_VAR = "JOB_SEARCH_PROFILE"
+
+class Profiler:
+    """
+    Per-stage timers, counters and latency histograms for a run.
+    Disabled by default: timed()/profiled() then cost one attribute check, and nothing is recorded.
+    Durations are kept per stage, so the report can give exact p50/p95/p99 latencies.
+    Work done in multiprocessing workers (process_job_descriptions) is not seen by the parent's profiler.
+    """
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.lock = threading.Lock()
+        self.durations = {}
+        self.counters = {}
+        self.started_at = time.perf_counter()
+        self.cprofile = None
+
+    def enable(self):
+        self.enabled = True
+        self.started_at = time.perf_counter()
+
+    def record(self, name, seconds):
+        with self.lock:
+            self.durations.setdefault(name, []).append(seconds)
+
+    def count(self, name, amount=1):
+        if not self.enabled:
+            return
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    @contextmanager
+    def _timer(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def timed(self, name):
+        """Context manager timing a block under 'name'"""
+        if not self.enabled:
+            return _NULL_TIMER
+        return self._timer(name)
+
+    def start_cprofile(self):
+        """Collect a cProfile of the main thread until dump_cprofile()"""
+        self.cprofile = cProfile.Profile()
+        self.cprofile.enable()
+
+    def dump_cprofile(self, path):
+        if self.cprofile is None:
+            return
+        self.cprofile.disable()
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.cprofile.dump_stats(str(path))
+        print(f"cProfile stats written to {path} (view with: python -m pstats {path})")
+
+    @staticmethod
+    def percentile(sorted_values, q):
+        """Nearest-rank percentile of an already sorted list"""
+        index = max(0, min(len(sorted_values) - 1, math.ceil(q / 100 * len(sorted_values)) - 1))
+        return sorted_values[index]
+
+    def report(self):
+        """Per-stage count, total and latency percentiles (milliseconds), plus counters and wall time"""
+        with self.lock:
+            durations = {name: sorted(values) for name, values in self.durations.items()}
+            counters = dict(self.counters)
+        stages = {}
+        for name, values in sorted(durations.items(), key=lambda item: -sum(item[1])):
+            total = sum(values)
+            stages[name] = {
+                "count": len(values),
+                "total_s": round(total, 4),
+                "mean_ms": round(total / len(values) * 1000, 3),
+                "p50_ms": round(self.percentile(values, 50) * 1000, 3),
+                "p95_ms": round(self.percentile(values, 95) * 1000, 3),
+                "p99_ms": round(self.percentile(values, 99) * 1000, 3),
+                "max_ms": round(values[-1] * 1000, 3),
+            }
+        return {
+            "wall_time_s": round(time.perf_counter() - self.started_at, 4),
+            "stages": stages,
+            "counters": counters,
+        }
+
+    def write_report(self, path="output/profile.json"):
+        """Write report() as JSON and print the slowest stages"""
+        report = self.report()
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(report, indent=4), encoding="utf-8")
+        print(f"Profile ({report['wall_time_s']}s wall) written to {path}")
+        for name, stage in list(report["stages"].items())[:10]:
+            print(f"  {name:<32} {stage['count']:>7} calls {stage['total_s']:>9.3f}s "
+                  f"p50 {stage['p50_ms']:.2f}ms p95 {stage['p95_ms']:.2f}ms p99 {stage['p99_ms']:.2f}ms")
+        return report
+
+class _NullTimer:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NULL_TIMER = _NullTimer()
+
+PROFILER = Profiler(enabled=os.getenv(PROFILE_ENV_VAR, "") not in ("", "0"))
+
+def timed(name):
+    """Time a block under 'name' with the module profiler"""
+    return PROFILER.timed(name)
+
+def count(name, amount=1):
+    """Add to a counter of the module profiler"""
+    PROFILER.count(name, amount)
+
+def profiled(name=None):
+    """Decorator timing every call of a function (under its qualified name by default)"""
+    def decorator(func):
+        stage = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not PROFILER.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                PROFILER.record(stage, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+def add_profile_arguments(parser):
+    """--profile / --profile-dump options shared by the command line entry points"""
+    parser.add_argument("--profile", action="store_true",
+                        help=f"record per-stage timings to output/profile.json (or set {PROFILE_ENV_VAR}=1)")
+    parser.add_argument("--profile-dump", default=None, help="also write a cProfile dump of the run to this path")
+
+def start_profiling(args):
+    """Enable the profiler from parsed arguments; returns True if profiling is on"""
+    if args.profile or args.profile_dump:
+        PROFILER.enable()
+    if args.profile_dump:
+        PROFILER.start_cprofile()
+    return PROFILER.enabled
+
+def finish_profiling(args, output_dir="output"):
+    """Write the JSON report (and cProfile dump) if profiling is on"""
+    if not PROFILER.enabled:
+        return None
+    if args.profile_dump:
+        PROFILER.dump_cprofile(args.profile_dump)
+    return PROFILER.write_report(Path(output_dir) / "profile.json")
@@ -0,0 +1,45 @@
+import numpy as np
+
+def build_job_matrix(job_embeddings, dim=None):
+    """
+    Stack job embeddings into one contiguous, row-normalized float32 matrix.
+    Missing embeddings (None) and zero vectors become zero rows, so they score 0 like calculate_similarity.
+    """
+    if dim is None:
+        dim = next((len(e) for e in job_embeddings if e is not None), 0)
+    matrix = np.zeros((len(job_embeddings), dim), dtype=np.float32)
+    for i, embedding in enumerate(job_embeddings):
+        if embedding is not None:
+            matrix[i] = embedding
+    return normalize_rows(matrix)
+
+def normalize_rows(matrix):
+    """L2-normalize rows in place, leaving zero rows untouched"""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix
+
+def score_jobs(job_matrix, resume_embeddings):
+    """
+    Cosine similarity (as a percentage) of every job against one or more resumes.
+    resume_embeddings is a single vector or a list of vectors; returns shape (jobs,) or (resumes, jobs).
+    """
+    resumes = np.asarray(resume_embeddings, dtype=np.float32)
+    single = resumes.ndim == 1
+    resumes = normalize_rows(np.atleast_2d(resumes).copy())
+    scores = resumes @ job_matrix.T * 100
+    return scores[0] if single else scores
+
+def top_k(scores, k):
+    """Indices of the k highest scores, best first (argpartition, then sort only those k)"""
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    candidates = np.argpartition(-scores, k - 1)[:k]
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+def rank_jobs(resume_embedding, job_embeddings, k=None):
+    """Return (indices, scores) of the top-k jobs for one resume, best first (all jobs when k is None)"""
+    scores = score_jobs(build_job_matrix(job_embeddings, dim=len(resume_embedding)), resume_embedding)
+    indices = top_k(scores, len(scores) if k is None else k)
+    return indices, scores[indices]
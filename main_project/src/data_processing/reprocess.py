@@ -0,0 +1,65 @@
+import argparse
+import json
+import time
+from collections import deque
+
+from data_extraction import process_job_descriptions
+from pipeline import read_jsonl
+
+'''
+    Re-runs extraction over a JSON Lines archive of stored job descriptions, e.g. after
+    TECHNICAL_SKILLS_KEYWORDS or the header lists change, and writes a new JSON Lines file.
+    Each input line is a record whose description is either a string or a get_job style
+    {"text": ...} object; the extracted skills, experience level and salary are added to it.
+    job_search.py appends every fetched posting's {"Job ID", "description"} to output/job_descriptions.jsonl,
+    which is the default archive.
+
+    python reprocess.py output/job_descriptions.jsonl reprocessed.jsonl --workers 8 --chunksize 64
+'''
+
+def description_of(record, field):
+    description = record.get(field, "")
+    if isinstance(description, dict):
+        description = description.get("text", "")
+    return description or ""
+
+def reprocess_records(records, field, workers=None, chunksize=64):
+    """
+    Yield the records in input order with the extracted fields added.
+    Only descriptions go to the process pool; the records wait in a queue that holds no more than
+    process_job_descriptions reads ahead (one window), all in this thread.
+    """
+    pending = deque()
+
+    def descriptions():
+        for record in records:
+            pending.append(record)
+            yield description_of(record, field)
+
+    for extracted in process_job_descriptions(descriptions(), workers, chunksize):
+        record = pending.popleft()
+        record.update(extracted)
+        yield record
+
+def main():
+    parser = argparse.ArgumentParser(description="Reprocess stored job descriptions with a process pool")
+    parser.add_argument("archive", help="input JSON Lines file (e.g. output/job_descriptions.jsonl)")
+    parser.add_argument("output", help="output JSON Lines file (overwritten)")
+    parser.add_argument("--field", default="description", help="record field holding the description")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all CPUs)")
+    parser.add_argument("--chunksize", type=int, default=64, help="descriptions sent to a worker at a time")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    count = 0
+    with open(args.output, "w", encoding="utf-8") as f:
+        for record in reprocess_records(read_jsonl(args.archive), args.field, args.workers, args.chunksize):
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            count += 1
+    elapsed = time.perf_counter() - start
+
+    rate = count / elapsed if elapsed else 0.0
+    print(f"Reprocessed {count} postings in {elapsed:.2f}s ({rate:.0f} postings/s) -> {args.output}")
+
+if __name__ == "__main__":
+    main()
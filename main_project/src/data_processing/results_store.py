@@ -0,0 +1,170 @@
+import argparse
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+class ResultsStore:
+    """
+    Persistent archive of processed job records (SQLite), appended to by every run.
+    Each record is kept as JSON alongside indexed columns (company, workplace type, listed date,
+    salary presence, skills), so filtered queries do not load the whole history.
+    Adding a job ID that is already stored replaces it with the newer record.
+    """
+    def __init__(self, path="output/job_results.db"):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.executescript(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " job_id TEXT PRIMARY KEY, run_id TEXT, listed_date TEXT, company TEXT COLLATE NOCASE,"
+            " workplace_type TEXT COLLATE NOCASE, has_salary INTEGER NOT NULL, stored_at REAL NOT NULL,"
+            " record TEXT NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS job_skills ("
+            " job_id TEXT NOT NULL, skill TEXT NOT NULL COLLATE NOCASE, PRIMARY KEY (skill, job_id));"
+            "CREATE INDEX IF NOT EXISTS idx_jobs_listed ON jobs (listed_date);"
+            "CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs (company);"
+            "CREATE INDEX IF NOT EXISTS idx_jobs_workplace ON jobs (workplace_type);"
+            "CREATE INDEX IF NOT EXISTS idx_jobs_run ON jobs (run_id);"
+            "CREATE INDEX IF NOT EXISTS idx_skills_job ON job_skills (job_id);"
+        )
+        self.conn.commit()
+
+    @staticmethod
+    def new_run_id():
+        return datetime.now().strftime("%Y%m%d-%H%M%S")
+
+    @staticmethod
+    def _listed_date(record):
+        # build_job_record formats listedAt as "YYYY-MM-DD HH:MM", which sorts and compares as text
+        listed = record.get("Listed Date")
+        return listed if listed and listed != "N/A" else None
+
+    @staticmethod
+    def _date_bound(value):
+        """Accept a datetime, a date string or epoch milliseconds (listedAt) as a query bound"""
+        if value is None:
+            return None
+        if isinstance(value, (int, float)):
+            value = datetime.fromtimestamp(value / 1000)
+        if isinstance(value, datetime):
+            return value.strftime("%Y-%m-%d %H:%M")
+        return str(value)
+
+    def add_many(self, records, run_id=None):
+        """Store records (dicts from build_job_record, with a "Job ID"); returns the number stored"""
+        run_id = run_id or self.new_run_id()
+        now = time.time()
+        count = 0
+        with self.lock:
+            for record in records:
+                job_id = str(record["Job ID"])
+                salary = record.get("Salary")
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO jobs (job_id, run_id, listed_date, company, workplace_type, has_salary, stored_at, record)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (job_id, run_id, self._listed_date(record), record.get("Company"), record.get("Workplace Type"),
+                     int(bool(salary) and salary not in ("Not specified", "N/A")), now,
+                     json.dumps(record, ensure_ascii=False)),
+                )
+                self.conn.execute("DELETE FROM job_skills WHERE job_id = ?", (job_id,))
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO job_skills (job_id, skill) VALUES (?, ?)",
+                    [(job_id, skill) for skill in record.get("Skills") or []],
+                )
+                count += 1
+            self.conn.commit()
+        return count
+
+    def query(self, company=None, skills=None, has_salary=None, workplace_type=None,
+              listed_after=None, listed_before=None, run_id=None, limit=None):
+        """
+        Records matching every given filter, newest listing first.
+        company and workplace_type match case-insensitively; skills is a skill or a list of skills
+        that must all be present; listed_after/listed_before bound the listed date (inclusive/exclusive).
+        """
+        clauses, params = [], []
+        if company is not None:
+            clauses.append("company = ?")
+            params.append(company)
+        if workplace_type is not None:
+            clauses.append("workplace_type = ?")
+            params.append(workplace_type)
+        if has_salary is not None:
+            clauses.append("has_salary = ?")
+            params.append(int(has_salary))
+        if listed_after is not None:
+            clauses.append("listed_date >= ?")
+            params.append(self._date_bound(listed_after))
+        if listed_before is not None:
+            clauses.append("listed_date < ?")
+            params.append(self._date_bound(listed_before))
+        if run_id is not None:
+            clauses.append("run_id = ?")
+            params.append(run_id)
+        for skill in [skills] if isinstance(skills, str) else skills or []:
+            clauses.append("job_id IN (SELECT job_id FROM job_skills WHERE skill = ?)")
+            params.append(skill)
+
+        sql = "SELECT record FROM jobs"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY listed_date IS NULL, listed_date DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        with self.lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return [json.loads(record) for (record,) in rows]
+
+    def count(self):
+        with self.lock:
+            (count,) = self.conn.execute("SELECT COUNT(*) FROM jobs").fetchone()
+        return count
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the archive of processed jobs and export the matches")
+    parser.add_argument("--db", default="output/job_results.db", help="results archive written by job_search.py")
+    parser.add_argument("--company", default=None)
+    parser.add_argument("--skill", action="append", default=None, help="required skill; repeat to require several")
+    parser.add_argument("--has-salary", action="store_true", help="only postings with a salary")
+    parser.add_argument("--workplace-type", default=None, help="e.g. Remote, Hybrid, On-site")
+    parser.add_argument("--since", default=None, help="listed on or after this date (YYYY-MM-DD)")
+    parser.add_argument("--until", default=None, help="listed before this date (YYYY-MM-DD)")
+    parser.add_argument("--limit", type=int, default=None)
+    parser.add_argument("--skill-report", action="store_true",
+                        help="print the most demanded skills and skill pairs among the matches")
+    parser.add_argument("--export", default=None, help="write the matches as job_data.json/.xlsx to this directory")
+    args = parser.parse_args()
+
+    store = ResultsStore(args.db)
+    start = time.perf_counter()
+    records = store.query(company=args.company, skills=args.skill, has_salary=True if args.has_salary else None,
+                          workplace_type=args.workplace_type, listed_after=args.since, listed_before=args.until,
+                          limit=args.limit)
+    print(f"{len(records)} of {store.count()} archived jobs match ({time.perf_counter() - start:.3f}s)")
+    if args.skill_report:
+        from skill_vectors import SkillMatrix
+        skills = SkillMatrix.from_records(records)
+        print("Top skills: " + ", ".join(f"{skill} ({count})" for skill, count in skills.top_skills(15)))
+        print("Top pairs:  " + ", ".join(f"{a} + {b} ({count})" for a, b, count in skills.top_pairs(10)))
+    if args.export:
+        # Imported here so querying does not pull in linkedin_api/openai through job_search
+        from job_search import export_results
+        output_dir = Path(args.export)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        export_results([{key: val for key, val in record.items() if key != "Job ID"} for record in records], output_dir)
+    else:
+        for record in records:
+            print(f"{record.get('Listed Date')}  {record.get('Company')}  {record.get('Job Title')}  {record.get('Salary')}")
+    store.close()
+
+if __name__ == "__main__":
+    main()
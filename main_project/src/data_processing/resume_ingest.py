@@ -0,0 +1,88 @@
+import hashlib
+import json
+from pathlib import Path
+
+from data_extraction import (PREFERRED_HEADERS, QUALIFICATIONS_HEADERS, RESPONSIBILITIES_HEADERS,
+                             TECHNICAL_SKILLS_KEYWORDS, extract_sections, extract_skills)
+
+'''
+    Parses resumes once and caches the result by the file's content hash.
+    A cached resume holds its text, sections and skills (from extract_skills over the whole text);
+    its embedding is stored in the content-addressed EmbeddingCache. Unchanged files load from the
+    cache without touching pdfplumber; editing a resume, or the skill/header tables, re-parses it.
+    Supported inputs: .pdf (pdfplumber), .json (the resume.json format) and plain text.
+'''
+
+# Changing the keyword or header tables changes what a parse produces, so it is part of the cache key
+EXTRACTION_FINGERPRINT = hashlib.sha256(
+    json.dumps([TECHNICAL_SKILLS_KEYWORDS, RESPONSIBILITIES_HEADERS, QUALIFICATIONS_HEADERS, PREFERRED_HEADERS]).encode("utf-8")
+).hexdigest()[:12]
+
+def resume_text_from_json(resume_data):
+    """Format a resume.json document as text"""
+    return f"""
+        Experience: {resume_data.get('experience', '')}
+        Education: {resume_data.get('education', '')}
+        Skills: {resume_data.get('skills', '')}
+        """
+
+def read_resume_text(path):
+    """Extract the text of a resume file"""
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix == ".pdf":
+        import pdfplumber as plum
+        pages = []
+        with plum.open(path) as pdf:
+            for page_number, page in enumerate(pdf.pages, start=1):
+                text = page.extract_text()
+                if text:
+                    pages.append(text)
+                else:
+                    print(f"--- Page {page_number} of {path.name} has no readable text ---")
+        return "\n".join(pages)
+    if suffix == ".json":
+        return resume_text_from_json(json.loads(path.read_text(encoding="utf-8")))
+    return path.read_text(encoding="utf-8")
+
+class ResumeStore:
+    """Loads resumes through an on-disk cache keyed by file content hash"""
+    def __init__(self, cache_dir="cache/resumes"):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, path):
+        """Return {"name", "path", "hash", "text", "sections", "skills"} for a resume file"""
+        path = Path(path)
+        content_hash = hashlib.sha256(path.read_bytes()).hexdigest()
+        cache_path = self.cache_dir / f"{content_hash}-{EXTRACTION_FINGERPRINT}.json"
+        if cache_path.exists():
+            self.hits += 1
+            resume = json.loads(cache_path.read_text(encoding="utf-8"))
+        else:
+            self.misses += 1
+            text = read_resume_text(path)
+            resume = {
+                "hash": content_hash,
+                "text": text,
+                "sections": extract_sections(text),
+                # Resumes rarely use job-posting headers, so skills are taken from the whole text
+                "skills": sorted(extract_skills({"resume": text.split("\n")})),
+            }
+            cache_path.write_text(json.dumps(resume, ensure_ascii=False), encoding="utf-8")
+        # Name and path are not cached: the same content may live under several file names
+        resume["name"] = path.stem
+        resume["path"] = str(path)
+        return resume
+
+    def load_many(self, paths):
+        """Load several resumes; a directory expands to the .pdf, .json and .txt files inside it"""
+        files = []
+        for path in map(Path, paths):
+            if path.is_dir():
+                files.extend(sorted(p for p in path.iterdir() if p.suffix.lower() in (".pdf", ".json", ".txt")))
+            else:
+                files.append(path)
+        return [self.load(path) for path in files]
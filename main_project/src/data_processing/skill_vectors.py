@@ -0,0 +1,163 @@
+import numpy as np
+
+from data_extraction import TECHNICAL_SKILLS_KEYWORDS
+
+'''
+    Skills of many postings as one NumPy bool matrix (postings x skills), with columns indexed by
+    TECHNICAL_SKILLS_KEYWORDS. Cross-posting questions (resume overlap, skill filters, co-occurrence,
+    weekly demand) become vectorized array operations instead of loops over lists of strings.
+    pack()/unpack() store each posting as a fixed-width bitmask (one bit per skill).
+'''
+
+# Keyword order without repeats; a skill's column never changes unless the keyword list does
+SKILL_VOCABULARY = list(dict.fromkeys(TECHNICAL_SKILLS_KEYWORDS))
+
+class SkillMatrix:
+    """
+    matrix[i, j] is True when posting i lists skill vocabulary[j].
+    dates (datetime64[D], NaT when unknown) and job_ids are optional per-posting arrays.
+    """
+    def __init__(self, matrix, vocabulary=SKILL_VOCABULARY, dates=None, job_ids=None):
+        self.matrix = np.asarray(matrix, dtype=bool)
+        self.vocabulary = list(vocabulary)
+        self.index = {skill.lower(): i for i, skill in enumerate(self.vocabulary)}
+        self.dates = dates
+        self.job_ids = job_ids
+        self._dense = None
+
+    @classmethod
+    def from_skill_lists(cls, skill_lists, vocabulary=SKILL_VOCABULARY, dates=None, job_ids=None):
+        """Encode lists of skill names (e.g. extract_skills output); names outside the vocabulary are ignored"""
+        index = {skill.lower(): i for i, skill in enumerate(vocabulary)}
+        rows, cols = [], []
+        for row, skills in enumerate(skill_lists):
+            for skill in skills or []:
+                col = index.get(skill.lower())
+                if col is not None:
+                    rows.append(row)
+                    cols.append(col)
+        matrix = np.zeros((len(skill_lists), len(vocabulary)), dtype=bool)
+        matrix[rows, cols] = True
+        return cls(matrix, vocabulary, dates, job_ids)
+
+    @classmethod
+    def from_records(cls, records, vocabulary=SKILL_VOCABULARY):
+        """Encode output records (build_job_record / ResultsStore.query), keeping their Listed Date and Job ID"""
+        records = list(records)
+        listed = [record.get("Listed Date") or "N/A" for record in records]
+        dates = np.array([value[:10] if value != "N/A" else "NaT" for value in listed], dtype="datetime64[D]")
+        job_ids = np.array([str(record.get("Job ID", "")) for record in records])
+        return cls.from_skill_lists([record.get("Skills") for record in records], vocabulary, dates, job_ids)
+
+    def __len__(self):
+        return len(self.matrix)
+
+    def dense(self):
+        """The matrix as float32 (built once), so counting queries run as BLAS matrix products"""
+        if self._dense is None:
+            self._dense = self.matrix.astype(np.float32)
+        return self._dense
+
+    def encode(self, skills):
+        """Bool vector over the vocabulary for a list of skill names"""
+        vector = np.zeros(len(self.vocabulary), dtype=bool)
+        vector[[self.index[skill.lower()] for skill in skills if skill.lower() in self.index]] = True
+        return vector
+
+    def skills_of(self, row):
+        return [self.vocabulary[j] for j in np.flatnonzero(self.matrix[row])]
+
+    # ---- compact storage ----
+
+    def pack(self):
+        """Fixed-width bitmasks, one row of ceil(skills / 8) bytes per posting"""
+        return np.packbits(self.matrix, axis=1)
+
+    @classmethod
+    def unpack(cls, packed, vocabulary=SKILL_VOCABULARY, dates=None, job_ids=None):
+        return cls(np.unpackbits(packed, axis=1, count=len(vocabulary)).astype(bool), vocabulary, dates, job_ids)
+
+    # ---- queries ----
+
+    def skill_counts(self):
+        """Number of postings listing each skill"""
+        return self.matrix.sum(axis=0)
+
+    def top_skills(self, n=20):
+        """The n most listed skills as (skill, postings), skipping skills no posting lists"""
+        counts = self.skill_counts()
+        order = np.argsort(-counts, kind="stable")[:n]
+        return [(self.vocabulary[j], int(counts[j])) for j in order if counts[j]]
+
+    def overlap(self, resume_skills):
+        """Number of each posting's skills found in resume_skills"""
+        # Only the resume's columns matter, so sum those instead of multiplying the whole matrix
+        return self.matrix[:, self.encode(resume_skills)].sum(axis=1)
+
+    def overlap_ratio(self, resume_skills):
+        """Share (0-1) of each posting's skills found in resume_skills; postings without skills get 0"""
+        listed = self.matrix.sum(axis=1)
+        return np.divide(self.overlap(resume_skills), listed, out=np.zeros(len(self.matrix)), where=listed > 0)
+
+    def filter(self, all_of=None, any_of=None, none_of=None, resume_skills=None, min_overlap=None):
+        """Bool mask of postings listing every skill in all_of, one of any_of, none of none_of,
+        and at least min_overlap of resume_skills. Skills outside the vocabulary are never listed,
+        so one in all_of matches no posting"""
+        mask = np.ones(len(self.matrix), dtype=bool)
+        if all_of:
+            if any(skill.lower() not in self.index for skill in all_of):
+                return np.zeros(len(self.matrix), dtype=bool)
+            mask &= self.matrix[:, self.encode(all_of)].all(axis=1)
+        if any_of:
+            mask &= self.matrix[:, self.encode(any_of)].any(axis=1)
+        if none_of:
+            mask &= ~self.matrix[:, self.encode(none_of)].any(axis=1)
+        if resume_skills is not None and min_overlap is not None:
+            mask &= self.overlap(resume_skills) >= min_overlap
+        return mask
+
+    def subset(self, mask):
+        """Postings selected by a bool mask or index array"""
+        return SkillMatrix(self.matrix[mask], self.vocabulary,
+                           self.dates[mask] if self.dates is not None else None,
+                           self.job_ids[mask] if self.job_ids is not None else None)
+
+    def cooccurrence(self):
+        """(skills x skills) matrix of how many postings list both; the diagonal holds skill_counts()"""
+        # float32 counts stay exact up to 2**24 postings
+        dense = self.dense()
+        return (dense.T @ dense).astype(np.int64)
+
+    def top_pairs(self, n=20):
+        """The n most frequent skill pairs as (skill_a, skill_b, postings)"""
+        counts = self.cooccurrence()
+        upper = np.triu_indices(len(self.vocabulary), k=1)
+        pair_counts = counts[upper]
+        order = np.argsort(-pair_counts, kind="stable")[:n]
+        return [(self.vocabulary[upper[0][k]], self.vocabulary[upper[1][k]], int(pair_counts[k]))
+                for k in order if pair_counts[k]]
+
+    def weekly_counts(self):
+        """
+        (week_starts, counts): Monday of each week with postings, and a (weeks x skills) matrix of
+        postings listing each skill that week. Postings without a date are left out.
+        """
+        if self.dates is None:
+            raise ValueError("weekly_counts needs posting dates (use from_records or pass dates)")
+        known = ~np.isnat(self.dates)
+        # 1970-01-05 (day 4) was a Monday
+        weeks, week_of_posting = np.unique((self.dates[known].astype(np.int64) - 4) // 7, return_inverse=True)
+        week_starts = (weeks * 7 + 4).astype("datetime64[D]")
+        if not len(weeks):
+            return week_starts, np.zeros((0, len(self.vocabulary)), dtype=np.int64)
+        # Dated rows ordered by week, then each week's contiguous block summed; memory stays at postings x skills
+        order = np.argsort(week_of_posting, kind="stable")
+        starts = np.searchsorted(week_of_posting[order], np.arange(len(weeks)))
+        rows = self.matrix[np.flatnonzero(known)[order]].view(np.uint8)
+        counts = np.add.reduceat(rows, starts, axis=0, dtype=np.int32).astype(np.int64)
+        return week_starts, counts
+
+    def trend(self, skill):
+        """(week_starts, postings per week) for one skill"""
+        week_starts, counts = self.weekly_counts()
+        return week_starts, counts[:, self.index[skill.lower()]]
@@ -0,0 +1,214 @@
+import json
+from pathlib import Path
+
+import numpy as np
+
+class IVFIndex:
+    """
+    Persistent approximate nearest-neighbour index over normalized job embeddings (cosine similarity).
+    An inverted-file (IVF) index: vectors are grouped by their nearest k-means centroid, and a query
+    only scans the rows of its nprobe closest groups. Below train_threshold vectors (or before the
+    first training) every query is an exact scan.
+    Rows are kept in one growing float32 matrix; deleted rows are tombstoned and dropped on compact().
+    """
+    def __init__(self, dim, nprobe=8, train_threshold=2048, seed=0):
+        self.dim = dim
+        self.nprobe = nprobe
+        self.train_threshold = train_threshold
+        self.seed = seed
+        self.size = 0
+        self.vectors = np.zeros((0, dim), dtype=np.float32)
+        self.listed_at = np.zeros(0, dtype=np.float64)
+        self.alive = np.zeros(0, dtype=bool)
+        self.ids = []
+        self.meta = []
+        self.row_of = {}
+        self.centroids = None
+        self.assignments = np.zeros(0, dtype=np.int32)
+        self.trained_size = 0
+        self._lists = None
+
+    # ---- building ----
+
+    def _grow(self, extra):
+        needed = self.size + extra
+        if needed <= len(self.vectors):
+            return
+        capacity = max(needed, 2 * len(self.vectors), 1024)
+        for name, dtype in (("vectors", np.float32), ("listed_at", np.float64), ("alive", bool), ("assignments", np.int32)):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=dtype)
+            new[:self.size] = old[:self.size]
+            setattr(self, name, new)
+
+    def add(self, ids, vectors, listed_at=None, meta=None):
+        """Insert or replace vectors for job IDs; listed_at (ms timestamps) enables expire(), meta is any JSON-able dict"""
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dim)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+        ids = [str(job_id) for job_id in ids]
+        last = {job_id: i for i, job_id in enumerate(ids)}
+        if len(last) < len(ids):
+            # An ID repeated within one call keeps only its last vector, like a later add() would
+            keep = sorted(last.values())
+            ids = [ids[i] for i in keep]
+            vectors = vectors[keep]
+            if np.ndim(listed_at) == 1:
+                listed_at = np.asarray(listed_at, dtype=np.float64)[keep]
+            if meta is not None:
+                meta = [meta[i] for i in keep]
+        self.remove(job_id for job_id in ids if job_id in self.row_of)
+
+        self._grow(len(ids))
+        rows = slice(self.size, self.size + len(ids))
+        self.vectors[rows] = vectors
+        self.listed_at[rows] = listed_at if listed_at is not None else 0
+        self.alive[rows] = True
+        for offset, job_id in enumerate(ids):
+            self.row_of[job_id] = self.size + offset
+        self.ids.extend(ids)
+        self.meta.extend(meta if meta is not None else [{}] * len(ids))
+        if self.centroids is not None:
+            self.assignments[rows] = self._nearest_centroids(vectors)
+        self.size += len(ids)
+        self._lists = None
+
+        alive = self.count()
+        if alive >= self.train_threshold and (self.centroids is None or alive > 4 * self.trained_size):
+            self.train()
+
+    def remove(self, ids):
+        """Delete job IDs (unknown IDs are ignored)"""
+        for job_id in ids:
+            row = self.row_of.pop(str(job_id), None)
+            if row is not None:
+                self.alive[row] = False
+                self._lists = None
+
+    def expire(self, before_ms):
+        """Delete every posting listed before the given timestamp (ms since epoch); returns how many"""
+        rows = np.flatnonzero(self.alive[:self.size] & (self.listed_at[:self.size] < before_ms))
+        self.remove(self.ids[row] for row in rows)
+        return len(rows)
+
+    def count(self):
+        return len(self.row_of)
+
+    def compact(self):
+        """Drop tombstoned rows to reclaim space"""
+        keep = np.flatnonzero(self.alive[:self.size])
+        self.vectors = self.vectors[keep].copy()
+        self.listed_at = self.listed_at[keep].copy()
+        self.alive = np.ones(len(keep), dtype=bool)
+        self.assignments = self.assignments[keep].copy()
+        self.ids = [self.ids[row] for row in keep]
+        self.meta = [self.meta[row] for row in keep]
+        self.row_of = {job_id: row for row, job_id in enumerate(self.ids)}
+        self.size = len(keep)
+        self._lists = None
+
+    def train(self, iterations=10, sample_size=50000):
+        """Cluster the live vectors with spherical k-means into about 4*sqrt(n) lists"""
+        live = np.flatnonzero(self.alive[:self.size])
+        nlist = max(1, int(4 * np.sqrt(len(live))))
+        rng = np.random.default_rng(self.seed)
+        sample = self.vectors[rng.choice(live, size=min(len(live), sample_size), replace=False)]
+        centroids = sample[rng.choice(len(sample), size=min(nlist, len(sample)), replace=False)].copy()
+        for _ in range(iterations):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            # Empty clusters keep their previous centroid
+            centroids = np.where(norms > 0, sums / np.maximum(norms, 1e-12), centroids).astype(np.float32)
+        self.centroids = centroids
+        self.assignments[:self.size] = self._nearest_centroids(self.vectors[:self.size])
+        self.trained_size = len(live)
+        self._lists = None
+
+    def _nearest_centroids(self, vectors, chunk=16384):
+        out = np.empty(len(vectors), dtype=np.int32)
+        for start in range(0, len(vectors), chunk):
+            out[start:start + chunk] = np.argmax(vectors[start:start + chunk] @ self.centroids.T, axis=1)
+        return out
+
+    def _inverted_lists(self):
+        """Live rows grouped by centroid: (rows sorted by list, start offset of each list)"""
+        if self._lists is None:
+            live = np.flatnonzero(self.alive[:self.size])
+            order = live[np.argsort(self.assignments[live], kind="stable")]
+            offsets = np.searchsorted(self.assignments[order], np.arange(len(self.centroids) + 1))
+            self._lists = (order, offsets)
+        return self._lists
+
+    # ---- querying ----
+
+    def search(self, query, k=10, nprobe=None, exact=False):
+        """Return [(job_id, score_percent, meta), ...] for the k most similar postings, best first"""
+        query = np.asarray(query, dtype=np.float32).reshape(self.dim)
+        norm = np.linalg.norm(query)
+        if norm == 0 or not self.row_of:
+            return []
+        query = query / norm
+
+        if exact or self.centroids is None:
+            # Score the matrix in place and mask tombstoned rows; gathering the live rows would copy every vector per query
+            scores = self.vectors[:self.size] @ query
+            scores[~self.alive[:self.size]] = -np.inf
+            rows = None
+            candidates = self.count()
+        else:
+            order, offsets = self._inverted_lists()
+            nprobe = min(nprobe or self.nprobe, len(self.centroids))
+            probe = np.argpartition(-(self.centroids @ query), nprobe - 1)[:nprobe]
+            rows = np.concatenate([order[offsets[c]:offsets[c + 1]] for c in probe])
+            scores = self.vectors[rows] @ query
+            candidates = len(rows)
+
+        k = min(k, candidates)
+        if k == 0:
+            return []
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best], kind="stable")]
+        best_rows = best if rows is None else rows[best]
+        return [(self.ids[row], float(score) * 100, self.meta[row]) for row, score in zip(best_rows, scores[best])]
+
+    # ---- persistence ----
+
+    def save(self, path):
+        """Save to a .npz file (compacted first so deleted rows are not written)"""
+        self.compact()
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez(
+            path,
+            vectors=self.vectors[:self.size],
+            listed_at=self.listed_at[:self.size],
+            assignments=self.assignments[:self.size],
+            centroids=self.centroids if self.centroids is not None else np.zeros((0, self.dim), dtype=np.float32),
+            ids=np.array(self.ids, dtype=str),
+            meta=np.array([json.dumps(m, ensure_ascii=False) for m in self.meta], dtype=str),
+            config=np.array([self.dim, self.nprobe, self.train_threshold, self.seed, self.trained_size]),
+        )
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            dim, nprobe, train_threshold, seed, trained_size = (int(v) for v in data["config"])
+            index = cls(dim, nprobe=nprobe, train_threshold=train_threshold, seed=seed)
+            index.vectors = data["vectors"]
+            index.size = len(index.vectors)
+            index.listed_at = data["listed_at"]
+            index.assignments = data["assignments"]
+            index.alive = np.ones(index.size, dtype=bool)
+            index.centroids = data["centroids"] if len(data["centroids"]) else None
+            index.trained_size = trained_size
+            index.ids = data["ids"].tolist()
+            index.meta = [json.loads(m) for m in data["meta"].tolist()]
+        index.row_of = {job_id: row for row, job_id in enumerate(index.ids)}
+        return index
+
+    @classmethod
+    def open(cls, path, dim):
+        """Load the index at path, or create an empty one if it does not exist yet"""
+        return cls.load(path) if Path(path).exists() else cls(dim)
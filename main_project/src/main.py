@@ -1,12 +1,17 @@
 import pandas as pd
 from dotenv import load_dotenv
-import pdfplumber as plum
 import os 
 import sys
-from transformers import BigBirdModel, BigBirdTokenizer
 from linkedin_api import Linkedin
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent / "data_processing"))
+
+from encoder_service import BIGBIRD_MODEL, EncoderService
+from embedding_cache import EmbeddingCache
+from ranking import rank_jobs
+from resume_ingest import ResumeStore
+
 
 pdf_path = "../your_resume/resume.pdf"
 abs_path = os.path.abspath(pdf_path)
@@ -20,17 +25,8 @@ if not os.path.exists(abs_path):
 print("We found your resume")
 
 
-resume=[] #cuurently has bad formatting(hard to read but maybe it doesnt effect the quality of llm response). 
-
-with plum.open(pdf_path) as pdf:
-    for page_number, page in enumerate(pdf.pages, start=1): 
-        text = page.extract_text()
-        if text:
-          #  print(f"--- Page {page_number} ---")
-          #  print("\n" + "-" * 50 + "\n")
-            resume.append(text)
-        else:
-            print(f"--- Page {page_number} has no readable text ---")
+# Parsed once and cached by the PDF's content hash; later runs skip pdfplumber unless the file changed
+resume = ResumeStore().load(abs_path)
 
 env_path = Path(__file__).resolve().parents[2] / ".env"
 
@@ -71,15 +67,24 @@ for job in job_results:
 
 print("Obtained job postings and descriptions, calling LLM model to generate responses")
 
-llm_model = BigBirdModel.from_pretrained('google/bigbird-roberta-base')
-llm_tokenizer = BigBirdTokenizer.from_pretrained('google/bigbird-roberta-base')
-
-
-prompt = "hi how are you."
-llm_input = llm_tokenizer(text, return_tensors='pt', max_length=4096, truncation=True, padding='max_length')
-llm_output = llm_model(**llm_input)
-
-last_hidden_states = llm_output.last_hidden_state
+# Encode the resume and every description in one batch with a model loaded once.
+# Long texts keep their start and end (head_tail) and batches are padded only to their longest text.
+# The encoder imports transformers on first use, since that takes seconds.
+resume_text = resume["text"]
+job_descriptions = [job["Description"] for job in job_results]
+
+# Embeddings are cached by content, so an unchanged resume is not re-encoded (the model only loads on a miss)
+encoder = EncoderService(BIGBIRD_MODEL, truncation="head_tail", quantize=os.getenv("ENCODER_QUANTIZE") == "1")
+embedding_cache = EmbeddingCache(encoder.cache_dir() / "embeddings")
+embeddings = embedding_cache.get_or_embed([resume_text] + job_descriptions, encoder.cache_key, encoder.embed)
+encoder.close()
+resume_embedding, job_embeddings = embeddings[0], embeddings[1:]
+
+if resume_embedding is None:
+    print("Could not encode the resume")
+    sys.exit(1)
 
+ranked, scores = rank_jobs(resume_embedding, job_embeddings)
 
-print(last_hidden_states)
\ No newline at end of file
+for i, score in zip(ranked, scores):
+    print(f"{score:6.2f}%  {job_results[i].get('title', 'N/A')}")